@@ -0,0 +1,83 @@
+"""
+Animation Benchmarks
+--------------------
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import AbstractMovieWriter
+from pltviz import utils
+from pltviz.animate import animate_pie, animate_semipie
+
+# Numbers of frames.
+SIZES = [10, 100, 1000]
+
+num_groups = 20
+
+
+class NullStreamingWriter(AbstractMovieWriter):
+    # Grabs each frame's pixels as ffmpeg's pipe would and discards them.
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self.num_frames = 0
+
+    def grab_frame(self, **savefig_kwargs):
+        self.fig.canvas.draw()
+        self.fig.canvas.buffer_rgba()
+        self.num_frames += 1
+
+    def finish(self):
+        pass
+
+
+def gen_frame_counts(size):
+    return np.random.default_rng(42).integers(1, 100, size=(size, num_groups))
+
+
+def time_frame_thetas(size):
+    frame_counts = gen_frame_counts(size)
+
+    def thetas():
+        return utils.section_thetas(frame_counts, start_angle=180, end_angle=0)
+
+    return thetas
+
+
+def time_frame_thetas_loop(size):
+    frame_counts = gen_frame_counts(size)
+
+    def thetas():
+        return [
+            utils.section_thetas(c, start_angle=180, end_angle=0) for c in frame_counts
+        ]
+
+    return thetas
+
+
+def time_stream_semipie(size):
+    animation = animate_semipie(
+        gen_frame_counts(size), frames_per_transition=1, axis=plt.subplots()[1]
+    )
+
+    def stream():
+        animation.save("", writer=NullStreamingWriter(fps=20))
+
+    return stream
+
+
+def time_stream_pie(size):
+    animation = animate_pie(
+        gen_frame_counts(size), frames_per_transition=1, axis=plt.subplots()[1]
+    )
+
+    def stream():
+        animation.save("", writer=NullStreamingWriter(fps=20))
+
+    return stream
+
+
+time_stream_semipie.sizes = time_stream_pie.sizes = [10, 100]
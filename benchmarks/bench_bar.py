@@ -0,0 +1,132 @@
+"""
+Bar Plot Benchmarks
+-------------------
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pltviz
+from pltviz.bar import default_max_groups
+from inputs import gen_counts
+
+SIZES = [10, 100, 1000]
+
+
+def time_bar_stacked(size):
+    counts = gen_counts(size)
+    colors = ["#4c72b0"] * size
+
+    def stacked_bar():
+        fig, ax = plt.subplots()
+        pltviz.bar(counts=counts, colors=colors, stacked=True, max_groups=None, axis=ax)
+        plt.close(fig)
+
+    return stacked_bar
+
+
+def time_bar_stacked_horizontal(size):
+    counts = gen_counts(size)
+    colors = ["#4c72b0"] * size
+
+    def stacked_bar():
+        fig, ax = plt.subplots()
+        pltviz.bar(
+            counts=counts,
+            colors=colors,
+            horizontal=True,
+            stacked=True,
+            max_groups=None,
+            axis=ax,
+        )
+        plt.close(fig)
+
+    return stacked_bar
+
+
+def time_bar_categorical(size, backend="seaborn"):
+    counts = gen_counts(size)
+    colors = ["#4c72b0"] * size
+
+    def categorical_bar():
+        fig, ax = plt.subplots()
+        pltviz.bar(
+            counts=counts, colors=colors, max_groups=None, backend=backend, axis=ax
+        )
+        plt.close(fig)
+
+    return categorical_bar
+
+
+def time_bar_categorical_lean(size):
+    return time_bar_categorical(size, backend="lean")
+
+
+def time_bar_factioned(size, backend="seaborn"):
+    counts = gen_counts(size)
+    factioned_counts = [counts[: size // 2], counts[size // 2 :]]
+    colors = ["#4c72b0"] * size
+
+    def factioned_bar():
+        pltviz.bar(
+            counts=factioned_counts,
+            faction_labels=["Opposition", "Government"],
+            colors=colors,
+            stacked=True,
+            backend=backend,
+        )
+        plt.close("all")
+
+    return factioned_bar
+
+
+def time_bar_factioned_lean(size):
+    return time_bar_factioned(size, backend="lean")
+
+
+def time_bar_aggregated(size):
+    counts = gen_counts(size)
+    labels = [f"group_{i}" for i in range(size)]
+
+    def aggregated_bar():
+        fig, ax = plt.subplots()
+        pltviz.bar(
+            counts=counts,
+            labels=labels,
+            label_bars=True,
+            max_groups=default_max_groups,
+            backend="lean",
+            axis=ax,
+        )
+        fig.canvas.draw()
+        plt.close(fig)
+
+    return aggregated_bar
+
+
+time_bar_aggregated.sizes = [10, 1000, 10000, 100000]
+
+
+def time_bar_unaggregated(size):
+    counts = gen_counts(size)
+    labels = [f"group_{i}" for i in range(size)]
+
+    def unaggregated_bar():
+        fig, ax = plt.subplots()
+        pltviz.bar(
+            counts=counts,
+            labels=labels,
+            label_bars=True,
+            max_groups=None,
+            backend="lean",
+            axis=ax,
+        )
+        fig.canvas.draw()
+        plt.close(fig)
+
+    return unaggregated_bar
+
+
+time_bar_unaggregated.sizes = [10, 1000, 10000]
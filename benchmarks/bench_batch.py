@@ -0,0 +1,64 @@
+"""
+Batch Rendering Benchmarks
+--------------------------
+"""
+
+import os
+import tempfile
+
+import numpy as np
+from pltviz.batch import render_batch
+
+# Numbers of worker processes that the charts are rendered across.
+SIZES = [1, 2, 4]
+
+num_charts = 64
+
+
+def gen_specs(directory):
+    rng = np.random.default_rng(42)
+    kinds = ["pie", "semipie", "bar"]
+
+    return [
+        {
+            "kind": kinds[i % len(kinds)],
+            "kwargs": {"counts": rng.integers(1, 100, size=8).tolist()},
+            "path": os.path.join(directory, f"chart_{i}.png"),
+        }
+        for i in range(num_charts)
+    ]
+
+
+def time_render_batch(size):
+    directory = tempfile.mkdtemp()
+    specs = gen_specs(directory)
+
+    def render():
+        for result in render_batch(specs, max_workers=size):
+            assert result["error"] is None, result["error"]
+
+    return render
+
+
+def time_render_serial_pyplot(size):
+    # The loop that render_batch replaces, with a pyplot figure per chart.
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    import pltviz
+
+    directory = tempfile.mkdtemp()
+    specs = gen_specs(directory)
+
+    def render():
+        for spec in specs:
+            getattr(pltviz, spec["kind"])(**spec["kwargs"])
+            plt.savefig(spec["path"])
+            plt.close("all")
+
+    return render
+
+
+time_render_serial_pyplot.sizes = [1]
@@ -0,0 +1,210 @@
+"""
+Chart Benchmarks
+----------------
+
+Times the build, draw and savefig phases of every pltviz entry point (see run.time_chart).
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pltviz
+from pltviz import utils
+from pltviz.legend import gen_elements
+from inputs import gen_counts, gen_lines_df
+
+# Numbers of groups, or of lines for comp_line and shares for gini.
+SIZES = [10, 100, 1000, 10000, 100000]
+
+faction_labels = ["Opposition", "Government"]
+
+years = [2000, 2001, 2002, 2003, 2004]
+
+
+def gen_labels(size):
+    return [f"group_{i}" for i in range(size)]
+
+
+def gen_factioned_counts(size):
+    counts = gen_counts(size)
+
+    return [counts[: size // 2], counts[size // 2 :]]
+
+
+def bar_chart(size, horizontal=False, stacked=False, factioned=False):
+    counts = gen_factioned_counts(size) if factioned else gen_counts(size)
+    labels = gen_labels(size)
+
+    def plot(ax):
+        pltviz.bar(
+            counts=counts,
+            labels=labels,
+            faction_labels=faction_labels if factioned else None,
+            horizontal=horizontal,
+            stacked=stacked,
+            axis=ax,
+        )
+
+    return plot
+
+
+def chart_bar(size):
+    return bar_chart(size)
+
+
+def chart_bar_horizontal(size):
+    return bar_chart(size, horizontal=True)
+
+
+def chart_bar_stacked(size):
+    return bar_chart(size, stacked=True)
+
+
+def chart_bar_horizontal_stacked(size):
+    return bar_chart(size, horizontal=True, stacked=True)
+
+
+def chart_bar_factioned(size):
+    return bar_chart(size, factioned=True)
+
+
+def chart_bar_factioned_horizontal(size):
+    return bar_chart(size, horizontal=True, factioned=True)
+
+
+def chart_bar_factioned_stacked(size):
+    return bar_chart(size, stacked=True, factioned=True)
+
+
+def chart_bar_factioned_horizontal_stacked(size):
+    return bar_chart(size, horizontal=True, stacked=True, factioned=True)
+
+
+def chart_pie(size):
+    counts = gen_counts(size)
+
+    def plot(ax):
+        pltviz.pie(counts=counts, axis=ax)
+
+    return plot
+
+
+def pie_factioned_chart(size, outer_ring_density):
+    counts = gen_factioned_counts(size)
+
+    def plot(ax):
+        pltviz.pie(
+            counts=counts,
+            faction_labels=faction_labels,
+            outer_ring_density=outer_ring_density,
+            axis=ax,
+        )
+
+    return plot
+
+
+def chart_pie_factioned_density_25(size):
+    return pie_factioned_chart(size, outer_ring_density=25)
+
+
+def chart_pie_factioned_density_100(size):
+    return pie_factioned_chart(size, outer_ring_density=100)
+
+
+def chart_pie_factioned_density_1000(size):
+    return pie_factioned_chart(size, outer_ring_density=1000)
+
+
+def chart_semipie(size):
+    counts = gen_counts(size)
+
+    def plot(ax):
+        pltviz.semipie(counts=counts, axis=ax)
+
+    return plot
+
+
+def comp_line_chart(size, **kwargs):
+    df, dependent_cols, baselines = gen_lines_df(size)
+
+    def plot(ax):
+        pltviz.comp_line(
+            df=df,
+            dependent_cols=dependent_cols,
+            indep_stats=baselines,
+            axis=ax,
+            **kwargs,
+        )
+
+    return plot
+
+
+def chart_comp_line(size):
+    return comp_line_chart(size)
+
+
+def chart_comp_line_lean(size):
+    return comp_line_chart(size, backend="lean")
+
+
+def chart_comp_line_line_collection(size):
+    return comp_line_chart(size, line_collection=True)
+
+
+def chart_comp_line_decimated(size):
+    return comp_line_chart(size, line_collection=True, decimate=4)
+
+
+def chart_comp_line_stacked(size):
+    return comp_line_chart(size, stacked=True)
+
+
+def chart_comp_line_stacked_percent(size):
+    return comp_line_chart(size, stacked=True, percent=True)
+
+
+def chart_comp_line_group_col(size):
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame()
+    df["locations"] = np.repeat([f"location_{i}" for i in range(size)], len(years))
+    df["years"] = years * size
+    df["values"] = rng.integers(0, 1000, size=len(df))
+
+    def plot(ax):
+        pltviz.comp_line(
+            df=df,
+            dependent_cols="values",
+            indep_stats="years",
+            group_col="locations",
+            line_collection=True,
+            axis=ax,
+        )
+
+    return plot
+
+
+def chart_gini(size):
+    shares = np.random.default_rng(42).random(size=size)
+    shares /= shares.sum()
+
+    def plot(ax):
+        pltviz.gini(shares=shares, axis=ax)
+
+    return plot
+
+
+def chart_legend(size):
+    counts = gen_counts(size)
+    labels = gen_labels(size)
+    colors = utils.default_colors(num_colors=size)
+
+    def plot(ax):
+        handles, legend_labels = gen_elements(
+            counts=counts, labels=labels, colors=colors
+        )
+        ax.legend(handles=handles, labels=legend_labels)
+
+    return plot
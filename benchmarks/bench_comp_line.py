@@ -0,0 +1,116 @@
+"""
+Comparative Line Plot Benchmarks
+--------------------------------
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pltviz
+from pltviz.comp_line import pivot_dependent_col
+from inputs import gen_lines_df
+
+SIZES = [10, 1000, 20000]
+
+years = [2000, 2001, 2002, 2003, 2004]
+
+
+def gen_split_df(size):
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame()
+    df["locations"] = np.repeat([f"location_{i}" for i in range(size)], len(years))
+    df["years"] = years * size
+    df["values"] = rng.integers(0, 1000, size=len(df))
+
+    return df.iloc[rng.permutation(len(df))].reset_index(drop=True)
+
+
+def time_pivot_dependent_col(size):
+    df = gen_split_df(size)
+
+    def pivot():
+        return pivot_dependent_col(
+            df=df, dependent_col="values", indep_stats="years", group_col="locations"
+        )
+
+    return pivot
+
+
+def time_comp_line_stacked(size):
+    baselines = list(range(200))
+    dependent_cols = [f"baseline_{b}" for b in baselines]
+    df = pd.DataFrame(
+        np.random.default_rng(42).integers(0, 1000, size=(size, len(baselines))),
+        columns=dependent_cols,
+    )
+    colors = ["#4c72b0"] * size
+
+    def stacked():
+        fig, ax = plt.subplots()
+        pltviz.comp_line(
+            df=df,
+            dependent_cols=dependent_cols,
+            indep_stats=baselines,
+            colors=colors,
+            stacked=True,
+            percent=True,
+            axis=ax,
+        )
+        plt.close(fig)
+
+    return stacked
+
+
+time_comp_line_stacked.sizes = [10, 100, 1000]
+
+
+def time_comp_line_seaborn_lines(size, backend="seaborn"):
+    df, dependent_cols, baselines = gen_lines_df(size)
+    colors = ["#4c72b0"] * size
+
+    def lines():
+        fig, ax = plt.subplots()
+        pltviz.comp_line(
+            df=df,
+            dependent_cols=dependent_cols,
+            indep_stats=baselines,
+            colors=colors,
+            backend=backend,
+            axis=ax,
+        )
+        plt.close(fig)
+
+    return lines
+
+
+def time_comp_line_lean_lines(size):
+    return time_comp_line_seaborn_lines(size, backend="lean")
+
+
+time_comp_line_seaborn_lines.sizes = time_comp_line_lean_lines.sizes = [10, 100, 1000]
+
+
+def time_comp_line_line_collection(size):
+    df, dependent_cols, baselines = gen_lines_df(size)
+    colors = ["#4c72b0"] * size
+
+    def lines():
+        fig, ax = plt.subplots()
+        pltviz.comp_line(
+            df=df,
+            dependent_cols=dependent_cols,
+            indep_stats=baselines,
+            colors=colors,
+            line_collection=True,
+            axis=ax,
+        )
+        plt.close(fig)
+
+    return lines
+
+
+time_comp_line_line_collection.sizes = [10, 100, 1000, 5000]
@@ -0,0 +1,60 @@
+"""
+Gini Benchmarks
+---------------
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+from pltviz.gini import gini, gini_coefficient
+
+SIZES = [10, 100000, 10000000]
+
+
+def gen_shares(size, distributions=None):
+    shape = size if distributions is None else (distributions, size)
+    shares = np.random.default_rng(42).random(size=shape)
+
+    return shares / shares.sum(axis=-1, keepdims=True)
+
+
+def time_gini_coefficient(size):
+    shares = gen_shares(size)
+
+    def coefficient():
+        return gini_coefficient(shares)
+
+    return coefficient
+
+
+def time_gini_coefficient_batch(size):
+    shares = gen_shares(size, distributions=1000)
+
+    def coefficients():
+        return gini_coefficient(shares)
+
+    return coefficients
+
+
+time_gini_coefficient_batch.sizes = [10, 1000]
+
+
+def time_gini_plot(size, backend="seaborn"):
+    shares = gen_shares(size)
+
+    def gini_plot():
+        fig, ax = plt.subplots()
+        gini(shares=shares, backend=backend, axis=ax)
+        plt.close(fig)
+
+    return gini_plot
+
+
+def time_gini_plot_lean(size):
+    return time_gini_plot(size, backend="lean")
+
+
+time_gini_plot.sizes = time_gini_plot_lean.sizes = [10, 100000]
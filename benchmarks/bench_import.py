@@ -0,0 +1,36 @@
+"""
+Import Benchmarks
+-----------------
+"""
+
+import os
+import subprocess
+import sys
+
+SIZES = [1]
+
+# Upper bound in seconds for a cold import of pltviz, which should only need numpy.
+import_time_bound = 0.5
+
+benchmark_directory = os.path.abspath(os.path.dirname(__file__))
+src_directory = os.path.join(os.path.dirname(benchmark_directory), "src")
+
+
+def time_import_pltviz(size):
+    code = (
+        "import time; start = time.perf_counter(); import pltviz; "
+        "print(time.perf_counter() - start)"
+    )
+    env = dict(os.environ, PYTHONPATH=src_directory)
+
+    def cold_import():
+        seconds = float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, env=env, check=True
+            ).stdout
+        )
+        assert (
+            seconds < import_time_bound
+        ), f"Importing pltviz took {seconds:.3f}s, more than {import_time_bound}s."
+
+    return cold_import
@@ -0,0 +1,89 @@
+"""
+Live Plot Benchmarks
+--------------------
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pltviz
+from pltviz.live import LiveBar, LivePie, LiveSemipie
+
+# Numbers of groups in the plots.
+SIZES = [10, 100]
+
+# Frames of new counts that are drawn per timing.
+num_frames = 30
+
+
+def gen_frames(size):
+    rng = np.random.default_rng(42)
+
+    return rng.integers(1, 100, size=(num_frames, size))
+
+
+def blit_frames(live, frames):
+    # Redraws only the updated artists over the background, as FuncAnimation does with blit=True.
+    fig = live.ax.figure
+    for artist in live.artists:
+        artist.set_animated(True)
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+
+    def blit():
+        for counts in frames:
+            fig.canvas.restore_region(background)
+            for artist in live.update(counts):
+                live.ax.draw_artist(artist)
+            fig.canvas.blit(fig.bbox)
+
+    return blit
+
+
+def redraw_frames(plot_function, frames):
+    fig, ax = plt.subplots()
+
+    def redraw():
+        for counts in frames:
+            ax.clear()
+            plot_function(counts=counts, axis=ax)
+            fig.canvas.draw()
+
+    return redraw
+
+
+def time_pie_redraw(size):
+    return redraw_frames(pltviz.pie, gen_frames(size))
+
+
+def time_live_pie_blit(size):
+    frames = gen_frames(size)
+
+    return blit_frames(LivePie(counts=frames[0], axis=plt.subplots()[1]), frames)
+
+
+def time_semipie_redraw(size):
+    return redraw_frames(pltviz.semipie, gen_frames(size))
+
+
+def time_live_semipie_blit(size):
+    frames = gen_frames(size)
+
+    return blit_frames(LiveSemipie(counts=frames[0], axis=plt.subplots()[1]), frames)
+
+
+def time_bar_redraw(size):
+    def lean_bar(counts, axis):
+        return pltviz.bar(counts=counts, label_bars=True, backend="lean", axis=axis)
+
+    return redraw_frames(lean_bar, gen_frames(size))
+
+
+def time_live_bar_blit(size):
+    frames = gen_frames(size)
+    live = LiveBar(counts=frames[0], label_bars=True, axis=plt.subplots()[1])
+
+    return blit_frames(live, frames)
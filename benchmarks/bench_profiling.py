@@ -0,0 +1,48 @@
+"""
+Profiling Benchmarks
+--------------------
+
+Times the overhead of the profiling hooks on calls of a function with checkpoints.
+"""
+
+from pltviz import profiling
+
+# Numbers of calls per timing.
+SIZES = [1000]
+
+num_checkpoints = 6
+
+
+def checkpointed(value):
+    for i in range(num_checkpoints):
+        profiling.checkpoint(f"phase_{i}")
+
+    return value
+
+
+profiled_checkpointed = profiling.profiled(checkpointed)
+
+
+def time_calls_unprofiled(size):
+    def calls():
+        for i in range(size):
+            checkpointed(i)
+
+    return calls
+
+
+def time_calls_profiling_disabled(size):
+    def calls():
+        for i in range(size):
+            profiled_checkpointed(i)
+
+    return calls
+
+
+def time_calls_profiling_enabled(size):
+    def calls():
+        with profiling.profile():
+            for i in range(size):
+                profiled_checkpointed(i)
+
+    return calls
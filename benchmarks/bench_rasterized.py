@@ -0,0 +1,121 @@
+"""
+Rasterized Output Benchmarks
+----------------------------
+
+Times writing charts with many artists to vector formats with and without rasterized artists.
+
+Running this module prints the file sizes:
+    python benchmarks/bench_rasterized.py
+"""
+
+import io
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pltviz
+from inputs import gen_counts, gen_lines_df
+
+# Vector formats that charts are saved in.
+SIZES = ["pdf", "svg"]
+
+dpi = 150
+
+
+def pie_chart(rasterized):
+    counts = gen_counts(200)
+    fig, ax = plt.subplots()
+    pltviz.pie(
+        counts=[counts[:100], counts[100:]],
+        faction_labels=["Opposition", "Government"],
+        outer_ring_density=1000,
+        rasterized=rasterized,
+        axis=ax,
+    )
+
+    return fig
+
+
+def bar_chart(rasterized):
+    fig, ax = plt.subplots()
+    pltviz.bar(
+        counts=gen_counts(5000),
+        max_groups=None,
+        rasterized=rasterized,
+        backend="lean",
+        axis=ax,
+    )
+
+    return fig
+
+
+def comp_line_chart(rasterized):
+    df, dependent_cols, baselines = gen_lines_df(1000, num_baselines=50)
+    fig, ax = plt.subplots()
+    pltviz.comp_line(
+        df=df,
+        dependent_cols=dependent_cols,
+        indep_stats=baselines,
+        backend="lean",
+        rasterized=rasterized,
+        axis=ax,
+    )
+
+    return fig
+
+
+charts = {"pie": pie_chart, "bar": bar_chart, "comp_line": comp_line_chart}
+
+
+def save_chart(fig, format):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format, dpi=dpi)
+
+    return buffer.getbuffer().nbytes
+
+
+def savefig_timer(chart, format, rasterized):
+    fig = charts[chart](rasterized)
+
+    def savefig():
+        save_chart(fig, format)
+
+    return savefig
+
+
+def time_savefig_pie_vector(size):
+    return savefig_timer("pie", size, rasterized=False)
+
+
+def time_savefig_pie_rasterized(size):
+    return savefig_timer("pie", size, rasterized=True)
+
+
+def time_savefig_bar_vector(size):
+    return savefig_timer("bar", size, rasterized=False)
+
+
+def time_savefig_bar_rasterized(size):
+    return savefig_timer("bar", size, rasterized=True)
+
+
+def time_savefig_comp_line_vector(size):
+    return savefig_timer("comp_line", size, rasterized=False)
+
+
+def time_savefig_comp_line_rasterized(size):
+    return savefig_timer("comp_line", size, rasterized=True)
+
+
+if __name__ == "__main__":
+    for chart, plot in charts.items():
+        for format in SIZES:
+            vector_bytes, rasterized_bytes = [
+                save_chart(plot(rasterized), format) for rasterized in [False, True]
+            ]
+            plt.close("all")
+            print(
+                f"{chart:<10} {format:<4} {vector_bytes / 1e3:>10.1f} kB vector {rasterized_bytes / 1e3:>10.1f} kB rasterized"
+            )
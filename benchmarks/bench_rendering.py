@@ -0,0 +1,61 @@
+"""
+Rendering Benchmarks
+--------------------
+
+Times rendering a chart to PNG bytes or pixels with pltviz.render against the
+pyplot loop that it replaces.
+"""
+
+import io
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pltviz
+from inputs import gen_counts
+
+# Numbers of groups in the chart.
+SIZES = [10, 100, 1000]
+
+
+def time_render_png(size):
+    counts = gen_counts(size)
+
+    def render():
+        pltviz.render("semipie", counts=counts)
+
+    return render
+
+
+def time_render_memoryview(size):
+    counts = gen_counts(size)
+
+    def render():
+        with pltviz.render("semipie", output="memoryview", counts=counts):
+            pass
+
+    return render
+
+
+def time_render_rgba(size):
+    counts = gen_counts(size)
+
+    def render():
+        pltviz.render("semipie", format="rgba", counts=counts)
+
+    return render
+
+
+def time_pyplot_png(size):
+    counts = gen_counts(size)
+
+    def render():
+        buffer = io.BytesIO()
+        pltviz.semipie(counts=counts, axis=plt.subplots()[1])
+        plt.savefig(buffer, format="png")
+        plt.close("all")
+        buffer.getvalue()
+
+    return render
@@ -0,0 +1,36 @@
+"""
+Thread Benchmarks
+-----------------
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pltviz
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Numbers of threads that the charts are rendered across.
+SIZES = [1, 2, 4, 8]
+
+num_charts = 16
+
+
+def render_chart(i):
+    counts = np.random.default_rng(i).integers(1, 100, size=20)
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(1, 3)
+    pltviz.bar(counts=counts, backend="lean", axis=axes[0])
+    pltviz.semipie(counts=counts, axis=axes[1])
+    pltviz.gini(shares=counts / counts.sum(), backend="lean", axis=axes[2])
+    fig.savefig(io.BytesIO(), format="png")
+
+
+def time_render_threads(size):
+    def render():
+        with ThreadPoolExecutor(max_workers=size) as executor:
+            list(executor.map(render_chart, range(num_charts)))
+
+    return render
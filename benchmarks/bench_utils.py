@@ -0,0 +1,174 @@
+"""
+Utilities Benchmarks
+--------------------
+"""
+
+import numpy as np
+from colormath.color_conversions import convert_color
+from colormath.color_objects import LabColor, sRGBColor
+from pltviz import utils
+
+SIZES = [10, 1000, 100000]
+
+default_sat = 0.95
+
+
+def gen_hexes(size):
+    return utils.rgb_array_to_hex(
+        np.random.default_rng(42).integers(0, 256, size=(size, 3))
+    )
+
+
+def time_color_pipeline_per_color(size):
+    hexes = gen_hexes(size)
+
+    def pipeline():
+        return [
+            utils.rgb_to_hex(
+                utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=default_sat)
+            )
+            for c in hexes
+        ]
+
+    return pipeline
+
+
+def time_color_pipeline_array(size):
+    hexes = gen_hexes(size)
+
+    def pipeline():
+        return utils.rgb_array_to_hex(
+            utils.scale_saturation_array(
+                rgb_array=utils.hex_to_rgb_array(hexes), sat=default_sat
+            )
+        )
+
+    return pipeline
+
+
+def time_create_color_palette_colormath(size):
+    start_rgb, end_rgb = [utils.hex_to_rgb(c) for c in gen_hexes(2)]
+
+    def palette():
+        start_tuple = convert_color(start_rgb, LabColor).get_value_tuple()
+        end_tuple = convert_color(end_rgb, LabColor).get_value_tuple()
+        points_between = zip(
+            *[np.linspace(start_tuple[i], end_tuple[i], num=size) for i in range(3)]
+        )
+
+        return [
+            convert_color(LabColor(*point), sRGBColor).get_rgb_hex()
+            for point in points_between
+        ]
+
+    return palette
+
+
+def time_create_color_palette_array(size):
+    start_rgb, end_rgb = gen_hexes(2)
+
+    def palette():
+        return utils.create_color_palette(
+            start_rgb=start_rgb, end_rgb=end_rgb, num_colors=size, colorspace=LabColor
+        )
+
+    return palette
+
+
+def time_normalize_counts_nested(size):
+    rng = np.random.default_rng(42)
+    counts = [rng.integers(1, 100, size=5).tolist() for _ in range(size)]
+
+    def normalize():
+        return utils.normalize_counts(counts)
+
+    return normalize
+
+
+def time_normalize_counts_ragged(size):
+    values = np.random.default_rng(42).integers(1, 100, size=5 * size)
+    offsets = np.arange(0, 5 * size + 1, 5)
+
+    def normalize():
+        return utils.normalize_counts(utils.GroupedCounts(values, offsets))
+
+    return normalize
+
+
+def time_desaturated_colors(size):
+    hexes = gen_hexes(size)
+
+    def desaturate():
+        return utils.desaturated_colors(colors=hexes, dsat=default_sat)
+
+    return desaturate
+
+
+def time_desaturated_colors_uncached(size):
+    hexes = gen_hexes(size)
+
+    def desaturate():
+        utils.clear_palette_cache()
+        return utils.desaturated_colors(colors=hexes, dsat=default_sat)
+
+    return desaturate
+
+
+def time_default_palette(size):
+    def desaturate():
+        return utils.desaturated_colors(num_colors=size, dsat=default_sat)
+
+    return desaturate
+
+
+def gen_label_values(size):
+    rng = np.random.default_rng(42)
+    values = rng.integers(0, 10**7, size=size).astype(float)
+    values[::2] += 0.5
+
+    return values
+
+
+def add_num_commas_reversed(num):
+    # The former add_num_commas, which reversed the digits to insert commas.
+    num_str = str(num)
+    num_str_no_decimal = num_str.split(".")[0]
+    decimal = num_str.split(".")[1] if "." in num_str else None
+
+    str_list = [i for i in num_str_no_decimal][::-1]
+    str_list_with_commas = [
+        s + "," if i % 3 == 0 and i != 0 else s for i, s in enumerate(str_list)
+    ][::-1]
+
+    str_with_commas = "".join(str_list_with_commas)
+    if decimal != None:
+        return str_with_commas + "." + decimal
+    else:
+        return str_with_commas
+
+
+def time_format_numbers_reversed(size):
+    values = gen_label_values(size)
+
+    def format_labels():
+        return [add_num_commas_reversed(utils.round_if_int(v)) for v in values.tolist()]
+
+    return format_labels
+
+
+def time_format_numbers_per_value(size):
+    values = gen_label_values(size)
+
+    def format_labels():
+        return [utils.add_num_commas(utils.round_if_int(v)) for v in values.tolist()]
+
+    return format_labels
+
+
+def time_format_numbers(size):
+    values = gen_label_values(size)
+
+    def format_labels():
+        return utils.format_numbers(values, commas=True)
+
+    return format_labels
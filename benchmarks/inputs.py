@@ -0,0 +1,28 @@
+"""
+Benchmark Inputs
+----------------
+
+Generators of the reproducible inputs that the bench_*.py modules share.
+
+Contents:
+    gen_counts,
+    gen_lines_df
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def gen_counts(size):
+    return np.random.default_rng(42).integers(1, 100, size=size).tolist()
+
+
+def gen_lines_df(size, num_baselines=20):
+    baselines = list(range(num_baselines))
+    dependent_cols = [f"baseline_{b}" for b in baselines]
+    df = pd.DataFrame(
+        np.random.default_rng(42).integers(0, 1000, size=(size, len(baselines))),
+        columns=dependent_cols,
+    )
+
+    return df, dependent_cols, baselines
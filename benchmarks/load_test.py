@@ -0,0 +1,113 @@
+"""
+Rendering Service Load Test
+---------------------------
+
+Sends chart requests to a pltviz.service.RenderService from a number of
+concurrent clients and reports the latency percentiles and throughput at each
+level of concurrency.
+
+Latencies include the time that requests wait for a slot in the service, so
+they grow with concurrency once the workers are saturated.
+
+Usage:
+    python benchmarks/load_test.py [--concurrency 1 4 16 64] [--requests 200] [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+)
+
+from pltviz.service import RenderService
+
+
+def gen_request(rng):
+    kind = ["pie", "semipie", "bar"][rng.integers(3)]
+
+    return kind, {"counts": rng.integers(1, 100, size=rng.integers(2, 20)).tolist()}
+
+
+async def run_level(service, concurrency, num_requests, timeout=None):
+    """
+    Sends requests from concurrent clients, returning the latencies of successful requests, the number of timeouts and the seconds taken.
+    """
+    rng = np.random.default_rng(42)
+    requests = [gen_request(rng) for _ in range(num_requests)]
+    latencies = []
+    timeouts = 0
+
+    async def client():
+        nonlocal timeouts
+        while requests:
+            kind, kwargs = requests.pop()
+            start = time.perf_counter()
+            try:
+                await service.render(kind, timeout=timeout, **kwargs)
+                latencies.append(time.perf_counter() - start)
+
+            except asyncio.TimeoutError:
+                timeouts += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+
+    return latencies, timeouts, time.perf_counter() - start
+
+
+async def main(concurrency_levels, num_requests, max_workers, max_pending, timeout):
+    async with RenderService(
+        max_workers=max_workers, max_pending=max_pending
+    ) as service:
+        print(
+            f"{service.max_workers} workers, {service.max_pending} pending charts at most"
+        )
+        print(
+            f"{'concurrency':>11} {'p50 ms':>10} {'p99 ms':>10} {'charts/s':>10} {'timeouts':>9}"
+        )
+        for concurrency in concurrency_levels:
+            latencies, timeouts, seconds = await run_level(
+                service, concurrency, num_requests, timeout=timeout
+            )
+            p50, p99 = (
+                np.percentile(latencies, [50, 99]) * 1e3
+                if latencies
+                else [float("nan")] * 2
+            )
+            print(
+                f"{concurrency:>11} {p50:>10.1f} {p99:>10.1f} {len(latencies) / seconds:>10.1f} {timeouts:>9}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load tests pltviz.service.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16, 64],
+        help="the numbers of concurrent clients",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=200, help="requests per concurrency level"
+    )
+    parser.add_argument("--workers", type=int, help="the number of worker processes")
+    parser.add_argument("--max-pending", type=int, help="the most submitted charts")
+    parser.add_argument("--timeout", type=float, help="seconds per request")
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            concurrency_levels=args.concurrency,
+            num_requests=args.requests,
+            max_workers=args.workers,
+            max_pending=args.max_pending,
+            timeout=args.timeout,
+        )
+    )
@@ -0,0 +1,358 @@
+"""
+Benchmark Runner
+----------------
+
+Runs the timing benchmarks found in the bench_*.py modules of this directory.
+
+Each module defines SIZES, a list of input sizes, and functions prefixed with
+time_ that take a size and return a callable to be timed, with setup done
+before the callable is returned. A time_ function can set its own sizes
+attribute to override SIZES.
+
+Functions prefixed with chart_ instead return a callable that plots on a
+passed axis. The build, draw and savefig phases of these charts are timed
+separately on a new Agg figure per run, and larger sizes are skipped once a
+chart takes longer than max_seconds to render.
+
+Results can be saved as JSON and compared against those of another run.
+
+Usage:
+    python benchmarks/run.py [name_filter] [--json results.json] [--compare baseline.json]
+    python benchmarks/run.py --compare baseline.json results.json
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+
+benchmark_directory = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(benchmark_directory), "src"))
+
+chart_phases = ["build", "draw", "savefig"]
+
+
+def load_benchmark_modules():
+    """
+    Imports all bench_*.py modules in the benchmark directory.
+
+    Returns
+    -------
+        modules : list (contains modules)
+            The benchmark modules sorted by name.
+    """
+    modules = []
+    for file_name in sorted(os.listdir(benchmark_directory)):
+        if file_name.startswith("bench_") and file_name.endswith(".py"):
+            spec = importlib.util.spec_from_file_location(
+                file_name[:-3], os.path.join(benchmark_directory, file_name)
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            modules.append(module)
+
+    return modules
+
+
+def time_callable(func, repeat=3):
+    """
+    Times a callable, returning the best time per call over a number of repeats.
+
+    Parameters
+    ----------
+        func : callable
+            The function to be timed.
+
+        repeat : int (default=3)
+            The number of timing runs, the minimum of which is returned.
+
+    Returns
+    -------
+        seconds : float
+            The best time per call of func.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def time_chart(plot, repeat=3, format="png"):
+    """
+    Times building, drawing and saving a chart, returning the best time of each phase over a number of repeats.
+
+    Parameters
+    ----------
+        plot : callable
+            A function that plots on a passed axis.
+
+        repeat : int (default=3)
+            The number of timing runs, with charts that take over a second being timed once.
+
+        format : str (default="png")
+            The format that the chart is saved in.
+
+    Returns
+    -------
+        phase_seconds : dict
+            The best seconds of each of chart_phases.
+
+            Note: savefig draws the figure again before encoding it.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    phase_seconds = dict.fromkeys(chart_phases, float("inf"))
+    for _ in range(repeat):
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        ax = figure.add_subplot()
+
+        start = time.perf_counter()
+        plot(ax)
+        built = time.perf_counter()
+        figure.canvas.draw()
+        drawn = time.perf_counter()
+        figure.savefig(io.BytesIO(), format=format)
+        saved = time.perf_counter()
+
+        run_seconds = dict(
+            zip(chart_phases, [built - start, drawn - built, saved - drawn])
+        )
+        for phase, seconds in run_seconds.items():
+            phase_seconds[phase] = min(phase_seconds[phase], seconds)
+
+        if sum(run_seconds.values()) > 1:
+            break
+
+    return phase_seconds
+
+
+def run(name_filter=None, max_size=None, max_seconds=30, repeat=3):
+    """
+    Runs and prints all benchmarks, optionally filtered by name.
+
+    Parameters
+    ----------
+        name_filter : str : optional (default=None)
+            A substring that benchmark names must contain to be run.
+
+        max_size : int : optional (default=None)
+            The largest size to run benchmarks at.
+
+        max_seconds : float : optional (default=30)
+            The render time of a chart after which its larger sizes are skipped.
+
+        repeat : int : optional (default=3)
+            The number of timing runs of each benchmark.
+
+    Returns
+    -------
+        results : list (contains dicts)
+            The benchmark, size and best time per call for each run, with the time of each phase of charts.
+    """
+    results = []
+    for module in load_benchmark_modules():
+        module_sizes = getattr(module, "SIZES", [10])
+        for name in sorted(dir(module)):
+            if not name.startswith(("time_", "chart_")):
+                continue
+
+            bench_name = f"{module.__name__}.{name}"
+            if name_filter and name_filter not in bench_name:
+                continue
+
+            bench_func = getattr(module, name)
+            over_budget = False
+            for size in getattr(bench_func, "sizes", module_sizes):
+                if max_size is not None and size > max_size:
+                    continue
+
+                result = {"benchmark": bench_name, "size": size}
+                if over_budget:
+                    result["seconds"] = None
+                    results.append(result)
+                    print(f"{bench_name:<60} {size:>8} {'skipped':>15}")
+                    continue
+
+                if name.startswith("chart_"):
+                    phase_seconds = time_chart(bench_func(size), repeat=repeat)
+                    result["seconds"] = sum(phase_seconds.values())
+                    result["phases"] = phase_seconds
+                    over_budget = result["seconds"] > max_seconds
+
+                    phase_strs = " ".join(
+                        f"{phase} {seconds * 1e3:.1f}"
+                        for phase, seconds in phase_seconds.items()
+                    )
+                    print(
+                        f"{bench_name:<60} {size:>8} {result['seconds'] * 1e3:>12.4f} ms ({phase_strs})"
+                    )
+
+                else:
+                    result["seconds"] = time_callable(bench_func(size), repeat=repeat)
+                    print(
+                        f"{bench_name:<60} {size:>8} {result['seconds'] * 1e3:>12.4f} ms"
+                    )
+
+                results.append(result)
+
+    return results
+
+
+def save_results(results, path):
+    """
+    Saves benchmark results as JSON along with the versions they were run with.
+
+    Parameters
+    ----------
+        results : list (contains dicts)
+            The results of run.
+
+        path : str
+            The JSON file to save to.
+    """
+    import matplotlib
+    import numpy as np
+
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(path, "w") as f:
+        json.dump({"environment": environment, "results": results}, f, indent=2)
+
+
+def load_results(path):
+    """
+    Loads the benchmark results saved in a JSON file.
+
+    Parameters
+    ----------
+        path : str
+            A JSON file of save_results.
+
+    Returns
+    -------
+        results : list (contains dicts)
+            The results of run.
+    """
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline_results, results, threshold=1.1):
+    """
+    Prints the ratios of times to those of a baseline for the benchmarks and sizes in both.
+
+    Parameters
+    ----------
+        baseline_results, results : list (contains dicts)
+            The results of the baseline run and of the run to compare to it.
+
+        threshold : float (default=1.1)
+            The ratio of times above which a benchmark counts as a regression.
+
+    Returns
+    -------
+        regressions : list (contains tuples)
+            The benchmark, size, phase (None for the total) and ratio of each regression.
+    """
+    baseline = {(r["benchmark"], r["size"]): r for r in baseline_results}
+
+    regressions = []
+    for result in results:
+        baseline_result = baseline.get((result["benchmark"], result["size"]))
+        if baseline_result is None:
+            continue
+
+        phases = [(None, baseline_result["seconds"], result["seconds"])]
+        phases += [
+            (phase, baseline_result["phases"][phase], seconds)
+            for phase, seconds in result.get("phases", {}).items()
+            if phase in baseline_result.get("phases", {})
+        ]
+        for phase, baseline_seconds, seconds in phases:
+            if not baseline_seconds or seconds is None:
+                continue
+
+            ratio = seconds / baseline_seconds
+            name = result["benchmark"] + (f" [{phase}]" if phase else "")
+            flag = "  slower" if ratio > threshold else ""
+            if ratio > threshold:
+                regressions.append((result["benchmark"], result["size"], phase, ratio))
+
+            print(
+                f"{name:<70} {result['size']:>8} {baseline_seconds * 1e3:>12.4f} ms {seconds * 1e3:>12.4f} ms {ratio:>7.2f}x{flag}"
+            )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Runs the pltviz benchmarks.")
+    parser.add_argument(
+        "name_filter", nargs="?", help="a substring of the benchmarks to run"
+    )
+    parser.add_argument("--json", help="a file to save the results to")
+    parser.add_argument(
+        "--compare",
+        nargs="+",
+        metavar="RESULTS",
+        help="a baseline results file, and optionally results to compare to it instead of running",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.1,
+        help="the ratio of times counting as a regression",
+    )
+    parser.add_argument("--max-size", type=int, help="the largest size to run")
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=30,
+        help="the chart render time after which larger sizes are skipped",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per size")
+    args = parser.parse_args(argv)
+
+    assert not args.compare or len(args.compare) <= 2, "--compare takes 1 or 2 files."
+
+    if args.compare and len(args.compare) == 2:
+        results = load_results(args.compare[1])
+
+    else:
+        results = run(
+            name_filter=args.name_filter,
+            max_size=args.max_size,
+            max_seconds=args.max_seconds,
+            repeat=args.repeat,
+        )
+        if args.json:
+            save_results(results, args.json)
+
+    if args.compare:
+        print()
+        regressions = compare(
+            load_results(args.compare[0]), results, threshold=args.threshold
+        )
+        if regressions:
+            print(
+                f"\n{len(regressions)} timings are over {args.threshold}x the baseline."
+            )
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
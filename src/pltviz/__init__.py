@@ -1,6 +1,36 @@
+import importlib
+
 from pltviz.bar import bar
 from pltviz.comp_line import comp_line
-from pltviz.gini import gini
-from pltviz import legend
+from pltviz.gini import gini, gini_coefficient
 from pltviz.pie import pie
 from pltviz.semipie import semipie
+
+# Submodules that are only imported on first access (PEP 562).
+_lazy_submodules = [
+    "animate",
+    "batch",
+    "legend",
+    "live",
+    "rendering",
+    "service",
+    "utils",
+]
+
+# Functions of lazy submodules that are also accessible from the package.
+_lazy_functions = {"arender": "service", "render": "rendering"}
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f"pltviz.{name}")
+
+    if name in _lazy_functions:
+        module = importlib.import_module(f"pltviz.{_lazy_functions[name]}")
+        return getattr(module, name)
+
+    raise AttributeError(f"module 'pltviz' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals()) + _lazy_submodules + list(_lazy_functions))
@@ -0,0 +1,265 @@
+"""
+Animations
+----------
+
+Functions for animating transitions between allocations
+
+Contents:
+    transition_counts,
+    animate_pie,
+    animate_semipie,
+    save_animation
+"""
+
+import os
+
+import numpy as np
+
+from pltviz import utils
+
+default_sat = 0.95
+
+# Writers that pipe each frame to an external encoder as it's drawn.
+streaming_writers = {".mp4": "ffmpeg", ".gif": "imagemagick"}
+
+
+def transition_counts(counts_sequence, frames_per_transition=1):
+    """
+    Derives the counts of every frame of an animation, interpolating between successive counts.
+
+    Parameters
+    ----------
+        counts_sequence : list of lists or np.ndarray (contains ints or floats)
+            The counts of the groups at each step, such as when more votes have been counted.
+
+        frames_per_transition : int : optional (default=1)
+            The number of frames from one step's counts to the next.
+
+    Returns
+    -------
+        frame_counts : np.ndarray (shape=((num_steps - 1) * frames_per_transition + 1, num_groups))
+            The counts of each frame, ending with the last step's counts.
+    """
+    assert (
+        all(np.ndim(c) == 1 for c in counts_sequence)
+        and len({len(c) for c in counts_sequence}) == 1
+    ), "The 'counts_sequence' argument must be a sequence of flat counts with equal numbers of groups."
+    counts = np.asarray(counts_sequence, dtype=np.float64)
+    assert (
+        frames_per_transition >= 1
+    ), "The 'frames_per_transition' argument must be at least 1."
+
+    steps = np.arange(frames_per_transition) / frames_per_transition
+    frame_counts = (
+        counts[:-1, None, :]
+        + steps[None, :, None] * np.diff(counts, axis=0)[:, None, :]
+    )
+
+    return np.concatenate(
+        [frame_counts.reshape(-1, counts.shape[1]), counts[-1:]], axis=0
+    )
+
+
+def _label_counts(counts_sequence, frame_counts):
+    """
+    Rounds the counts of interpolated frames for labels if the original counts are integers.
+    """
+    if np.issubdtype(np.asarray(counts_sequence).dtype, np.integer):
+        return np.rint(frame_counts)
+
+    return frame_counts
+
+
+def animate_pie(
+    counts_sequence,
+    labels=None,
+    colors=None,
+    radius=1,
+    donut_ratio=1,
+    display_labels=False,
+    display_counts=False,
+    label_font_size=20,
+    frames_per_transition=10,
+    interval=50,
+    repeat=False,
+    dsat=default_sat,
+    axis=None,
+):
+    """
+    Animates a donut plot through a sequence of counts with blitting.
+
+    Parameters
+    ----------
+        counts_sequence : list of lists or np.ndarray (contains ints or floats)
+            The counts of the groups at each step of the animation.
+
+        labels, colors, radius, donut_ratio, display_labels, display_counts, label_font_size : optional
+            Arguments for the plot (see pie).
+
+        frames_per_transition : int : optional (default=10)
+            The number of frames from one step's counts to the next.
+
+        interval : int : optional (default=50)
+            The delay between frames in milliseconds.
+
+        repeat : bool : optional (default=False)
+            Whether the animation repeats when it's done.
+
+        dsat : float : optional (default=default_sat)
+            The degree of desaturation to be applied to the colors.
+
+        axis : str : optional (default=None)
+            Adds an axis to plots so they can be combined.
+
+    Returns
+    -------
+        animation : matplotlib.animation.FuncAnimation
+            An animation with the wedge angles of every frame computed up front.
+    """
+    from matplotlib.animation import FuncAnimation
+
+    from pltviz.live import LivePie
+
+    frame_counts = transition_counts(
+        counts_sequence=counts_sequence, frames_per_transition=frames_per_transition
+    )
+    frame_label_counts = _label_counts(counts_sequence, frame_counts)
+    frame_thetas = utils.section_thetas(frame_counts)
+
+    live = LivePie(
+        counts=frame_counts[0],
+        labels=labels,
+        colors=colors,
+        radius=radius,
+        donut_ratio=donut_ratio,
+        display_labels=display_labels,
+        display_counts=display_counts,
+        label_font_size=label_font_size,
+        dsat=dsat,
+        axis=axis,
+    )
+
+    def draw_frame(i):
+        return live._draw_frame(values=frame_label_counts[i], thetas=frame_thetas[i])
+
+    return FuncAnimation(
+        fig=live.ax.figure,
+        func=draw_frame,
+        frames=len(frame_thetas),
+        interval=interval,
+        repeat=repeat,
+        blit=True,
+    )
+
+
+def animate_semipie(
+    counts_sequence,
+    colors=None,
+    donut_ratio=1,
+    frames_per_transition=10,
+    interval=50,
+    repeat=False,
+    dsat=default_sat,
+    axis=None,
+):
+    """
+    Animates a semicircle plot through a sequence of counts with blitting.
+
+    Parameters
+    ----------
+        counts_sequence : list of lists or np.ndarray (contains ints or floats)
+            The counts of the groups at each step of the animation.
+
+        colors : list : optional (default=None)
+            The colors of the groups as hex keys.
+
+        donut_ratio : float (default=1, a full semicircle)
+            The ratio of the center radius of a donut to the whole.
+
+        frames_per_transition : int : optional (default=10)
+            The number of frames from one step's counts to the next.
+
+        interval : int : optional (default=50)
+            The delay between frames in milliseconds.
+
+        repeat : bool : optional (default=False)
+            Whether the animation repeats when it's done.
+
+        dsat : float : optional (default=default_sat)
+            The degree of desaturation to be applied to the colors.
+
+        axis : str : optional (default=None)
+            Adds an axis to plots so they can be combined.
+
+    Returns
+    -------
+        animation : matplotlib.animation.FuncAnimation
+            An animation with the wedge angles of every frame computed up front.
+    """
+    from matplotlib.animation import FuncAnimation
+
+    from pltviz.live import LiveSemipie
+
+    frame_counts = transition_counts(
+        counts_sequence=counts_sequence, frames_per_transition=frames_per_transition
+    )
+    frame_thetas = utils.section_thetas(frame_counts, start_angle=180, end_angle=0)
+
+    live = LiveSemipie(
+        counts=frame_counts[0],
+        colors=colors,
+        donut_ratio=donut_ratio,
+        dsat=dsat,
+        axis=axis,
+    )
+
+    def draw_frame(i):
+        return live._draw_frame(thetas=frame_thetas[i])
+
+    return FuncAnimation(
+        fig=live.ax.figure,
+        func=draw_frame,
+        frames=len(frame_thetas),
+        interval=interval,
+        repeat=repeat,
+        blit=True,
+    )
+
+
+def save_animation(animation, path, writer=None, fps=20, dpi=None):
+    """
+    Saves an animation to a file, streaming each frame to the writer as it's drawn.
+
+    Parameters
+    ----------
+        animation : matplotlib.animation.Animation
+            The animation to save (see animate_pie and animate_semipie).
+
+        path : str
+            The file to save to, with .mp4 and .gif files using ffmpeg and ImageMagick by default.
+
+        writer : str : optional (default=None)
+            The name of a matplotlib.animation writer to use instead.
+
+            Note: writers that don't pipe frames, such as "pillow", hold all frames in memory.
+
+        fps : int : optional (default=20)
+            The frames per second of the file.
+
+        dpi : float : optional (default=None)
+            The resolution of the frames, with None being that of the figure.
+    """
+    from matplotlib import animation as mpl_animation
+
+    if writer is None:
+        extension = os.path.splitext(path)[1].lower()
+        assert (
+            extension in streaming_writers
+        ), f"A 'writer' must be passed for files that aren't {list(streaming_writers)}."
+        writer = streaming_writers[extension]
+
+    assert mpl_animation.writers.is_available(
+        writer
+    ), f"The '{writer}' animation writer isn't available, so its encoder needs to be installed or another 'writer' passed."
+
+    animation.save(path, writer=mpl_animation.writers[writer](fps=fps), dpi=dpi)
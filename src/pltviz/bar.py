@@ -3,19 +3,289 @@
 --------
 
 Contents
+    desaturate_patches,
+    bar_positions,
+    stacked_segment_verts,
+    aggregate_groups,
     bar
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-import seaborn as sns
 
-from pltviz import utils
+from pltviz import profiling, utils
 
 default_sat = 0.95
 
+# The most groups that aggregate_groups keeps by default.
+default_max_groups = 500
+other_color = "#999999"
 
+# The width of an average character relative to the font size, used to estimate label widths.
+char_width_ratio = 0.6
+
+
+def desaturate_patches(colors, dsat):
+    """
+    Scales the saturation channel of patch colors as seaborn does for bars.
+
+    Parameters
+    ----------
+        colors : list (contains strs)
+            The colors of the patches as hex keys.
+
+        dsat : float
+            The proportion of the saturation that should be kept.
+
+    Returns
+    -------
+        patch_colors : np.ndarray (shape=(len(colors), 3))
+            RGB ratios of the desaturated colors.
+    """
+    rgb_array = utils.hex_to_rgb_array(colors)
+    if dsat >= 1:
+        return rgb_array
+
+    hls_array = utils.rgb_to_hls_array(rgb_array)
+    hls_array[:, 2] *= dsat
+
+    return utils.hls_to_rgb_array(hls_array)
+
+
+def bar_positions(values, stacked=False):
+    """
+    Derives where the bars of flat counts are placed on the category and value axes.
+
+    Parameters
+    ----------
+        values : np.ndarray (contains ints or floats)
+            The counts of the bars.
+
+        stacked : bool : optional (default=False)
+            Whether the bars are stacked at a single category position.
+
+    Returns
+    -------
+        positions, starts : np.ndarray, np.ndarray
+            The category axis centers of the bars and the value axis positions where they start.
+    """
+    if stacked:
+        starts = np.zeros(len(values))
+        np.cumsum(values[:-1], out=starts[1:])
+
+        return np.zeros(len(values)), starts
+
+    return np.arange(len(values)), np.zeros(len(values))
+
+
+def stacked_segment_verts(values, horizontal=False, width=0.8):
+    """
+    Derives the corners of the segments of a stacked bar of flat counts.
+
+    Parameters
+    ----------
+        values : np.ndarray (contains ints or floats)
+            The counts of the segments.
+
+        horizontal : bool : optional (default=False)
+            Whether the bar is horizontal.
+
+        width : float : optional (default=0.8)
+            The width of the bar on the category axis, which is centered at 0.
+
+    Returns
+    -------
+        verts : np.ndarray (shape=(len(values), 4, 2))
+            The corners of each segment's rectangle in data coordinates.
+    """
+    starts = bar_positions(values, stacked=True)[1]
+    ends = starts + values
+
+    verts = np.empty((len(values), 4, 2))
+    verts[:, :, 1 if horizontal else 0] = [-width / 2, -width / 2, width / 2, width / 2]
+    verts[:, :, 0 if horizontal else 1] = np.stack([starts, ends, ends, starts], axis=1)
+
+    return verts
+
+
+def _draw_stacked_segments(ax, values, colors, horizontal):
+    """
+    Draws the segments of a stacked bar of flat counts as a single collection of rectangles.
+    """
+    from matplotlib.collections import PolyCollection
+
+    segments = PolyCollection(
+        stacked_segment_verts(values, horizontal=horizontal),
+        facecolors=colors,
+        edgecolors="none",
+        linewidths=0,
+    )
+    # Values start at the axis, as they do for ax.bar.
+    if horizontal:
+        segments.sticky_edges.x.append(0)
+    else:
+        segments.sticky_edges.y.append(0)
+
+    ax.add_collection(segments, autolim=True)
+    ax.autoscale_view()
+
+    return segments
+
+
+def aggregate_groups(
+    values,
+    labels=None,
+    colors=None,
+    max_groups=default_max_groups,
+    other_label="other",
+):
+    """
+    Merges the smallest groups into a single last group so that at most max_groups are plotted.
+
+    Parameters
+    ----------
+        values : np.ndarray (contains ints or floats)
+            The counts of the groups.
+
+        labels : list : optional (default=None; contains strs)
+            The labels of the groups.
+
+        colors : list : optional (default=None)
+            The colors of the groups as hex keys.
+
+        max_groups : int : optional (default=default_max_groups)
+            The most groups that are kept, including the merged group.
+
+        other_label : str : optional (default="other")
+            The label of the merged group, which is colored other_color.
+
+    Returns
+    -------
+        values, labels, colors : np.ndarray, list or None, list or None
+            The largest groups in their original order followed by the merged group.
+    """
+    assert max_groups >= 2, "The 'max_groups' argument must be at least 2."
+    if len(values) <= max_groups:
+        return values, labels, colors
+
+    kept = np.sort(np.argpartition(-np.abs(values), max_groups - 2)[: max_groups - 1])
+    merged = np.ones(len(values), dtype=bool)
+    merged[kept] = False
+
+    values = np.append(values[kept], values[merged].sum())
+    kept = kept.tolist()
+    if labels is not None:
+        labels = [labels[i] for i in kept] + [other_label]
+
+    if colors is not None:
+        colors = [colors[i] for i in kept] + [other_color]
+
+    return values, labels, colors
+
+
+def _label_step(ax, label_strs, num_slots, horizontal, font_size):
+    """
+    Derives every how many of the category axis' equal slots a label fits without overlapping.
+
+    Note: label widths are estimated from their characters so that no text needs to be drawn.
+    """
+    from matplotlib.font_manager import FontProperties
+
+    if not label_strs:
+        return 1
+
+    font_px = FontProperties(size=font_size).get_size_in_points() * ax.figure.dpi / 72
+    bbox = ax.get_window_extent()
+    if horizontal:
+        slot_px = bbox.height / num_slots
+        label_px = font_px
+
+    else:
+        slot_px = bbox.width / num_slots
+        label_px = char_width_ratio * font_px * max(len(s) for s in label_strs)
+
+    return max(1, int(np.ceil(label_px / slot_px)))
+
+
+def _draw_categorical_bars(ax, values, labels, colors, horizontal, tick_step=1):
+    """
+    Draws a bar per group as seaborn.barplot does for counts that are already aggregated.
+
+    Note: only every tick_step-th group gets a tick so that unused ticks aren't created.
+    """
+    positions = bar_positions(values)[0]
+    if horizontal:
+        ax.barh(positions, values, 0.8, color=colors, align="center", left=0)
+        ax.set(xlabel="counts", ylabel="group")
+        ax.set_yticks(positions[::tick_step])
+        ax.set_yticklabels(labels[::tick_step])
+        ax.yaxis.grid(False)
+        ax.set_ylim(-0.5, len(values) - 0.5, auto=None)
+        ax.invert_yaxis()
+
+    else:
+        ax.bar(positions, values, 0.8, color=colors, align="center", bottom=0)
+        ax.set(xlabel="group", ylabel="counts")
+        ax.set_xticks(positions[::tick_step])
+        ax.set_xticklabels(labels[::tick_step])
+        ax.xaxis.grid(False)
+        ax.set_xlim(-0.5, len(values) - 0.5, auto=None)
+
+
+def _draw_stacked_faction_bars(
+    ax, values, offsets, faction_labels, colors, horizontal, grid
+):
+    """
+    Draws a bar per faction with its groups stacked as pandas.DataFrame.plot.bar(stacked=True) does.
+    """
+    # Every group has a segment in every faction, with 0 for factions it's not in.
+    faction_positions = np.arange(len(faction_labels))
+    faction_values = np.zeros((len(faction_labels), len(values)))
+    faction_values[
+        np.repeat(faction_positions, np.diff(offsets)), np.arange(len(values))
+    ] = values
+
+    positive_starts = np.zeros(len(faction_labels))
+    negative_starts = np.zeros(len(faction_labels))
+    for i, group_values in enumerate(faction_values.T):
+        positive = group_values > 0
+        starts = np.where(positive, positive_starts, negative_starts)
+        if horizontal:
+            ax.barh(
+                faction_positions,
+                group_values,
+                0.5,
+                left=starts,
+                color=colors[i],
+                align="center",
+            )
+        else:
+            ax.bar(
+                faction_positions,
+                group_values,
+                0.5,
+                bottom=starts,
+                color=colors[i],
+                align="center",
+            )
+
+        positive_starts += np.where(positive, group_values, 0)
+        negative_starts += np.where(positive, 0, group_values)
+
+    ax.grid(grid)
+    if horizontal:
+        ax.set_ylim((-0.5, len(faction_labels) - 0.5))
+        ax.set_yticks(faction_positions)
+        ax.set_yticklabels(faction_labels, rotation=90)
+        ax.set_ylabel("faction")
+
+    else:
+        ax.set_xlim((-0.5, len(faction_labels) - 0.5))
+        ax.set_xticks(faction_positions)
+        ax.set_xticklabels(faction_labels, rotation=0)
+        ax.set_xlabel("faction")
+
+
+@profiling.profiled
 def bar(
     counts,
     labels=None,
@@ -24,7 +294,11 @@ def bar(
     horizontal=False,
     stacked=False,
     label_bars=False,
+    max_groups=None,
+    other_label="other",
     dsat=default_sat,
+    backend="seaborn",
+    rasterized=False,
     axis=None,
 ):
     """
@@ -32,11 +306,13 @@ def bar(
 
     Parameters
     ----------
-        counts : list or list of lists (contains ints or floats)
+        counts : list, list of lists, np.ndarray, pd.Series or tuple (contains ints or floats)
             The data to be plotted.
 
             Note: a list of lists produces a stacked plot where sublists define factions to be stacked.
 
+            Note: 2D arrays and utils.GroupedCounts also define factions (see utils.normalize_counts).
+
         labels : list : optional (default=None; contains strs)
             The labels of the groups.
 
@@ -59,27 +335,60 @@ def bar(
         label_bars : bool : optional (default=False)
             Whether or not to label the bars with their heights (or widths).
 
+            Note: if the labels of flat counts would overlap, then only every n-th bar is labeled as with the group ticks.
+
+        max_groups : int : optional (default=None, all groups)
+            The most groups of flat counts that are plotted, with smaller ones being merged (see aggregate_groups).
+
+            Note: the merged group takes other_label and other_color, and the segments of stacked bars are merged as well.
+
+        other_label : str : optional (default="other")
+            The label of the group that smaller groups are merged into.
+
         dsat : float : optional (default=default_sat)
             The degree of desaturation to be applied to the colors.
 
+        backend : str : optional (default="seaborn")
+            Whether to draw with seaborn and pandas or only matplotlib ("lean").
+
+        rasterized : bool : optional (default=False)
+            Whether to rasterize the bars in vector outputs, keeping text and axes as vectors.
+
+            Note: rasterized artists are drawn at the dpi passed to savefig.
+
         axis : str : optional (default=None)
             Adds an axis to plots so they can be combined.
 
+            Note: only the passed axis is drawn on, so plots on separate figures can be made in threads.
+
     Returns
     -------
         ax : matplotlib.pyplot.subplot
             A bar plot with the above criteria.
     """
+    import matplotlib.pyplot as plt
+
+    profiling.checkpoint("imports")
+
+    assert backend in [
+        "seaborn",
+        "lean",
+    ], "The 'backend' argument must be 'seaborn' or 'lean'."
+
+    values, offsets = utils.normalize_counts(counts)
+    factioned = offsets is not None
+
     if faction_labels:
         assert (
-            list(set([type(count) for count in counts]))[0] == list
-            and len(set([type(count) for count in counts])) == 1
+            factioned
         ), "If plotting groups and their factions, then the 'counts' argument must be a list of lists, where sublists are group counts in the given faction."
 
-    if list in [type(item) for item in counts]:
-        total_groups = len([item for sublist in counts for item in sublist])
-    else:
-        total_groups = len(counts)
+    total_groups = len(values)
+    if factioned:
+        faction_sizes = np.diff(offsets)
+        faction_totals = utils.sum_groups(values=values, offsets=offsets)
+
+    profiling.checkpoint("validation")
 
     if colors:
         assert (
@@ -87,100 +396,121 @@ def bar(
         ), "The number of colors provided doesn't match the number of counts to be displayed."
 
     elif colors == None:
-        sns.set_palette("deep")  # default sns palette
-        colors = [
-            utils.rgb_to_hex(c)
-            for c in sns.color_palette(n_colors=total_groups, desat=1)
-        ]
+        colors = utils.default_colors(num_colors=total_groups)
 
-    if stacked:
-        # Derive positions where bars should start.
-        if list in [type(i) for i in counts]:
-            bar_starts = []
-            for sub_list in counts:
-                inputs_except_last = list(sub_list[:-1])
-                inputs_except_last.insert(0, 0)
-                bar_starts.append(list(np.cumsum(inputs_except_last)))
-
-            bar_starts = [item for sublist in bar_starts for item in sublist]
+    profiling.checkpoint("palette")
 
-        else:
-            inputs_except_last = list(counts[:-1])
-            inputs_except_last.insert(0, 0)
-            bar_starts = np.cumsum(inputs_except_last)
+    if labels is not None and not isinstance(labels, list):  # np.ndarray and pd.Series
+        labels = list(labels)
 
-    df_plot = pd.DataFrame(columns=["counts", "group", "faction"])
-    if list in [type(i) for i in counts]:
-        df_plot["counts"] = [item for sublist in counts for item in sublist]
+    if max_groups is not None and not factioned and total_groups > max_groups:
+        values, labels, colors = aggregate_groups(
+            values=values,
+            labels=labels,
+            colors=colors,
+            max_groups=max_groups,
+            other_label=other_label,
+        )
+        total_groups = len(values)
+
+    if not labels:
+        labels = range(total_groups)  # dummy labels to be removed
+
+    profiling.checkpoint("aggregation")
+
+    if axis:
+        ax = axis
+    elif factioned:
+        ax = plt.subplots()[1]
     else:
-        df_plot["counts"] = counts
+        ax = plt.gca()
 
-    if faction_labels:
-        factions_for_labels = [
-            [lbl] * len(counts[i]) for i, lbl in enumerate(faction_labels)
-        ]
-        df_plot["faction"] = [
-            item for sublist in factions_for_labels for item in sublist
-        ]
-
-    if isinstance(labels, pd.Series):
-        labels = list(labels)
+    start_counts = utils.count_artists(ax)
+
+    tick_step = 1
+    if not factioned and not stacked:
+        # Group tick labels are thinned out so that they don't overlap.
+        tick_step = _label_step(
+            ax=ax,
+            label_strs=[str(lbl) for lbl in labels],
+            num_slots=total_groups,
+            horizontal=horizontal,
+            font_size=plt.rcParams[
+                "ytick.labelsize" if horizontal else "xtick.labelsize"
+            ],
+        )
+
+    profiling.checkpoint("figure")
+
+    if backend == "seaborn":
+        import pandas as pd
+        import seaborn as sns
+
+        df_plot = pd.DataFrame(columns=["counts", "group", "faction"])
+        df_plot["counts"] = values
+
+        if faction_labels:
+            df_plot["faction"] = np.repeat(faction_labels, faction_sizes)
 
-    if labels:
-        df_plot["group"] = labels
-    else:
-        labels = range(len(counts))  # dummy labels to be removed
         df_plot["group"] = labels
+        profiling.checkpoint("dataframe")
 
     if horizontal:
         if stacked:
-            if list not in [type(i) for i in counts]:
-                for i in df_plot.index:
-                    ax = sns.barplot(
-                        data=pd.DataFrame(df_plot.loc[i]).T,
-                        x="counts",
-                        y="group",
-                        color=colors[i],
-                        saturation=dsat,
-                        left=bar_starts[i],
-                        orient="h",
-                        ax=axis,
-                    )
+            if not factioned:
+                # All segments are drawn as one collection at the single category position.
+                _draw_stacked_segments(
+                    ax=ax,
+                    values=values,
+                    colors=desaturate_patches(colors=colors, dsat=dsat),
+                    horizontal=True,
+                )
+                ax.set(xlabel="counts", ylabel="group", ylim=(-0.5, 0.5))
+                ax.yaxis.grid(False)
+                ax.invert_yaxis()
 
             else:
-                pivot_plot = (
-                    df_plot.pivot(columns="group", index="faction", values="counts")
-                    .fillna(0)
-                    .reindex(faction_labels)
-                )
-                pivot_plot = pivot_plot[labels]
-                colors = [
-                    utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat)
-                    for c in colors
-                ]
+                colors = utils.desaturated_colors(colors=colors, dsat=dsat)
+
+                if backend == "lean":
+                    _draw_stacked_faction_bars(
+                        ax=ax,
+                        values=values,
+                        offsets=offsets,
+                        faction_labels=faction_labels,
+                        colors=colors,
+                        horizontal=True,
+                        grid=plt.rcParams["axes.grid"],
+                    )
+
+                else:
+                    pivot_plot = (
+                        df_plot.pivot(columns="group", index="faction", values="counts")
+                        .fillna(0)
+                        .reindex(faction_labels)
+                    )
+                    pivot_plot = pivot_plot[labels]
+                    pivot_plot.plot.barh(stacked=True, color=colors, rot=90, ax=ax)
+
+                ax.grid(None, axis="y")
 
-                ax = pivot_plot.plot.barh(stacked=True, color=colors, rot=90)
-                plt.grid(b=None, axis="y")
+            profiling.checkpoint("artists")
 
             if label_bars:
-                if list not in [type(i) for i in counts]:
-                    label_text = str(utils.round_if_int(sum(counts)))
-                    label_position = sum([p.get_width() for p in ax.patches]) + 1
+                if not factioned:
+                    label_text = utils.format_numbers([values.sum()])[0]
 
-                    ax.text(
-                        x=label_position,
-                        y=ax.patches[0].get_y() + ax.patches[0].get_height() / 2,
-                        s=label_text,
-                        ha="center",
-                    )
+                    # The bar is centered at 0 on the category axis.
+                    ax.text(x=values.sum() + 1, y=0, s=label_text, ha="center")
 
                 else:
                     # Start and end indexes of all factions.
                     faction_start_idxs = list(set([p.get_y() for p in ax.patches]))
 
-                    for i, c in enumerate(counts):
-                        label_text = str(utils.round_if_int(sum(c)))
-                        label_position = sum(c) + 1
+                    faction_total_strs = utils.format_numbers(faction_totals)
+                    for i, faction_total in enumerate(faction_totals):
+                        label_text = faction_total_strs[i]
+                        label_position = faction_total + 1
 
                         ax.text(
                             x=label_position,
@@ -191,112 +521,132 @@ def bar(
                         )
 
         else:
-            if list not in [type(i) for i in counts]:
-                colors = [
-                    utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat)
-                    for c in colors
-                ]
-                sns.set_palette(colors)
-                ax = sns.barplot(
-                    data=df_plot,
-                    x="counts",
-                    y="group",
-                    saturation=1,
-                    left=0,
-                    orient="h",
-                    ax=axis,
-                )
+            if not factioned:
+                colors = utils.desaturated_colors(colors=colors, dsat=dsat)
+                if backend == "lean":
+                    _draw_categorical_bars(
+                        ax=ax,
+                        values=values,
+                        labels=labels,
+                        colors=colors,
+                        horizontal=True,
+                        tick_step=tick_step,
+                    )
 
-            else:
-                flat_counts = [item for sublist in counts for item in sublist]
-
-                bar_positions = [
-                    0.8 * i - 0.4 for i in list(range(0, len(flat_counts)))
-                ]  # 0.8 is the default width of plt.bar
-                bar_shifts = [[0.8 * i] * len(c) for i, c in enumerate(counts)]
-                flat_bar_shifts = [item for sublist in bar_shifts for item in sublist]
-                bar_locations = [
-                    p + flat_bar_shifts[i] for i, p in enumerate(bar_positions)
-                ]
-
-                scaled_colors = [
-                    utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat)
-                    for c in colors
-                ]
-
-                if axis:
-                    ax = axis
                 else:
-                    ax = plt.subplots()[1]
+                    ax = sns.barplot(
+                        data=df_plot,
+                        x="counts",
+                        y="group",
+                        palette=colors,
+                        saturation=1,
+                        left=0,
+                        orient="h",
+                        ax=ax,
+                    )
+
+            else:
+                # 0.8 is the default width of plt.bar, with factions shifted apart by a bar.
+                bar_locations = 0.8 * np.arange(total_groups) - 0.4
+                bar_locations += 0.8 * np.repeat(
+                    np.arange(len(faction_sizes)), faction_sizes
+                )
+
+                scaled_colors = utils.desaturated_colors(colors=colors, dsat=dsat)
 
-                ax.barh(y=bar_locations, width=flat_counts, color=scaled_colors)
+                ax.barh(y=bar_locations, width=values, color=scaled_colors)
 
-                factioned_bar_locations = utils.gen_list_of_lists(
-                    bar_locations, [len(f) for f in counts]
+                y_label_locs = (
+                    utils.sum_groups(values=bar_locations, offsets=offsets)
+                    / faction_sizes
                 )
-                y_label_locs = [np.mean(f) for f in factioned_bar_locations]
 
                 ax.set_yticks(ticks=y_label_locs)
                 ax.set_yticklabels(labels=faction_labels, rotation=90)
                 ax.tick_params(axis="y", grid_linewidth=0)
 
+            profiling.checkpoint("artists")
+
             if label_bars:
-                for p in ax.patches:
+                widths = [p.get_width() for p in ax.patches]
+                width_strs = utils.format_numbers(widths)
+                # Every label_step-th bar of flat counts is labeled, as with the group ticks.
+                label_step = 1
+                if not factioned:
+                    label_step = _label_step(
+                        ax=ax,
+                        label_strs=width_strs,
+                        num_slots=total_groups,
+                        horizontal=True,
+                        font_size=plt.rcParams["font.size"],
+                    )
+
+                for p, width, width_str in zip(
+                    ax.patches[::label_step],
+                    widths[::label_step],
+                    width_strs[::label_step],
+                ):
                     ax.text(
-                        x=p.get_width() + 1,
+                        x=width + 1,
                         y=p.get_y() + p.get_height() / 2,
-                        s=str(utils.round_if_int(p.get_width())),
+                        s=width_str,
                         ha="center",
                     )
 
     else:
         if stacked:
-            if list not in [type(i) for i in counts]:
-                for i in df_plot.index:
-                    ax = sns.barplot(
-                        data=pd.DataFrame(df_plot.loc[i]).T,
-                        x="group",
-                        y="counts",
-                        color=colors[i],
-                        saturation=dsat,
-                        bottom=bar_starts[i],
-                        orient="v",
-                        ax=axis,
-                    )
+            if not factioned:
+                # All segments are drawn as one collection at the single category position.
+                _draw_stacked_segments(
+                    ax=ax,
+                    values=values,
+                    colors=desaturate_patches(colors=colors, dsat=dsat),
+                    horizontal=False,
+                )
+                ax.set(xlabel="group", ylabel="counts", xlim=(-0.5, 0.5))
+                ax.xaxis.grid(False)
 
             else:
-                pivot_plot = (
-                    df_plot.pivot(columns="group", index="faction", values="counts")
-                    .fillna(0)
-                    .reindex(faction_labels)
-                )
-                pivot_plot = pivot_plot[labels]
-                colors = [
-                    utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat)
-                    for c in colors
-                ]
+                colors = utils.desaturated_colors(colors=colors, dsat=dsat)
+
+                if backend == "lean":
+                    _draw_stacked_faction_bars(
+                        ax=ax,
+                        values=values,
+                        offsets=offsets,
+                        faction_labels=faction_labels,
+                        colors=colors,
+                        horizontal=False,
+                        grid=plt.rcParams["axes.grid"],
+                    )
+
+                else:
+                    pivot_plot = (
+                        df_plot.pivot(columns="group", index="faction", values="counts")
+                        .fillna(0)
+                        .reindex(faction_labels)
+                    )
+                    pivot_plot = pivot_plot[labels]
+                    pivot_plot.plot.bar(stacked=True, color=colors, rot=0, ax=ax)
+
+                ax.grid(None, axis="x")
 
-                ax = pivot_plot.plot.bar(stacked=True, color=colors, rot=0)
-                plt.grid(b=None, axis="x")
+            profiling.checkpoint("artists")
 
             if label_bars:
-                if list not in [type(i) for i in counts]:
-                    label_text = str(utils.round_if_int(sum(counts)))
-                    label_position = sum([p.get_height() for p in ax.patches]) + 1
+                if not factioned:
+                    label_text = utils.format_numbers([values.sum()])[0]
 
-                    ax.text(
-                        x=ax.patches[0].get_x() + ax.patches[0].get_width() / 2.0,
-                        y=label_position,
-                        s=label_text,
-                        ha="center",
-                    )
+                    # The bar is centered at 0 on the category axis.
+                    ax.text(x=0, y=values.sum() + 1, s=label_text, ha="center")
 
                 else:
                     faction_start_idxs = list(set([p.get_x() for p in ax.patches]))
 
-                    for i, c in enumerate(counts):
-                        label_text = str(utils.round_if_int(sum(c)))
-                        label_position = sum(c) + 1
+                    faction_total_strs = utils.format_numbers(faction_totals)
+                    for i, faction_total in enumerate(faction_totals):
+                        label_text = faction_total_strs[i]
+                        label_position = faction_total + 1
 
                         ax.text(
                             x=faction_start_idxs[i]
@@ -307,72 +657,99 @@ def bar(
                         )
 
         else:
-            if list not in [type(i) for i in counts]:
-                colors = [
-                    utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat)
-                    for c in colors
-                ]
-                sns.set_palette(colors)
-                ax = sns.barplot(
-                    data=df_plot,
-                    x="group",
-                    y="counts",
-                    saturation=1,
-                    bottom=0,
-                    orient="v",
-                    ax=axis,
-                )
+            if not factioned:
+                colors = utils.desaturated_colors(colors=colors, dsat=dsat)
+                if backend == "lean":
+                    _draw_categorical_bars(
+                        ax=ax,
+                        values=values,
+                        labels=labels,
+                        colors=colors,
+                        horizontal=False,
+                        tick_step=tick_step,
+                    )
 
-            else:
-                flat_counts = [item for sublist in counts for item in sublist]
-
-                bar_positions = [
-                    0.8 * i - 0.4 for i in list(range(0, len(flat_counts)))
-                ]  # 0.8 is the default width of plt.bar
-                bar_shifts = [[0.8 * i] * len(c) for i, c in enumerate(counts)]
-                flat_bar_shifts = [item for sublist in bar_shifts for item in sublist]
-                bar_locations = [
-                    p + flat_bar_shifts[i] for i, p in enumerate(bar_positions)
-                ]
-
-                scaled_colors = [
-                    utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat)
-                    for c in colors
-                ]
-
-                if axis:
-                    ax = axis
                 else:
-                    ax = plt.subplots()[1]
+                    ax = sns.barplot(
+                        data=df_plot,
+                        x="group",
+                        y="counts",
+                        palette=colors,
+                        saturation=1,
+                        bottom=0,
+                        orient="v",
+                        ax=ax,
+                    )
 
-                ax.bar(x=bar_locations, height=flat_counts, color=scaled_colors)
+            else:
+                # 0.8 is the default width of plt.bar, with factions shifted apart by a bar.
+                bar_locations = 0.8 * np.arange(total_groups) - 0.4
+                bar_locations += 0.8 * np.repeat(
+                    np.arange(len(faction_sizes)), faction_sizes
+                )
+
+                scaled_colors = utils.desaturated_colors(colors=colors, dsat=dsat)
 
-                factioned_bar_locations = utils.gen_list_of_lists(
-                    bar_locations, [len(f) for f in counts]
+                ax.bar(x=bar_locations, height=values, color=scaled_colors)
+
+                x_label_locs = (
+                    utils.sum_groups(values=bar_locations, offsets=offsets)
+                    / faction_sizes
                 )
-                x_label_locs = [np.mean(f) for f in factioned_bar_locations]
 
                 ax.set_xticks(ticks=x_label_locs)
                 ax.set_xticklabels(labels=faction_labels)
                 ax.tick_params(axis="x", grid_linewidth=0)
 
+            profiling.checkpoint("artists")
+
             if label_bars:
-                for p in ax.patches:
+                heights = [p.get_height() for p in ax.patches]
+                height_strs = utils.format_numbers(heights)
+                # Every label_step-th bar of flat counts is labeled, as with the group ticks.
+                label_step = 1
+                if not factioned:
+                    label_step = _label_step(
+                        ax=ax,
+                        label_strs=height_strs,
+                        num_slots=total_groups,
+                        horizontal=False,
+                        font_size=plt.rcParams["font.size"],
+                    )
+
+                for p, height, height_str in zip(
+                    ax.patches[::label_step],
+                    heights[::label_step],
+                    height_strs[::label_step],
+                ):
                     ax.text(
                         x=p.get_x() + p.get_width() / 2.0,
-                        y=p.get_height() + 1,
-                        s=str(utils.round_if_int(p.get_height())),
+                        y=height + 1,
+                        s=height_str,
                         ha="center",
                     )
 
-    if (stacked and list not in [type(i) for i in counts]) or (
-        not labels and not faction_labels
-    ):
+    if rasterized:
+        utils.rasterize_artists(ax, start_counts)
+
+    if (stacked and not factioned) or (not labels and not faction_labels):
         if horizontal:
             ax.axes.get_yaxis().set_ticks([])
         else:
             ax.axes.get_xaxis().set_ticks([])
 
+    elif backend == "seaborn" and tick_step > 1:
+        tick_positions = bar_positions(values)[0][::tick_step]
+        tick_labels = labels[::tick_step]
+        if horizontal:
+            ax.set_yticks(tick_positions)
+            ax.set_yticklabels(tick_labels)
+        else:
+            ax.set_xticks(tick_positions)
+            ax.set_xticklabels(tick_labels)
+
+    profiling.checkpoint("labels")
+
     if ax.get_legend():
         ax.get_legend().remove()
 
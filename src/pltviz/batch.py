@@ -0,0 +1,170 @@
+"""
+Batch Rendering
+---------------
+
+Functions for rendering many charts to files across a process pool
+
+Contents:
+    render_chart,
+    render_batch
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+chart_kinds = ["bar", "comp_line", "gini", "pie", "semipie"]
+
+# The figure that each worker process reuses for all of its charts.
+_worker_figure = None
+
+
+def _init_worker(figsize, dpi):
+    """
+    Creates the persistent Agg figure of a worker process.
+    """
+    global _worker_figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    _worker_figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(_worker_figure)
+
+
+def _clear_figure(figure):
+    """
+    Clears a reused figure, including the subplot parameters that tight_layout sets.
+    """
+    from matplotlib import rcParams
+
+    figure.clear()
+    figure.subplotpars.update(
+        *[
+            rcParams[f"figure.subplot.{param}"]
+            for param in ["left", "bottom", "right", "top", "wspace", "hspace"]
+        ]
+    )
+
+
+def _validate_spec(spec):
+    """
+    Checks that a chart spec can be rendered before it's sent to a worker.
+    """
+    assert (
+        spec.get("kind") in chart_kinds
+    ), f"The 'kind' of each chart spec must be one of {chart_kinds}."
+    assert "path" in spec, "Each chart spec must have a 'path' to save the chart to."
+
+
+def render_chart(spec, figure=None):
+    """
+    Renders a single chart spec to its output file on a reused figure.
+
+    Parameters
+    ----------
+        spec : dict
+            The chart to render with keys:
+                kind : str
+                    The pltviz function to plot with (see chart_kinds).
+
+                kwargs : dict : optional
+                    Keyword arguments for the plotting function, not including axis.
+
+                path : str or path-like
+                    Where the chart should be saved.
+
+                format : str : optional
+                    The file format, otherwise derived from the path.
+
+        figure : matplotlib.figure.Figure : optional (default=None)
+            The figure to draw on, which is cleared before and after the chart.
+
+            Note: a worker's persistent figure or a new Agg figure is used if not passed.
+
+    Returns
+    -------
+        result : dict
+            The path and kind of the chart, the seconds it took and an error message or None.
+    """
+    import pltviz
+
+    _validate_spec(spec)
+
+    if figure is None:
+        if _worker_figure is None:
+            _init_worker(figsize=None, dpi=None)
+        figure = _worker_figure
+
+    start = time.perf_counter()
+    error = None
+    try:
+        _clear_figure(figure)
+        plot_function = getattr(pltviz, spec["kind"])
+        plot_function(**spec.get("kwargs", {}), axis=figure.add_subplot())
+        figure.savefig(spec["path"], format=spec.get("format"))
+
+    except Exception as e:  # reported per chart so the rest of the batch is rendered
+        error = f"{type(e).__name__}: {e}"
+
+    finally:
+        _clear_figure(figure)
+
+    return {
+        "path": spec["path"],
+        "kind": spec["kind"],
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def render_batch(specs, max_workers=None, max_pending=None, figsize=None, dpi=None):
+    """
+    Renders chart specs across a process pool, yielding results as charts finish.
+
+    Parameters
+    ----------
+        specs : iterable (contains dicts)
+            The charts to render (see render_chart), which are consumed lazily.
+
+        max_workers : int : optional (default=None)
+            The number of worker processes, with None being the number of CPUs.
+
+        max_pending : int : optional (default=None)
+            The most charts that are submitted but not yet returned, with None being 4 per worker.
+
+        figsize : tuple : optional (default=None)
+            The size of the figure of each worker in inches.
+
+        dpi : float : optional (default=None)
+            The resolution of the figure of each worker.
+
+    Returns
+    -------
+        results : generator (contains dicts)
+            The result of each chart in order of completion (see render_chart).
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_pending is None:
+        max_pending = 4 * max_workers
+
+    assert max_pending >= 1, "The 'max_pending' argument must be at least 1."
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(figsize, dpi)
+    ) as executor:
+        pending = set()
+        for spec in specs:
+            _validate_spec(spec)
+            pending.add(executor.submit(render_chart, spec))
+
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -3,18 +3,77 @@
 ---------------------
 
 Contents:
+    pivot_dependent_col,
     comp_line
 """
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+import numpy as np
 
-from pltviz import utils
+from pltviz import profiling, utils
 
 default_sat = 0.95
 
 
+def pivot_dependent_col(df, dependent_col, indep_stats, group_col):
+    """
+    Pivots a single column of values split across groups into a column per baseline stat.
+
+    Parameters
+    ----------
+        df : pd.DataFrame
+            Dataframe that contains statistics to be compared.
+
+        dependent_col : str
+            The column in df which should be compared.
+
+        indep_stats : str
+            The df column with the baseline stats that generated dependent_col.
+
+        group_col : str
+            The name of the column in which groups are defined.
+
+    Returns
+    -------
+        df_new, new_dep_cols, new_indep_stats : pd.DataFrame, list (contains strs), list (contains ints or floats)
+            A dataframe with a row per group and the values for each sorted baseline stat as columns,
+            the names of these columns, and the unique baseline stats in order of appearance.
+
+            Note: values are assigned in order of appearance in each group, in reverse if the baseline stats were already sorted.
+    """
+    import pandas as pd
+
+    new_indep_stats = [utils.round_if_int(float(s)) for s in df[indep_stats].unique()]
+    # Sort the baseline stats, as they're likely years, so objective is a
+    # graph that's increasing in time.
+    sorted_nbs = sorted(new_indep_stats)
+
+    new_dep_cols = [str(s) + "_" + dependent_col for s in sorted_nbs]
+
+    # Positions of the values within their group, with groups in order of appearance.
+    location_codes, locations = pd.factorize(df[group_col])
+    positions = df.groupby(location_codes, sort=False).cumcount().to_numpy()
+
+    assert (
+        np.bincount(location_codes, minlength=len(locations)) == len(new_dep_cols)
+    ).all(), "Each group in 'group_col' must have one value for each unique value of 'indep_stats'."
+
+    # Derive whether it already was sorted to know how to order the value assignment.
+    if sorted_nbs == new_indep_stats:
+        positions = len(new_dep_cols) - 1 - positions
+
+    dep_values = df[dependent_col].to_numpy()
+    pivoted_values = np.empty(
+        (len(locations), len(new_dep_cols)), dtype=dep_values.dtype
+    )
+    pivoted_values[location_codes, positions] = dep_values
+
+    df_new = pd.DataFrame(data=pivoted_values, columns=new_dep_cols)
+    df_new.insert(loc=0, column="locations", value=locations)
+
+    return df_new, new_dep_cols, new_indep_stats
+
+
+@profiling.profiled
 def comp_line(
     df=None,
     dependent_cols=None,
@@ -23,7 +82,12 @@ def comp_line(
     colors=None,
     stacked=False,
     percent=False,
+    line_collection=False,
+    alpha=None,
+    decimate=None,
     dsat=default_sat,
+    backend="seaborn",
+    rasterized=False,
     axis=None,
 ):
     """
@@ -54,9 +118,30 @@ def comp_line(
         percent : bool (default=False)
             Whether the y-axis should depict relative amounts or not.
 
+        line_collection : bool : optional (default=False)
+            Whether to draw the lines of a non-stacked plot as a single collection rather than a seaborn plot per row.
+
+                Note: this is much faster for plots with many groups and gives the same result.
+
+        alpha : float : optional (default=None)
+            The transparency of the lines of a non-stacked plot.
+
+        decimate : int : optional (default=None)
+            Only draw every decimate-th baseline stat of the lines of a non-stacked plot, always keeping the last.
+
         dsat : float : optional (default=default_sat)
             The degree of desaturation to be applied to the colors.
 
+        backend : str : optional (default="seaborn")
+            Whether to draw with seaborn or only matplotlib ("lean").
+
+                Note: both backends give the same plot, with the lean one not importing seaborn.
+
+        rasterized : bool : optional (default=False)
+            Whether to rasterize the lines or stacked areas in vector outputs, keeping text and axes as vectors.
+
+            Note: rasterized artists are drawn at the dpi passed to savefig.
+
         axis : str : optional (default=None)
             Adds an axis to plots so they can be combined.
 
@@ -65,22 +150,31 @@ def comp_line(
         ax : matplotlib.pyplot.subplot
             A line plot that shows the shifts in group allocations given seat limits.
     """
-    if colors == None:
-        sns.set_palette("deep")  # default sns palette
-        colors = [
-            utils.rgb_to_hex(c) for c in sns.color_palette(n_colors=len(df), desat=1)
-        ]
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    from matplotlib.collections import LineCollection
+
+    profiling.checkpoint("imports")
+
+    assert backend in [
+        "seaborn",
+        "lean",
+    ], "The 'backend' argument must be 'seaborn' or 'lean'."
+    profiling.checkpoint("validation")
+
+    if colors is None:
+        colors = utils.default_colors(num_colors=len(df))
 
     if isinstance(colors, (str, tuple)):
         colors = [colors]
 
     # Check to see if colors haven't been formatted in a prior recursive step.
-    if not isinstance(colors[0], tuple):
-        colors = [
-            utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=default_sat)
-            for c in colors
-        ]
-    sns.set_palette(colors)
+    if isinstance(colors[0], tuple):
+        colors = np.array(colors)
+    elif not isinstance(colors, np.ndarray):
+        colors = utils.desaturated_colors(colors=colors, dsat=default_sat)
+
+    profiling.checkpoint("palette")
 
     df_copy = df.copy()
 
@@ -96,35 +190,13 @@ def comp_line(
             ), "The 'group_col' argument must be passed if providing a single comparison column."
 
             # Create a similar form to the other path's df and recursively run this function.
-            new_indep_stats = [
-                utils.round_if_int(float(s)) for s in df_copy[indep_stats].unique()
-            ]
-            # Sort the baseline stats, as they're likely years, so objective is a
-            # graph that's increasing in time.
-            sorted_nbs = sorted(new_indep_stats)
-
-            # Derive whether it already was sorted to know how to order the value assignment.
-            was_sorted = sorted_nbs == new_indep_stats
-            if was_sorted == True:
-                was_sorted = -1
-            else:
-                was_sorted = 1
-
-            new_dep_cols = [str(s) + "_" + dependent_cols for s in sorted_nbs]
-
-            df_cols = ["locations"] + new_dep_cols
-
-            df_new = pd.DataFrame(columns=df_cols)
-            df_new["locations"] = df_copy[group_col].unique()
-
-            for lctn in df_new["locations"]:
-                df_new.loc[
-                    df_new[df_new["locations"] == lctn].index, new_dep_cols
-                ] = df_copy.loc[
-                    df_copy[df_copy[group_col] == lctn].index, dependent_cols
-                ].values[
-                    ::was_sorted
-                ]
+            df_new, new_dep_cols, new_indep_stats = pivot_dependent_col(
+                df=df_copy,
+                dependent_col=dependent_cols,
+                indep_stats=indep_stats,
+                group_col=group_col,
+            )
+            profiling.checkpoint("pivot")
 
             return comp_line(
                 df=df_new,
@@ -133,47 +205,103 @@ def comp_line(
                 colors=colors,
                 stacked=stacked,
                 percent=percent,
+                line_collection=line_collection,
+                alpha=alpha,
+                decimate=decimate,
                 dsat=dsat,
+                backend=backend,
+                rasterized=rasterized,
                 axis=axis,
             )
 
         else:
-            ValueError(
+            raise ValueError(
                 "The 'dependent_cols' argument does not contain column labels for the provided dataframe."
             )
 
+    if axis:
+        ax = axis
+    elif stacked:
+        ax = plt.subplots()[1]
+    else:
+        ax = plt.gca()
+
+    start_counts = utils.count_artists(ax)
+    profiling.checkpoint("figure")
+
     if percent == True:
-        for col in dependent_cols:
-            df_copy[col] = df_copy[col] / sum(df_copy[col])
+        dependent_values = df_copy[dependent_cols]
+        df_copy[dependent_cols] = dependent_values / dependent_values.sum(axis=0)
 
     if stacked:
-        lol_allocations = []
-        for i in df_copy.index:
-            list_of_allocations = []
-            for col in dependent_cols:
-                list_of_allocations.append(df_copy.loc[i, col])
+        # Rows are the stacked series and columns their values at each baseline stat.
+        allocations = df_copy[dependent_cols].to_numpy()
+        profiling.checkpoint("data")
 
-            lol_allocations.append(list_of_allocations)
-
-        if axis:
-            ax = axis  # to mirror seaborn axis plotting
-        else:
-            ax = plt.subplots()[1]
-        print(indep_stats)
-        print(lol_allocations)
-        ax.stackplot(indep_stats, lol_allocations)
+        ax.stackplot(
+            indep_stats,
+            allocations,
+            colors=colors[np.arange(len(allocations)) % len(colors)],
+        )
 
     else:
         if isinstance(dependent_cols, str):
             dependent_cols = [dependent_cols]
-        for i in df_copy.index:
-            ax = sns.lineplot(
-                x=indep_stats, y=list(df_copy.loc[i, dependent_cols].values), ax=axis
+
+        x_values = np.asarray(indep_stats)
+        y_values = df_copy[dependent_cols].to_numpy()
+        if decimate:
+            # Thin the baselines in ascending order, as they're plotted.
+            x_order = np.argsort(x_values, kind="stable")
+            kept = x_order[::decimate]
+            if kept[-1] != x_order[-1]:
+                kept = np.append(kept, x_order[-1])
+
+            x_values, y_values = x_values[kept], y_values[:, kept]
+
+        # Sort by the baseline stats as seaborn does, and cycle the colors as the palette would.
+        x_order = np.argsort(x_values, kind="stable")
+        line_colors = colors[np.arange(len(y_values)) % len(colors)]
+        profiling.checkpoint("data")
+
+        if line_collection:
+            lines = np.empty((len(y_values), len(x_order), 2))
+            lines[:, :, 0] = x_values[x_order]
+            lines[:, :, 1] = y_values[:, x_order]
+
+            ax.add_collection(
+                LineCollection(
+                    segments=lines,
+                    colors=line_colors,
+                    linewidths=plt.rcParams["lines.linewidth"],
+                    capstyle=plt.rcParams["lines.solid_capstyle"],
+                    joinstyle=plt.rcParams["lines.solid_joinstyle"],
+                    alpha=alpha,
+                )
             )
+            ax.autoscale_view()
+
+        elif backend == "lean":
+            for y, color in zip(y_values, line_colors):
+                ax.plot(x_values[x_order], y[x_order], color=color, alpha=alpha)
+
+        else:
+            import seaborn as sns
+
+            for y, color in zip(y_values, line_colors):
+                sns.lineplot(
+                    x=list(x_values), y=list(y), color=color, alpha=alpha, ax=ax
+                )
+
+    if rasterized:
+        utils.rasterize_artists(ax, start_counts)
+
+    profiling.checkpoint("artists")
 
     if percent == True:
         ax.set_ylim([0, 1])
 
     ax.set_xlim([min(indep_stats), max(indep_stats)])
+    profiling.checkpoint("layout")
 
     return ax
@@ -3,54 +3,136 @@
 ---------------
 
 Contents:
+    gini_coefficient,
     gini
 """
 
 import numpy as np
-import seaborn as sns
-from matplotlib import pyplot as plt
+
+from pltviz import profiling, utils
 
 default_sat = 0.95
 
 
-def gini(shares=None, dsat=default_sat, axis=None):
+def _lorenz_curves(shares):
+    """
+    Derives the Lorenz curves of shares without their starting 0, sorting a copy of them once.
+    """
+    lorenz = np.sort(np.asarray(shares, dtype=np.float64), axis=-1)
+    totals = lorenz.sum(axis=-1, keepdims=True)
+
+    assert (
+        np.isclose(totals, 1) | np.isclose(totals, 100)
+    ).all(), "The 'shares' argument must sum to 100 or 1."
+
+    np.cumsum(lorenz, axis=-1, out=lorenz)
+    lorenz /= totals
+
+    return lorenz
+
+
+def _gini_from_lorenz(lorenz):
+    """
+    Derives Gini coefficients from the exact trapezoid areas under Lorenz curves.
     """
-    Produces a semicircle plot of shares or allocations.
+    # Trapezoids with width 1 / n from (0, 0) through each point of the curve.
+    area_under_lorenz = (
+        lorenz[..., :-1].sum(axis=-1) + lorenz[..., -1] / 2
+    ) / lorenz.shape[-1]
+
+    # The line of perfect equality has an area of 1/2.
+    return 1 - 2 * area_under_lorenz
+
+
+def gini_coefficient(shares):
+    """
+    Computes the Gini coefficient of shares or allocations.
 
     Parameters
     ----------
-        shares : list (contains ints or floats)
-            The data to be plotted.
+        shares : list or np.ndarray (contains ints or floats)
+            The shares, which must sum to 100 or 1 and can be unsorted.
+
+            Note: the rows of a 2D array are treated as separate distributions.
+
+    Returns
+    -------
+        gini : float or np.ndarray
+            The Gini coefficient, or an array of them for each row of a 2D array.
+    """
+    gini = _gini_from_lorenz(_lorenz_curves(shares))
+
+    return gini if gini.ndim else float(gini)
+
+
+@profiling.profiled
+def gini(shares=None, dsat=default_sat, backend="seaborn", rasterized=False, axis=None):
+    """
+    Produces a Lorenz curve plot of shares or allocations against perfect equality.
+
+    Parameters
+    ----------
+        shares : list or np.ndarray (contains ints or floats)
+            The data to be plotted, which must sum to 100 or 1.
+
+            Note: shares are sorted for the Lorenz curve, and the caller's shares are not modified.
 
         dsat : float : optional (default=default_sat)
             The degree of desaturation to be applied to the colors.
 
+        backend : str : optional (default="seaborn")
+            Whether to draw with seaborn or only matplotlib ("lean").
+
+        rasterized : bool : optional (default=False)
+            Whether to rasterize the curves and the area between them in vector outputs, keeping text and axes as vectors.
+
+            Note: rasterized artists are drawn at the dpi passed to savefig.
+
         axis : str : optional (default=None)
             Adds an axis to plots so they can be combined.
 
     Returns
     -------
         ax, gini : matplotlib.pyplot.subplot, float
-            A gini plot of dispropotionality and the area under the Lorenz curve.
+            A gini plot of dispropotionality and the Gini coefficient (see gini_coefficient).
     """
-    if sum(shares) != 1:
-        shares = [s / 100 for s in shares]
+    from matplotlib import pyplot as plt
 
-        assert sum(shares) == 1, "The 'shares' argument must sum to 100 or 1."
+    profiling.checkpoint("imports")
 
-    shares.insert(0, 0)
+    assert backend in [
+        "seaborn",
+        "lean",
+    ], "The 'backend' argument must be 'seaborn' or 'lean'."
+    profiling.checkpoint("validation")
 
-    shares_cumsum = np.cumsum(a=shares, axis=None)
+    lorenz = _lorenz_curves(shares)
+    assert lorenz.ndim == 1, "Only a single distribution of 'shares' can be plotted."
+
+    shares_cumsum = np.concatenate([[0], lorenz])
     pe_line = np.linspace(start=0.0, stop=1.0, num=len(shares_cumsum))
+    profiling.checkpoint("allocation")
+
+    ax = axis if axis else plt.gca()
+    start_counts = utils.count_artists(ax)
+    profiling.checkpoint("figure")
+
+    if backend == "lean":
+        ax.plot(pe_line, shares_cumsum)
+        ax.plot(pe_line, pe_line)
+
+    else:
+        import seaborn as sns
 
-    area_under_lorenz = np.trapz(y=shares_cumsum, dx=1 / len(shares_cumsum))
-    area_under_pe = np.trapz(y=pe_line, dx=1 / len(shares_cumsum))
+        sns.lineplot(x=pe_line, y=shares_cumsum, ax=ax)
+        sns.lineplot(x=pe_line, y=pe_line, ax=ax)
+    ax.fill_between(pe_line, shares_cumsum)
+    if rasterized:
+        utils.rasterize_artists(ax, start_counts)
 
-    gini = (area_under_pe - area_under_lorenz) / area_under_pe
+    profiling.checkpoint("artists")
 
-    ax = sns.lineplot(x=pe_line, y=shares_cumsum, ax=axis)
-    ax = sns.lineplot(x=pe_line, y=pe_line, ax=axis)
-    plt.fill_between(pe_line, shares_cumsum)
-    plt.tight_layout()
+    ax.figure.tight_layout()
+    profiling.checkpoint("layout")
 
-    return ax, gini
+    return ax, float(_gini_from_lorenz(lorenz))
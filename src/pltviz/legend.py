@@ -9,10 +9,6 @@
     gen_elements
 """
 
-import pandas as pd
-import seaborn as sns
-from matplotlib.lines import Line2D
-
 from pltviz import utils
 
 default_sat = 0.95
@@ -41,16 +37,19 @@ def gen_handles(colors=None, size=10, marker="o", dsat=default_sat):
         lgnd_handles : list (countains unplotted 2D lines)
             A list of lines, the handles of which can be used for more advanced plots.
     """
+    from matplotlib.lines import Line2D
+
     if isinstance(colors, str):
         colors = [colors]
     elif colors is None:
-        sns.set_palette("deep")  # default sns palette
-        colors = [utils.rgb_to_hex(c) for c in sns.color_palette()]
+        colors = utils.default_colors(palette=utils.deep_palette)
 
     # Marker edge colors are the same as legend boarder unless transparent RGBA.
+    transparent = [(len(c) == 9) and (c[-2:] == "00") for c in colors]
     marker_edge_colors = [
-        c if (len(c) == 9) and (c[-2:] == "00") else "#D2D2D3" for c in colors
+        c if transparent[i] else "#D2D2D3" for i, c in enumerate(colors)
     ]
+    marker_face_colors = utils.desaturated_colors(colors=colors, dsat=dsat)
 
     return [
         Line2D(
@@ -61,7 +60,7 @@ def gen_handles(colors=None, size=10, marker="o", dsat=default_sat):
             markersize=size,
             markeredgecolor=marker_edge_colors[i],
             markeredgewidth=size / 10,
-            markerfacecolor=utils.scale_saturation(rgb_trip=c, sat=dsat),
+            markerfacecolor=c if transparent[i] else marker_face_colors[i],
         )
         for i, c in enumerate(colors)
     ]
@@ -114,8 +113,7 @@ def gen_elements(
     if isinstance(colors, str):
         colors = [colors]
     elif colors is None:
-        sns.set_palette("deep")  # default sns palette
-        colors = [utils.rgb_to_hex(c) for c in sns.color_palette()]
+        colors = utils.default_colors(palette=utils.deep_palette)
 
     colors_copy = colors[:]
 
@@ -129,13 +127,14 @@ def gen_elements(
         labels_copy = None
 
         if counts is not None:
-            if isinstance(counts, pd.Series):
-                counts = list(counts)
+            if hasattr(counts, "tolist"):  # np.ndarray and pd.Series
+                counts = counts.tolist()
 
             if list in [type(item) for item in counts]:
                 counts = [item for sublist in counts for item in sublist]
 
-            counts_copy = counts[:]
+            # Counts are formatted at once and then ordered and padded as strs.
+            counts_copy = utils.format_numbers(counts)
 
         if labels is not None:
             labels_copy = labels[:]
@@ -171,13 +170,11 @@ def gen_elements(
 
         if (counts_copy is not None) and (labels_copy is not None):
             lgnd_labels = [
-                f"{labels_copy[i]}: {c}" if c != None else ""
+                f"{labels_copy[i]}: {c}" if c is not None else ""
                 for i, c in enumerate(counts_copy)
             ]
         elif counts_copy is not None:
-            lgnd_labels = [
-                f"{c}" if c != None else "" for i, c in enumerate(counts_copy)
-            ]
+            lgnd_labels = [c if c is not None else "" for c in counts_copy]
         elif labels_copy is not None:
             lgnd_labels = [
                 f"{lbl}" if lbl != None else "" for i, lbl in enumerate(labels_copy)
@@ -0,0 +1,402 @@
+"""
+Live Plots
+----------
+
+Classes for plots that keep their artists and are updated in place with new counts
+
+Contents:
+    LivePie,
+    LiveSemipie,
+    LiveBar
+"""
+
+import numpy as np
+
+from pltviz import utils
+from pltviz.bar import bar, bar_positions, stacked_segment_verts
+from pltviz.pie import _group_labels, pie
+from pltviz.semipie import semipie
+
+default_sat = 0.95
+
+
+def _flat_values(counts, num_groups=None):
+    """
+    Normalizes the counts of a live plot, which can't have factions or change their number of groups.
+    """
+    values, offsets = utils.normalize_counts(counts)
+    assert (
+        offsets is None
+    ), "Live plots can only be made for flat counts without factions."
+    if num_groups is not None:
+        assert (
+            len(values) == num_groups
+        ), "The number of counts can't change when updating a live plot."
+
+    return values
+
+
+class LivePie:
+    """
+    A donut plot of group shares or allocations that's updated in place.
+
+    Parameters
+    ----------
+        counts : list, np.ndarray or pd.Series (contains ints or floats)
+            The initial data to be plotted.
+
+            Note: factions aren't supported, as the sections of their ring depend on the counts.
+
+        labels : list : optional (default=None; contains strs)
+            The labels of the groups.
+
+        colors : list : optional (default=None)
+            The colors of the groups as hex keys.
+
+        radius : float : optional (default=1)
+            The size of the plot.
+
+        donut_ratio : float (default=1, a full circle)
+            The ratio of the center radius of a donut to the whole.
+
+        display_labels : bool : optional (default=False)
+            Whether to display the labels of the groups.
+
+        display_counts : bool : optional (default=False)
+            Whether to display the counts of the groups.
+
+        label_font_size : int (default=20)
+            The size of the text in the labels.
+
+        dsat : float : optional (default=default_sat)
+            The degree of desaturation to be applied to the colors.
+
+        axis : str : optional (default=None)
+            Adds an axis to plots so they can be combined.
+
+    Attributes
+    ----------
+        ax : matplotlib.axes.Axes
+            The axis of the plot (see pie).
+
+        wedges, texts : list (contains matplotlib.patches.Wedge), list (contains matplotlib.text.Text)
+            The wedges and labels of the groups.
+    """
+
+    def __init__(
+        self,
+        counts,
+        labels=None,
+        colors=None,
+        radius=1,
+        donut_ratio=1,
+        display_labels=False,
+        display_counts=False,
+        label_font_size=20,
+        dsat=default_sat,
+        axis=None,
+    ):
+        import matplotlib.pyplot as plt
+
+        values = _flat_values(counts)
+        self.labels = labels
+        self.radius = radius
+        self.display_labels = display_labels
+        self.display_counts = display_counts
+
+        self.ax = axis if axis else plt.subplots(1, 1)[1]
+        num_patches = utils.count_artists(self.ax)[0]
+        num_texts = len(self.ax.texts)
+        pie(
+            counts=values,
+            labels=labels,
+            colors=colors,
+            radius=radius,
+            donut_ratio=donut_ratio,
+            display_labels=display_labels,
+            display_counts=display_counts,
+            label_font_size=label_font_size,
+            dsat=dsat,
+            axis=self.ax,
+        )
+        self.wedges = self.ax.patches[num_patches:]
+        self.texts = self.ax.texts[num_texts:]
+
+    @property
+    def artists(self):
+        """
+        The artists that are changed by updates, for example to be blitted.
+        """
+        return self.wedges + self.texts
+
+    def update(self, counts):
+        """
+        Changes the wedge angles and label text and positions to those of new counts.
+
+        Parameters
+        ----------
+            counts : list, np.ndarray or pd.Series (contains ints or floats)
+                The new data, with as many groups as the initial counts.
+
+        Returns
+        -------
+            artists : list (contains matplotlib.artist.Artist)
+                The updated artists, as FuncAnimation expects with blitting.
+        """
+        values = _flat_values(counts, num_groups=len(self.wedges))
+
+        return self._draw_frame(values=values, thetas=utils.section_thetas(values))
+
+    def _draw_frame(self, values, thetas):
+        """
+        Sets the wedges to the given angles and labels them with the given values.
+        """
+        labels = _group_labels(
+            values=values,
+            labels=self.labels,
+            display_labels=self.display_labels,
+            display_counts=self.display_counts,
+        )
+
+        # Labels are placed as matplotlib.axes.Axes.pie places them.
+        label_angles = np.deg2rad((thetas[:-1] + thetas[1:]) / 2)
+        label_xs = 1.1 * self.radius * np.cos(label_angles)
+        label_ys = 1.1 * self.radius * np.sin(label_angles)
+        for i, (wedge, text) in enumerate(zip(self.wedges, self.texts)):
+            wedge.set_theta1(thetas[i])
+            wedge.set_theta2(thetas[i + 1])
+
+            text.set_position((label_xs[i], label_ys[i]))
+            text.set_horizontalalignment("left" if label_xs[i] > 0 else "right")
+            text.set_text(labels[i])
+
+        return self.artists
+
+
+class LiveSemipie:
+    """
+    A semicircle plot of group shares or allocations that's updated in place.
+
+    Parameters
+    ----------
+        counts : list, np.ndarray or pd.Series (contains ints or floats)
+            The initial data to be plotted.
+
+        colors : list : optional (default=None)
+            The colors of the groups as hex keys.
+
+        donut_ratio : float (default=1, a full semicircle)
+            The ratio of the center radius of a donut to the whole.
+
+        dsat : float : optional (default=default_sat)
+            The degree of desaturation to be applied to the colors.
+
+        axis : str : optional (default=None)
+            Adds an axis to plots so they can be combined.
+
+    Attributes
+    ----------
+        ax : matplotlib.axes.Axes
+            The axis of the plot (see semipie).
+
+        collection : matplotlib.collections.PatchCollection
+            The collection of the wedges of the groups.
+    """
+
+    def __init__(self, counts, colors=None, donut_ratio=1, dsat=default_sat, axis=None):
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Wedge
+
+        values = _flat_values(counts)
+
+        self.ax = axis if axis else plt.subplots()[1]
+        num_collections = len(self.ax.collections)
+        semipie(
+            counts=values,
+            colors=colors,
+            donut_ratio=donut_ratio,
+            dsat=dsat,
+            axis=self.ax,
+        )
+        self.collection = self.ax.collections[num_collections]
+
+        # Unplotted wedges from which the paths of the collection are derived.
+        self._wedges = [
+            Wedge(center=(0, 0), r=1, theta1=0, theta2=0, width=donut_ratio)
+            for _ in range(len(values))
+        ]
+
+    @property
+    def artists(self):
+        """
+        The artists that are changed by updates, for example to be blitted.
+        """
+        return [self.collection]
+
+    def update(self, counts):
+        """
+        Changes the wedge angles to those of new counts.
+
+        Parameters
+        ----------
+            counts : list, np.ndarray or pd.Series (contains ints or floats)
+                The new data, with as many groups as the initial counts.
+
+        Returns
+        -------
+            artists : list (contains matplotlib.artist.Artist)
+                The updated artists, as FuncAnimation expects with blitting.
+        """
+        values = _flat_values(counts, num_groups=len(self._wedges))
+
+        return self._draw_frame(
+            thetas=utils.section_thetas(values, start_angle=180, end_angle=0)
+        )
+
+    def _draw_frame(self, thetas):
+        """
+        Sets the wedges to the given angles.
+        """
+        for i, wedge in enumerate(self._wedges):
+            wedge.set_theta1(thetas[i + 1])
+            wedge.set_theta2(thetas[i])
+
+        self.collection.set_paths(self._wedges)
+        self.collection.stale = True
+
+        return self.artists
+
+
+class LiveBar:
+    """
+    A bar plot of group counts that's updated in place.
+
+    Parameters
+    ----------
+        counts : list, np.ndarray or pd.Series (contains ints or floats)
+            The initial data to be plotted.
+
+            Note: factions aren't supported.
+
+        labels : list : optional (default=None; contains strs)
+            The labels of the groups.
+
+        colors : list : optional (default=None)
+            The colors of the groups as hex keys.
+
+        horizontal : bool : optional (default=False)
+            Whether the plot should be horizontal.
+
+        stacked : bool : optional (default=False)
+            Whether the outputs should be stacked.
+
+        label_bars : bool : optional (default=False)
+            Whether or not to label the bars with their heights (or widths).
+
+        dsat : float : optional (default=default_sat)
+            The degree of desaturation to be applied to the colors.
+
+        axis : str : optional (default=None)
+            Adds an axis to plots so they can be combined.
+
+    Attributes
+    ----------
+        ax : matplotlib.axes.Axes
+            The axis of the plot (see bar).
+
+        bars, texts : list (contains matplotlib.patches.Rectangle), list (contains matplotlib.text.Text)
+            The bars of the groups and their labels.
+
+            Note: stacked bars have a single matplotlib.collections.PolyCollection of their segments as bars.
+
+            Note: the axis limits aren't changed by updates so that the plot can be blitted.
+    """
+
+    def __init__(
+        self,
+        counts,
+        labels=None,
+        colors=None,
+        horizontal=False,
+        stacked=False,
+        label_bars=False,
+        dsat=default_sat,
+        axis=None,
+    ):
+        import matplotlib.pyplot as plt
+
+        values = _flat_values(counts)
+        self.horizontal = horizontal
+        self.stacked = stacked
+
+        self.ax = axis if axis else plt.gca()
+        num_patches, num_collections = utils.count_artists(self.ax)[:2]
+        num_texts = len(self.ax.texts)
+        bar(
+            counts=values,
+            labels=labels,
+            colors=colors,
+            horizontal=horizontal,
+            stacked=stacked,
+            label_bars=label_bars,
+            max_groups=None,
+            dsat=dsat,
+            backend="lean",
+            axis=self.ax,
+        )
+        self.num_groups = len(values)
+        if stacked:
+            self.bars = self.ax.collections[num_collections:]
+        else:
+            self.bars = self.ax.patches[num_patches:]
+        self.texts = self.ax.texts[num_texts:]
+
+    @property
+    def artists(self):
+        """
+        The artists that are changed by updates, for example to be blitted.
+        """
+        return self.bars + self.texts
+
+    def update(self, counts):
+        """
+        Changes the bar lengths and label text and positions to those of new counts.
+
+        Parameters
+        ----------
+            counts : list, np.ndarray or pd.Series (contains ints or floats)
+                The new data, with as many groups as the initial counts.
+
+        Returns
+        -------
+            artists : list (contains matplotlib.artist.Artist)
+                The updated artists, as FuncAnimation expects with blitting.
+        """
+        values = _flat_values(counts, num_groups=self.num_groups)
+
+        if self.stacked:
+            self.bars[0].set_verts(
+                stacked_segment_verts(values, horizontal=self.horizontal)
+            )
+
+        else:
+            starts = bar_positions(values)[1]
+            for rect, start, value in zip(self.bars, starts, values):
+                if self.horizontal:
+                    rect.set_x(start)
+                    rect.set_width(value)
+                else:
+                    rect.set_y(start)
+                    rect.set_height(value)
+
+        # Stacked bars have a single label of their total.
+        label_values = values.sum(keepdims=True) if self.stacked else values
+        label_strs = utils.format_numbers(label_values)
+        for text, value, label_str in zip(self.texts, label_values, label_strs):
+            if self.horizontal:
+                text.set_x(value + 1)
+            else:
+                text.set_y(value + 1)
+            text.set_text(label_str)
+
+        return self.artists
@@ -3,19 +3,110 @@
 --------
 
 Contents:
+    gradient_ring_mesh,
     pie
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-from colormath.color_objects import sRGBColor
-from poli_sci_kit.appointment.methods import highest_averages
+import numpy as np
 
-from pltviz import utils
+from pltviz import profiling, utils
 
 default_sat = 0.95
 
 
+def gradient_ring_mesh(
+    values, offsets, rgb_array, outer_radius, inner_radius, max_quad_angle=10
+):
+    """
+    Derives the vertices and vertex colors of a ring of factions that are gradients between the colors of their groups.
+
+    Parameters
+    ----------
+        values : np.ndarray (contains ints or floats)
+            The counts of the groups.
+
+        offsets : np.ndarray (contains ints)
+            The start index of each faction followed by len(values) (see utils.normalize_counts).
+
+        rgb_array : np.ndarray (shape=(len(values), 3))
+            The RGB ratios of the colors of the groups.
+
+        outer_radius, inner_radius : float
+            The radii of the ring.
+
+        max_quad_angle : float : optional (default=10)
+            The most degrees that a quadrilateral of the mesh spans.
+
+    Returns
+    -------
+        coordinates, vertex_colors : np.ndarray (shape=(2, n_points, 2)), np.ndarray (shape=(2 * n_points, 3))
+            The inner and outer vertices of the mesh, starting at 0 degrees and going counterclockwise, and their colors.
+
+            Note: the mesh's straight edges extend past the outer radius so that it covers the ring once clipped to it.
+
+            Note: the factions don't share vertices, so colors change sharply between them.
+    """
+    faction_totals = utils.sum_groups(values=values, offsets=offsets)
+    faction_ends = 2 * np.pi * np.cumsum(faction_totals) / faction_totals.sum()
+    faction_starts = np.concatenate([[0], faction_ends[:-1]])
+
+    faction_angles, faction_colors = [], []
+    for i, (start, end) in enumerate(zip(faction_starts, faction_ends)):
+        if end <= start:
+            continue
+
+        colors = rgb_array[offsets[i] : offsets[i + 1]]
+        if len(colors) == 1:
+            # A sole group is a gradient from its color to itself.
+            colors = np.repeat(colors, 2, axis=0)
+
+        # Colors are given at the ends of the gradients between consecutive groups.
+        gradient_shares = utils.gradient_shares(values[offsets[i] : offsets[i + 1]])
+        color_angles = start + (end - start) * np.concatenate(
+            [[0], np.cumsum(gradient_shares)]
+        )
+        color_angles[-1] = end
+
+        num_arc_points = int(np.ceil(np.degrees(end - start) / max_quad_angle)) + 1
+        angles = np.union1d(np.linspace(start, end, num_arc_points), color_angles)
+
+        faction_angles.append(angles)
+        faction_colors.append(
+            np.stack(
+                [np.interp(angles, color_angles, colors[:, c]) for c in range(3)],
+                axis=1,
+            )
+        )
+
+    angles = np.concatenate(faction_angles)
+    unit_arc = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+    # The chords between outer vertices come closest to the center at half their angle.
+    mesh_outer_radius = outer_radius / np.cos(np.radians(max_quad_angle) / 2)
+    coordinates = np.stack([inner_radius * unit_arc, mesh_outer_radius * unit_arc])
+
+    return coordinates, np.tile(np.concatenate(faction_colors), (2, 1))
+
+
+def _group_labels(values, labels, display_labels, display_counts):
+    """
+    Derives the text of the inner ring's group labels.
+    """
+    if labels is None:
+        return [f"group_{i}" for i in range(len(values))]
+
+    if not display_labels:
+        return [""] * len(values)
+
+    if display_counts:
+        count_strs = utils.format_numbers(values)
+        return [f"{lbl}: {c}" for lbl, c in zip(labels, count_strs)]
+
+    # Remove labels for those that have 0 counts to avoid confusion.
+    return [lbl if c > 0 else "" for lbl, c in zip(labels, values.tolist())]
+
+
+@profiling.profiled
 def pie(
     counts,
     labels=None,
@@ -27,7 +118,9 @@ def pie(
     display_labels=False,
     display_counts=False,
     label_font_size=20,
+    mesh_outer_ring=False,
     dsat=default_sat,
+    rasterized=False,
     axis=None,
 ):
     """
@@ -35,11 +128,13 @@ def pie(
 
     Parameters
     ----------
-        counts : list or list of lists (contains ints or floats)
+        counts : list, list of lists, np.ndarray, pd.Series or tuple (contains ints or floats)
             The data to be plotted.
 
             Note: a list of lists produces a two layer plot where sublists define factions.
 
+            Note: 2D arrays and utils.GroupedCounts also define factions (see utils.normalize_counts).
+
         labels : list : optional (default=None; contains strs)
             The labels of the groups.
 
@@ -71,9 +166,19 @@ def pie(
         label_font_size : int (default=20)
             The size of the text in the labels.
 
+        mesh_outer_ring : bool : optional (default=False)
+            Whether to draw the faction ring as one mesh with its gradients interpolated between vertices rather than outer_ring_density wedges.
+
+                Note: the mesh and its labels don't depend on outer_ring_density, and only the faction labels are drawn as text.
+
         dsat : float : optional (default=default_sat)
             The degree of desaturation to be applied to the colors.
 
+        rasterized : bool : optional (default=False)
+            Whether to rasterize the wedges of the rings in vector outputs, keeping text and axes as vectors.
+
+            Note: rasterized artists are drawn at the dpi passed to savefig.
+
         axis : str : optional (default=None)
             Adds an axis to plots so they can be combined.
 
@@ -82,198 +187,227 @@ def pie(
         ax : matplotlib.pyplot.subplot
             A donut plot that depicts shares or allocations (potentially including factions).
     """
+    import matplotlib.pyplot as plt
+    from colormath.color_objects import sRGBColor
+    from matplotlib.artist import setp
+    from matplotlib.collections import QuadMesh
+    from matplotlib.patches import Wedge
+
+    profiling.checkpoint("imports")
+
+    values, offsets = utils.normalize_counts(counts)
+
     if faction_labels:
         assert (
-            list(set([type(count) for count in counts]))[0] == list
-            and len(set([type(count) for count in counts])) == 1
+            offsets is not None
         ), "If plotting groups and their factions, then the 'counts' argument must be a list of lists, where sublists are group counts in the given faction."
 
-    if (
-        list(set([type(count) for count in counts]))[0] == list
-        and len(set([type(count) for count in counts])) == 1
-    ):
+    if offsets is not None:
         assert (
             faction_labels
         ), "A list of lists has been provided for 'counts', implying that factions should also be represented, but no labels for the factions have been provided."
 
-    if list in [type(item) for item in counts]:
-        total_groups = len([item for sublist in counts for item in sublist])
-    else:
-        total_groups = len(counts)
+    total_groups = len(values)
 
     if colors:
         assert (
             len(colors) == total_groups
         ), "The number of colors provided doesn't match the number of counts to be displayed."
 
-    elif colors == None:
-        sns.set_palette("deep")  # default sns palette
-        colors = [
-            utils.rgb_to_hex(c)
-            for c in sns.color_palette(n_colors=total_groups, desat=1)
-        ]
+    profiling.checkpoint("validation")
 
-    colors = [
-        utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat) for c in colors
-    ]
-    colors = [utils.rgb_to_hex(c) for c in colors]
+    colors = utils.desaturated_colors(
+        colors=colors, num_colors=total_groups, dsat=dsat, as_hex=True
+    )
+    profiling.checkpoint("palette")
 
     if axis:
         ax = axis  # to mirror seaborn axis plotting
     else:
         ax = plt.subplots(1, 1)[1]
 
-    if faction_labels:
-        faction_counts = [sum(sub_list) for sub_list in counts]
-
-        # Indexes for later colors.
-        group_indexes = list(range(total_groups))
-        factioned_indexes = utils.gen_list_of_lists(
-            original_list=group_indexes,
-            new_structure=[len(sublist) for sublist in counts],
-        )
-
-        # Outer sections to be colored and determined by outer_ring_density.
-        outer_ring_sections = [1 for i in range(outer_ring_density)]
+    start_counts = utils.count_artists(ax)
+    profiling.checkpoint("figure")
 
-        # Convert colors to rgb and classify them into factions.
-        rgb_colors = [utils.hex_to_rgb(c) for c in colors]
-        faction_colors = [
-            [rgb_colors[i] for i in sublist] for sublist in factioned_indexes
+    if faction_labels:
+        faction_counts = [
+            utils.round_if_int(c)
+            for c in utils.sum_groups(values=values, offsets=offsets).tolist()
         ]
+        faction_count_strs = utils.format_numbers(faction_counts)
+
+        outer_radius = radius + (0.2 * radius)
+
+        if mesh_outer_ring:
+            # Draw the outer ring as one mesh with the gradients interpolated between
+            # vertices, so that its cost doesn't depend on outer_ring_density.
+            coordinates, vertex_colors = gradient_ring_mesh(
+                values=values,
+                offsets=offsets,
+                rgb_array=utils.hex_to_rgb_array(colors),
+                outer_radius=outer_radius,
+                inner_radius=outer_radius - 0.3 * radius,
+            )
+            profiling.checkpoint("palette")
+
+            outer_ring = QuadMesh(
+                coordinates,
+                shading="gouraud",
+                facecolors=vertex_colors,
+                edgecolors="none",
+                linewidths=0,
+            )
+            ax.add_collection(outer_ring, autolim=False)
+            outer_ring.set_clip_path(
+                Wedge(
+                    center=(0, 0),
+                    r=outer_radius,
+                    theta1=0,
+                    theta2=360,
+                    width=0.3 * radius,
+                    transform=ax.transData,
+                )
+            )
 
-        # Use the Jefferson highest_averages method divide the outer ring
-        # based on the proportions of the factions.
-        faction_sections = highest_averages(
-            shares=faction_counts, total_alloc=len(outer_ring_sections)
-        )
-
-        outer_ring_colors = []
-        for faction_index in range(len(faction_labels)):
-            # Use the Jefferson highest_averages method again to allocate
-            # the faction's outer ring sections to colors.
-            # This would contain allocations for len(counts[faction_index]) colors,
-            # but there are len(counts[faction_index])-1 gradients.
-            # Thus average over Jefferson highest_averages allocations when
-            # each element is removed for appropriately weighted gradients.
-            if len(counts[faction_index]) == 1:
-                averaged_allocations = [faction_sections[faction_index]]
-            else:
-                one_removed_allocations = [
-                    highest_averages(
-                        shares=counts[faction_index][:i]
-                        + counts[faction_index][i + 1 :],
-                        total_alloc=faction_sections[faction_index],
-                    )
-                    for i in range(len(counts[faction_index]))
-                ]
-                averaged_allocations = [
-                    sum(
-                        [
-                            sub_allocation[i]
-                            for sub_allocation in one_removed_allocations
-                        ]
+            labels = [""] * total_groups
+            if display_labels:
+                # Faction labels are placed in the middle of their arcs as ax.pie places them.
+                faction_middles = (
+                    np.cumsum(faction_counts) - np.array(faction_counts) / 2
+                )
+                for i, f_lbl in enumerate(faction_labels):
+                    label_angle = 2 * np.pi * faction_middles[i] / sum(faction_counts)
+                    label_x = 1.1 * outer_radius * np.cos(label_angle)
+
+                    ax.text(
+                        x=label_x,
+                        y=1.1 * outer_radius * np.sin(label_angle),
+                        s=(
+                            f"{f_lbl}: {faction_count_strs[i]}"
+                            if display_counts
+                            else f_lbl
+                        ),
+                        clip_on=False,
+                        ha="left" if label_x > 0 else "right",
+                        va="center",
+                        fontsize=label_font_size,
                     )
-                    / len(one_removed_allocations)
-                    for i in range(len(one_removed_allocations[0]))
-                ]
 
-            averaged_allocations = [round(i) for i in averaged_allocations]
+            else:
+                label_font_size = 0
 
-            # Correct in case of rounding errors.
-            if sum(averaged_allocations) < faction_sections[faction_index]:
-                averaged_allocations[0] += faction_sections[faction_index] - sum(
-                    averaged_allocations
-                )
-            elif sum(averaged_allocations) > faction_sections[faction_index]:
-                averaged_allocations[0] -= faction_sections[faction_index] - sum(
-                    averaged_allocations
+        else:
+            # Outer sections to be colored and determined by outer_ring_density.
+            outer_ring_sections = [1 for i in range(outer_ring_density)]
+
+            # Classify colors into factions.
+            faction_colors = [
+                colors[offsets[i] : offsets[i + 1]] for i in range(len(offsets) - 1)
+            ]
+
+            # Use the Jefferson highest averages method to divide the outer ring
+            # based on the proportions of the factions.
+            faction_sections = utils.allocate_sections(
+                shares=faction_counts, total_alloc=len(outer_ring_sections)
+            )
+            profiling.checkpoint("allocation")
+
+            outer_ring_colors = []
+            for faction_index in range(len(faction_labels)):
+                # Allocate the faction's outer ring sections to the gradients
+                # between its colors.
+                averaged_allocations = utils.allocate_gradient_sections(
+                    shares=values[offsets[faction_index] : offsets[faction_index + 1]],
+                    total_alloc=faction_sections[faction_index],
                 )
 
-            if len(faction_colors[faction_index]) == 1:
-                # Assign sole group's color via a monochrome gradient.
-                outer_ring_colors.append(
-                    utils.create_color_palette(
-                        start_rgb=faction_colors[faction_index][0],
-                        end_rgb=faction_colors[faction_index][0],
-                        num_colors=averaged_allocations[0],
-                        colorspace=sRGBColor,
-                    )
-                )
-            else:
-                # Create a gradient mix of the faction colors for the section
-                # of the outer ring.
-                for color_index in range(len(faction_colors[faction_index]))[:-1]:
+                if len(faction_colors[faction_index]) == 1:
+                    # Assign sole group's color via a monochrome gradient.
                     outer_ring_colors.append(
                         utils.create_color_palette(
-                            start_rgb=faction_colors[faction_index][color_index],
-                            end_rgb=faction_colors[faction_index][color_index + 1],
-                            num_colors=averaged_allocations[color_index],
+                            start_rgb=faction_colors[faction_index][0],
+                            end_rgb=faction_colors[faction_index][0],
+                            num_colors=averaged_allocations[0],
                             colorspace=sRGBColor,
                         )
                     )
-
-        outer_ring_colors = [item for sublist in outer_ring_colors for item in sublist]
-
-        # Flatten counts for the inner ring and labelling.
-        counts = [item for sublist in counts for item in sublist]
-
-        if display_labels:
-            outer_ring_labels = []
-            labels = [""] * len(counts)
-            # Place labels in the middle of the faction's arc, and make the others blank.
-            factions_index = 0
-            label_index = faction_counts[factions_index] / 2  # in the middle
-            for i in range(outer_ring_density):
-                if i == round(label_index / sum(faction_counts) * outer_ring_density):
-                    if display_counts:
-                        outer_ring_labels.append(
-                            f"{faction_labels[factions_index]}: {faction_counts[factions_index]}"
-                        )
-                    else:
-                        outer_ring_labels.append(faction_labels[factions_index])
-
-                    factions_index += 1
-                    if factions_index < len(faction_counts):
-                        label_index += faction_counts[factions_index - 1] / 2
-                        label_index += faction_counts[factions_index] / 2
                 else:
-                    outer_ring_labels.append("")
-
-        else:
-            label_font_size = 0
-            outer_ring_labels = [""] * outer_ring_density
-            labels = [""] * len(counts)
-
-        outer_ring, _ = ax.pie(
-            x=outer_ring_sections,
-            radius=radius + (0.2 * radius),
-            labels=outer_ring_labels,
-            colors=outer_ring_colors,
-            textprops={"fontsize": label_font_size},
-        )
-        plt.setp(obj=outer_ring, width=0.3 * radius, linewidth=0)
-
-    if labels == None:
-        labels = [f"group_{i}" for i in range(len(counts))]
+                    # Create a gradient mix of the faction colors for the section
+                    # of the outer ring.
+                    for color_index in range(len(faction_colors[faction_index]))[:-1]:
+                        outer_ring_colors.append(
+                            utils.create_color_palette(
+                                start_rgb=faction_colors[faction_index][color_index],
+                                end_rgb=faction_colors[faction_index][color_index + 1],
+                                num_colors=averaged_allocations[color_index],
+                                colorspace=sRGBColor,
+                            )
+                        )
 
-    else:
-        if display_counts:
-            labels = [f"{lbl}: {counts[i]}" for i, lbl in enumerate(labels)]
-        else:
-            # Remove labels for those that have 0 counts to avoid confusion.
-            labels = [lbl if counts[i] > 0 else "" for i, lbl in enumerate(labels)]
+            outer_ring_colors = [
+                item for sublist in outer_ring_colors for item in sublist
+            ]
+            profiling.checkpoint("palette")
+
+            if display_labels:
+                outer_ring_labels = []
+                labels = [""] * total_groups
+                # Place labels in the middle of the faction's arc, and make the others blank.
+                factions_index = 0
+                label_index = faction_counts[factions_index] / 2  # in the middle
+                for i in range(outer_ring_density):
+                    if i == round(
+                        label_index / sum(faction_counts) * outer_ring_density
+                    ):
+                        if display_counts:
+                            outer_ring_labels.append(
+                                f"{faction_labels[factions_index]}: {faction_count_strs[factions_index]}"
+                            )
+                        else:
+                            outer_ring_labels.append(faction_labels[factions_index])
+
+                        factions_index += 1
+                        if factions_index < len(faction_counts):
+                            label_index += faction_counts[factions_index - 1] / 2
+                            label_index += faction_counts[factions_index] / 2
+                    else:
+                        outer_ring_labels.append("")
 
-        if not display_labels:
-            labels = [""] * len(counts)
+            else:
+                label_font_size = 0
+                outer_ring_labels = [""] * outer_ring_density
+                labels = [""] * total_groups
+
+            outer_ring, _ = ax.pie(
+                x=outer_ring_sections,
+                radius=outer_radius,
+                labels=outer_ring_labels,
+                colors=outer_ring_colors,
+                textprops={"fontsize": label_font_size},
+            )
+            setp(obj=outer_ring, width=0.3 * radius, linewidth=0)
+
+        profiling.checkpoint("artists")
+
+    labels = _group_labels(
+        values=values,
+        labels=labels,
+        display_labels=display_labels,
+        display_counts=display_counts,
+    )
+    profiling.checkpoint("labels")
 
     inner_ring, _ = ax.pie(
-        x=counts,
+        x=values,
         radius=radius,
         labels=labels,
         colors=colors,
         textprops={"fontsize": label_font_size},
     )
-    plt.setp(obj=inner_ring, width=radius * donut_ratio, edgecolor="white")
+    setp(obj=inner_ring, width=radius * donut_ratio, edgecolor="white")
+    if rasterized:
+        utils.rasterize_artists(ax, start_counts)
+
+    profiling.checkpoint("artists")
 
     return ax
@@ -0,0 +1,232 @@
+"""
+Profiling
+---------
+
+Functions for recording how long each phase of the plotting functions takes
+
+Profiling is opt-in, either for the calls in a profile context or for all calls
+if the PLTVIZ_PROFILE environment variable is set to a value other than 0.
+Each call of a profiled function that isn't nested in another produces a record:
+    {"function": str, "seconds": float, "phases": {phase: seconds}}
+
+Time after a call's last checkpoint is recorded as the phase "other".
+
+Contents:
+    profile,
+    add_callback,
+    remove_callback,
+    checkpoint,
+    profiled,
+    summarize,
+    format_record
+"""
+
+import contextlib
+import contextvars
+import functools
+import os
+import sys
+import time
+import warnings
+
+env_var = "PLTVIZ_PROFILE"
+
+enabled_by_env = os.environ.get(env_var, "0") not in ["", "0"]
+
+# The records list and callback of the innermost profile context.
+_session = contextvars.ContextVar("pltviz_profiling_session", default=None)
+
+# The record of the profiled call in progress and the time of its last checkpoint.
+_current = contextvars.ContextVar("pltviz_profiling_current", default=None)
+
+_callbacks = []
+
+
+@contextlib.contextmanager
+def profile(callback=None):
+    """
+    Records the phases of the profiled calls made within the context.
+
+    Parameters
+    ----------
+        callback : callable : optional (default=None)
+            A function that's passed each record as it's made, for example to send it to a metrics system.
+
+    Returns
+    -------
+        records : list (contains dicts)
+            The records of the calls, which are appended to as they finish.
+
+            Note: calls in other threads aren't recorded unless they're run in a copy of this context.
+    """
+    records = []
+    token = _session.set((records, callback))
+    try:
+        yield records
+
+    finally:
+        _session.reset(token)
+
+
+def add_callback(callback):
+    """
+    Registers a function that's passed every record that's made.
+
+    Parameters
+    ----------
+        callback : callable
+            A function that takes a record.
+    """
+    _callbacks.append(callback)
+
+
+def remove_callback(callback):
+    """
+    Unregisters a function that was passed to add_callback.
+
+    Parameters
+    ----------
+        callback : callable
+            A registered function.
+    """
+    _callbacks.remove(callback)
+
+
+def checkpoint(name):
+    """
+    Records the time since the last checkpoint or the start of the profiled call as a phase.
+
+    Parameters
+    ----------
+        name : str
+            The phase that just ended, with times for repeated names being summed.
+    """
+    current = _current.get()
+    if current is None:
+        return
+
+    now = time.perf_counter()
+    phases = current[0]["phases"]
+    phases[name] = phases.get(name, 0.0) + now - current[1]
+    current[1] = now
+
+
+def profiled(func):
+    """
+    Decorates a plotting function so that its calls are recorded when profiling.
+
+    Parameters
+    ----------
+        func : callable
+            A function that marks its phases with checkpoint.
+
+    Returns
+    -------
+        wrapper : callable
+            The function, which is called directly if profiling is disabled or it's nested in a profiled call.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        session = _session.get()
+        if (session is None and not enabled_by_env) or _current.get() is not None:
+            return func(*args, **kwargs)
+
+        start = time.perf_counter()
+        record = {"function": func.__name__, "seconds": None, "phases": {}}
+        current = [record, start]
+        token = _current.set(current)
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            _current.reset(token)
+            end = time.perf_counter()
+            record["phases"]["other"] = (
+                record["phases"].get("other", 0.0) + end - current[1]
+            )
+            record["seconds"] = end - start
+            _emit(record, session)
+
+    return wrapper
+
+
+def _emit(record, session):
+    """
+    Passes a finished record to the profile context and callbacks, or to stderr if there are neither.
+    """
+    if session is not None:
+        records, callback = session
+        records.append(record)
+        if callback is not None:
+            _call_callback(callback, record)
+
+    for callback in list(_callbacks):
+        _call_callback(callback, record)
+
+    if session is None and not _callbacks:
+        print(format_record(record), file=sys.stderr)
+
+
+def _call_callback(callback, record):
+    """
+    Passes a record to a callback, warning about rather than raising its errors so plots aren't affected.
+    """
+    try:
+        callback(record)
+
+    except Exception as e:
+        warnings.warn(
+            f"The profiling callback {callback!r} raised {type(e).__name__}: {e}",
+            RuntimeWarning,
+        )
+
+
+def summarize(records):
+    """
+    Totals the calls and phase times of records by function.
+
+    Parameters
+    ----------
+        records : list (contains dicts)
+            Records of profiled calls.
+
+    Returns
+    -------
+        summary : dict
+            The number of calls, total seconds and total seconds per phase of each function.
+    """
+    summary = {}
+    for record in records:
+        totals = summary.setdefault(
+            record["function"], {"calls": 0, "seconds": 0.0, "phases": {}}
+        )
+        totals["calls"] += 1
+        totals["seconds"] += record["seconds"]
+        for phase, seconds in record["phases"].items():
+            totals["phases"][phase] = totals["phases"].get(phase, 0.0) + seconds
+
+    return summary
+
+
+def format_record(record):
+    """
+    Formats a record as a line of text.
+
+    Parameters
+    ----------
+        record : dict
+            The record of a profiled call.
+
+    Returns
+    -------
+        record_str : str
+            The function, total milliseconds and milliseconds of each phase.
+    """
+    phase_strs = ", ".join(
+        f"{phase} {seconds * 1e3:.2f}" for phase, seconds in record["phases"].items()
+    )
+
+    return (
+        f"pltviz.{record['function']} {record['seconds'] * 1e3:.2f} ms ({phase_strs})"
+    )
@@ -0,0 +1,105 @@
+"""
+Rendering
+---------
+
+Functions for rendering charts to bytes or arrays without pyplot's figure registry
+
+Charts are drawn on standalone Agg figures that are freed once they're no longer
+referenced, so there's no need to close them. Encoded charts are written into a
+buffer that each thread reuses.
+
+Contents:
+    render
+"""
+
+import io
+import threading
+
+from pltviz.batch import chart_kinds
+
+outputs = ["bytes", "memoryview"]
+
+# The buffer that each thread reuses to encode its charts.
+_local = threading.local()
+
+
+def _thread_buffer():
+    """
+    Returns the calling thread's buffer, or a new one if a memoryview of the last chart is still held.
+    """
+    buffer = getattr(_local, "buffer", None)
+    if buffer is not None:
+        try:
+            # Resizing in place fails while a memoryview of the buffer exists.
+            buffer.truncate(buffer.seek(0, io.SEEK_END))
+            buffer.seek(0)
+
+            return buffer
+
+        except BufferError:
+            pass
+
+    _local.buffer = io.BytesIO()
+
+    return _local.buffer
+
+
+def render(kind, format="png", output="bytes", figsize=None, dpi=None, **kwargs):
+    """
+    Renders a chart on a standalone Agg figure, returning the encoded file or its pixels.
+
+    Parameters
+    ----------
+        kind : str
+            The pltviz function to plot with (see batch.chart_kinds).
+
+        format : str : optional (default="png")
+            The file format to encode, such as "png", "svg" or "pdf", or "rgba" for the pixels.
+
+        output : str : optional (default="bytes")
+            Whether encoded charts are returned as "bytes" or as a "memoryview" of the thread's buffer.
+
+            Note: a memoryview is only valid until the thread's next render, and releasing it lets the buffer be reused.
+
+        figsize : tuple : optional (default=None)
+            The size of the figure in inches.
+
+        dpi : float : optional (default=None)
+            The resolution of the figure.
+
+        **kwargs : keyword arguments
+            Arguments for the plotting function, not including axis.
+
+    Returns
+    -------
+        chart : bytes, memoryview or np.ndarray (shape=(height, width, 4), dtype=np.uint8)
+            The encoded chart, or for "rgba" a view of the figure's pixels without a copy.
+    """
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    import pltviz
+
+    assert kind in chart_kinds, f"The 'kind' argument must be one of {chart_kinds}."
+    assert output in outputs, f"The 'output' argument must be one of {outputs}."
+    assert "axis" not in kwargs, "Charts are rendered on their own axis."
+
+    figure = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    getattr(pltviz, kind)(**kwargs, axis=figure.add_subplot())
+
+    if format == "rgba":
+        canvas.draw()
+
+        # The array keeps the renderer that owns the pixels alive.
+        return np.asarray(canvas.buffer_rgba())
+
+    buffer = _thread_buffer()
+    figure.savefig(buffer, format=format)
+    buffer.truncate()
+
+    if output == "memoryview":
+        return buffer.getbuffer()
+
+    return buffer.getvalue()
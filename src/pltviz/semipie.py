@@ -6,25 +6,27 @@
     semipie
 """
 
-import matplotlib.patches as mpatches
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.collections import PatchCollection
+import numpy as np
 
-from pltviz import utils
+from pltviz import profiling, utils
 
 default_sat = 0.95
 
 
-def semipie(counts, colors=None, donut_ratio=1, dsat=default_sat, axis=None):
+@profiling.profiled
+def semipie(
+    counts, colors=None, donut_ratio=1, dsat=default_sat, rasterized=False, axis=None
+):
     """
     Produces a semicircle plot of shares or allocations.
 
     Parameters
     ----------
-        counts : list (contains ints or floats)
+        counts : list, np.ndarray, pd.Series or tuple (contains ints or floats)
             The data to be plotted.
 
+            Note: grouped counts (see utils.normalize_counts) are plotted as their flattened values.
+
         colors : list or list of lists : optional (default=None)
             The colors of the groups as hex keys.
 
@@ -34,6 +36,11 @@ def semipie(counts, colors=None, donut_ratio=1, dsat=default_sat, axis=None):
         dsat : float : optional (default=default_sat)
             The degree of desaturation to be applied to the colors.
 
+        rasterized : bool : optional (default=False)
+            Whether to rasterize the wedges in vector outputs, keeping text and axes as vectors.
+
+            Note: rasterized artists are drawn at the dpi passed to savefig.
+
         axis : str : optional (default=None)
             Adds an axis to plots so they can be combined.
 
@@ -42,33 +49,35 @@ def semipie(counts, colors=None, donut_ratio=1, dsat=default_sat, axis=None):
         ax : matplotlib.pyplot.subplot
             A semicircle plot that depicts shares or allocations.
     """
+    import matplotlib.patches as mpatches
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PatchCollection
+
+    profiling.checkpoint("imports")
+
+    values = utils.normalize_counts(counts)[0]
+
     if colors:
         assert len(colors) == len(
-            counts
+            values
         ), "The number of colors provided doesn't match the number of counts to be displayed."
 
-    elif colors == None:
-        sns.set_palette("deep")  # default sns palette
-        colors = [
-            utils.rgb_to_hex(c)
-            for c in sns.color_palette(n_colors=len(counts), desat=1)
-        ]
+    profiling.checkpoint("validation")
 
-    colors = [
-        utils.scale_saturation(rgb_trip=utils.hex_to_rgb(c), sat=dsat) for c in colors
-    ]
-    sns.set_palette(colors)
+    colors = utils.desaturated_colors(colors=colors, num_colors=len(values), dsat=dsat)
+    profiling.checkpoint("palette")
 
     if axis:
         ax = axis  # to mirror seaborn axis plotting
     else:
         ax = plt.subplots()[1]
 
+    profiling.checkpoint("figure")
+
     patches = []
-    thetas = [180 - (180 * sum(counts[:i]) / sum(counts)) for i in range(len(counts))]
-    thetas.append(0)
+    thetas = utils.section_thetas(values, start_angle=180, end_angle=0).tolist()
 
-    for i in range(len(counts)):
+    for i in range(len(values)):
         wedge = mpatches.Wedge(
             center=(0, 0),
             r=1,
@@ -81,10 +90,13 @@ def semipie(counts, colors=None, donut_ratio=1, dsat=default_sat, axis=None):
         patches.append(wedge)
 
     collection = PatchCollection(patches, match_original=True)
+    collection.set_rasterized(rasterized)
     ax.add_collection(collection)
+    profiling.checkpoint("artists")
 
-    plt.axis("equal")
-    plt.axis("off")
-    plt.tight_layout()
+    ax.axis("equal")
+    ax.axis("off")
+    ax.figure.tight_layout()
+    profiling.checkpoint("layout")
 
     return ax
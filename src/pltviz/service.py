@@ -0,0 +1,266 @@
+"""
+Rendering Service
+-----------------
+
+Classes and functions for rendering charts from asyncio code across a process pool
+
+Charts are rendered with rendering.render in worker processes that import pltviz
+and draw a chart when they start, so that the event loop isn't blocked and the
+first requests don't pay for imports and font loading.
+
+If a worker dies the pool is broken for all later charts, so it's replaced
+with a new pool and the charts that were in it raise BrokenProcessPool.
+
+Contents:
+    RenderService,
+    arender
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pltviz.batch import chart_kinds
+
+# The service that arender uses, which is created on its first call.
+_default_service = None
+
+
+def _init_worker():
+    """
+    Imports pltviz and renders a chart so that a worker process is warm before its first request.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    from pltviz import rendering
+
+    for kind in ["bar", "pie", "semipie"]:
+        rendering.render(kind, counts=[1, 2])
+
+
+def _render_chart(kind, format, kwargs):
+    """
+    Renders a chart in a worker process, returning bytes or an array that can be sent back.
+    """
+    from pltviz import rendering
+
+    return rendering.render(kind, format=format, output="bytes", **kwargs)
+
+
+def _ping():
+    """
+    Returns the worker's process id, which is submitted to start the workers of a pool.
+    """
+    return os.getpid()
+
+
+class RenderService:
+    """
+    Renders charts for asyncio code across a bounded pool of warm worker processes.
+
+    Parameters
+    ----------
+        max_workers : int : optional (default=None)
+            The number of worker processes, with None being the number of CPUs.
+
+        max_pending : int : optional (default=None)
+            The most charts that are submitted but not yet rendered, with None being 2 per worker.
+
+            Note: further requests wait for a slot, and a slot is only freed once its chart has stopped rendering.
+
+        timeout : float : optional (default=None)
+            The default seconds a request can wait and render for, with None being no limit.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None, timeout=None):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if max_pending is None:
+            max_pending = 2 * max_workers
+
+        assert max_workers >= 1, "The 'max_workers' argument must be at least 1."
+        assert max_pending >= 1, "The 'max_pending' argument must be at least 1."
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+
+        self._executor = self._new_executor()
+
+        # The number of times a broken pool has been replaced.
+        self.restarts = 0
+        # Semaphores are tied to the event loop that they're first used in.
+        self._loop = None
+        self._semaphore = None
+
+        # The number of charts holding a slot.
+        self.pending = 0
+
+    def _new_executor(self):
+        """
+        Creates a pool of worker processes that are warmed up as they start.
+        """
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=_init_worker
+        )
+
+    def _replace_executor(self, broken_executor):
+        """
+        Replaces a broken pool with a new one, unless another request has already done so.
+        """
+        if self._executor is broken_executor:
+            self._executor = self._new_executor()
+            self.restarts += 1
+            broken_executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        await self.start()
+
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def start(self):
+        """
+        Starts and warms up all worker processes.
+        """
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *[
+                loop.run_in_executor(self._executor, _ping)
+                for _ in range(self.max_workers)
+            ]
+        )
+
+    def _get_semaphore(self):
+        """
+        Returns the semaphore of the running event loop, creating one for a new loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+
+        return loop, self._semaphore
+
+    async def _submit(self, kind, format, kwargs):
+        """
+        Waits for a slot and renders a chart in a worker, holding the slot until the worker is done with it.
+        """
+        loop, semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        self.pending += 1
+
+        def release(_):
+            def release_slot():
+                self.pending -= 1
+                semaphore.release()
+
+            try:
+                loop.call_soon_threadsafe(release_slot)
+
+            except RuntimeError:  # the loop is closed
+                pass
+
+        executor = self._executor
+        try:
+            try:
+                future = executor.submit(_render_chart, kind, format, kwargs)
+
+            except BrokenProcessPool:
+                # A worker died since the last chart, so this one is sent to a new pool.
+                self._replace_executor(executor)
+                executor = self._executor
+                future = executor.submit(_render_chart, kind, format, kwargs)
+
+        except BaseException:
+            self.pending -= 1
+            semaphore.release()
+            raise
+
+        future.add_done_callback(release)
+
+        try:
+            # Cancelling the wrapper cancels the chart if a worker hasn't been sent it.
+            return await asyncio.wrap_future(future)
+
+        except BrokenProcessPool:
+            self._replace_executor(executor)
+            raise
+
+    async def render(self, kind, format="png", timeout=None, **kwargs):
+        """
+        Renders a chart in a worker process without blocking the event loop.
+
+        Parameters
+        ----------
+            kind : str
+                The pltviz function to plot with (see batch.chart_kinds).
+
+            format : str : optional (default="png")
+                The file format to encode, or "rgba" for the pixels (see rendering.render).
+
+            timeout : float : optional (default=None)
+                The seconds the request can wait and render for, with None being the service's timeout.
+
+            **kwargs : keyword arguments
+                Arguments for the plotting function and rendering.render.
+
+        Returns
+        -------
+            chart : bytes or np.ndarray
+                The encoded chart or its pixels.
+
+                Note: asyncio.TimeoutError is raised if the chart takes longer than the timeout, and BrokenProcessPool if a worker died while the chart was in the pool.
+        """
+        assert kind in chart_kinds, f"The 'kind' argument must be one of {chart_kinds}."
+
+        return await asyncio.wait_for(
+            self._submit(kind, format, kwargs),
+            timeout=self.timeout if timeout is None else timeout,
+        )
+
+    def close(self, wait=True):
+        """
+        Shuts down the worker processes.
+
+        Parameters
+        ----------
+            wait : bool : optional (default=True)
+                Whether to wait for submitted charts to finish.
+        """
+        self._executor.shutdown(wait=wait)
+
+    async def aclose(self):
+        """
+        Shuts down the worker processes without blocking the event loop.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+async def arender(kind, format="png", timeout=None, **kwargs):
+    """
+    Renders a chart in a shared RenderService without blocking the event loop.
+
+    Parameters
+    ----------
+        kind, format, timeout, **kwargs
+            Arguments for the chart (see RenderService.render).
+
+    Returns
+    -------
+        chart : bytes or np.ndarray
+            The encoded chart or its pixels.
+
+            Note: the shared service has the default arguments of RenderService and is shut down at exit.
+    """
+    global _default_service
+    if _default_service is None:
+        _default_service = RenderService()
+
+    return await _default_service.render(kind, format=format, timeout=timeout, **kwargs)
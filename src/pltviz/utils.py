@@ -16,22 +16,73 @@
 Contents:
     round_if_int,
     gen_list_of_lists,
+    GroupedCounts,
+    normalize_counts,
+    sum_groups,
+    section_thetas,
+    allocate_sections,
+    allocate_gradient_sections,
+    gradient_shares,
     add_num_commas,
+    format_numbers,
     hex_to_rgb,
     rgb_to_hex,
     scale_saturation,
+    hex_to_rgb_array,
+    rgb_array_to_hex,
+    rgb_to_hls_array,
+    hls_to_rgb_array,
+    scale_saturation_array,
     create_color_palette,
-    gen_random_colors
+    default_colors,
+    desaturated_colors,
+    palette_cache_info,
+    clear_palette_cache,
+    set_palette_cache_size,
+    gen_random_colors,
+    count_artists,
+    rasterize_artists
 """
 
+import collections
 import colorsys
+import functools
+import itertools
 from random import SystemRandom
 
-import matplotlib as mpl
 import numpy as np
-import seaborn as sns
-from colormath.color_conversions import convert_color
-from colormath.color_objects import sRGBColor
+
+# seaborn's "deep" palette.
+deep_palette = [
+    "#4c72b0",
+    "#dd8452",
+    "#55a868",
+    "#c44e52",
+    "#8172b3",
+    "#937860",
+    "#da8bc3",
+    "#8c8c8c",
+    "#ccb974",
+    "#64b5cd",
+]
+
+# The default palette for plots, being "deep" as seaborn returns it with desat=1.
+# The round trip through HLS leaves some channels just under their values, which rgb_to_hex truncates.
+default_palette = [
+    "#4c71b0",
+    "#dc8452",
+    "#55a868",
+    "#c44e51",
+    "#8171b3",
+    "#937860",
+    "#da8ac3",
+    "#8c8c8c",
+    "#ccb873",
+    "#63b4cd",
+]
+
+# The most desaturated palettes that are memoized, which is changed with set_palette_cache_size.
+palette_cache_size = 1024
 
 
 def round_if_int(val):
@@ -80,6 +131,263 @@ def gen_list_of_lists(original_list, new_structure):
     ]
 
 
+# Counts that are already normalized, with offsets=None for ungrouped values (see normalize_counts).
+GroupedCounts = collections.namedtuple("GroupedCounts", ["values", "offsets"])
+
+
+def normalize_counts(counts):
+    """
+    Converts counts into a flat array of values and the offsets of the groups they're in.
+
+    Parameters
+    ----------
+        counts : list, list of lists, np.ndarray, pd.Series or tuple (contains ints or floats)
+            The data to be plotted.
+
+            Note: sublists, tuples and the rows of 2D arrays define groups, and GroupedCounts are taken to already be normalized.
+
+    Returns
+    -------
+        grouped_counts : GroupedCounts
+            values : np.ndarray (dtype=float64)
+                The counts as a flat array.
+
+            offsets : np.ndarray (contains ints) or None
+                The start index of each group followed by len(values), or None if the counts aren't grouped.
+    """
+    if isinstance(counts, GroupedCounts):
+        values = np.asarray(counts.values, dtype=np.float64)
+        if counts.offsets is None:
+            return GroupedCounts(values.ravel(), None)
+
+        offsets = np.asarray(counts.offsets, dtype=np.intp)
+        assert (
+            offsets.ndim == 1
+            and len(offsets) > 0
+            and offsets[0] == 0
+            and offsets[-1] == len(values)
+            and (np.diff(offsets) >= 0).all()
+        ), "The offsets of GroupedCounts must increase from 0 to len(values)."
+
+        return GroupedCounts(values, offsets)
+
+    if hasattr(counts, "__array__"):  # np.ndarray and pd.Series
+        values = np.asarray(counts, dtype=np.float64)
+        if values.ndim == 2:
+            offsets = np.arange(values.shape[0] + 1, dtype=np.intp) * values.shape[1]
+
+            return GroupedCounts(values.ravel(), offsets)
+
+        return GroupedCounts(values.ravel(), None)
+
+    if any(isinstance(c, (list, tuple)) or getattr(c, "ndim", 0) > 0 for c in counts):
+        group_sizes = [len(c) for c in counts]
+        values = np.fromiter(
+            itertools.chain.from_iterable(counts),
+            dtype=np.float64,
+            count=sum(group_sizes),
+        )
+        offsets = np.zeros(len(group_sizes) + 1, dtype=np.intp)
+        np.cumsum(group_sizes, out=offsets[1:])
+
+        return GroupedCounts(values, offsets)
+
+    return GroupedCounts(np.asarray(counts, dtype=np.float64), None)
+
+
+def sum_groups(values, offsets):
+    """
+    Sums the values of each group given by offsets.
+
+    Parameters
+    ----------
+        values : np.ndarray (contains ints or floats)
+            A flat array of values.
+
+        offsets : np.ndarray (contains ints)
+            The start index of each group followed by len(values).
+
+    Returns
+    -------
+        group_sums : np.ndarray
+            The sum of each group, with empty groups summing to 0.
+    """
+    values = np.asarray(values)
+    nonempty_groups = np.diff(offsets) > 0
+
+    group_sums = np.zeros(len(nonempty_groups), dtype=values.dtype)
+    if nonempty_groups.any():
+        group_sums[nonempty_groups] = np.add.reduceat(
+            values, offsets[:-1][nonempty_groups]
+        )
+
+    return group_sums
+
+
+def section_thetas(values, start_angle=0, end_angle=360):
+    """
+    Derives the angles that bound the sections of a pie or semicircle.
+
+    Parameters
+    ----------
+        values : np.ndarray (contains ints or floats)
+            The counts of the sections.
+
+            Note: the rows of a 2D array are treated as separate plots, such as the frames of an animation.
+
+        start_angle : float : optional (default=0)
+            The angle in degrees at which the first section starts.
+
+        end_angle : float : optional (default=360)
+            The angle in degrees at which the last section ends.
+
+    Returns
+    -------
+        thetas : np.ndarray (shape=(..., num_sections + 1))
+            The start angle of each section followed by the end angle of the last.
+    """
+    values = np.asarray(values)
+    cumulative_counts = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,))
+    np.cumsum(values, axis=-1, out=cumulative_counts[..., 1:])
+
+    return (
+        start_angle
+        + (end_angle - start_angle) * cumulative_counts / cumulative_counts[..., -1:]
+    )
+
+
+def _jefferson_order(shares, total_alloc):
+    """
+    Orders the groups that receive each of the highest Jefferson quotients.
+
+    Note: ties go to the group with the larger share, as with the majority tie break of poli_sci_kit.
+    """
+    shares = np.asarray(shares, dtype=float)
+    groups = np.repeat(np.arange(len(shares)), total_alloc)
+    quotients = (shares[:, None] / np.arange(1, total_alloc + 1)).ravel()
+
+    return groups[np.lexsort((groups, -shares[groups], -quotients))]
+
+
+def allocate_sections(shares, total_alloc):
+    """
+    Allocates sections to groups with the Jefferson highest averages method.
+
+    Parameters
+    ----------
+        shares : list or np.ndarray (contains ints or floats)
+            The shares of the groups.
+
+        total_alloc : int
+            The number of sections to be allocated.
+
+    Returns
+    -------
+        allocations : list (contains ints)
+            The sections allocated to each group.
+    """
+    return np.bincount(
+        _jefferson_order(shares=shares, total_alloc=total_alloc)[:total_alloc],
+        minlength=len(shares),
+    ).tolist()
+
+
+def allocate_gradient_sections(shares, total_alloc):
+    """
+    Allocates sections to the gradients between consecutive groups.
+
+    Note: there are len(shares) - 1 gradients, so allocations are averaged over
+    the Jefferson allocations when each group is removed, with gradient i taking
+    the allocation at position i of each of these subsets.
+
+    Parameters
+    ----------
+        shares : list or np.ndarray (contains ints or floats)
+            The shares of the groups.
+
+        total_alloc : int
+            The number of sections to be allocated.
+
+    Returns
+    -------
+        allocations : list (contains ints)
+            The sections allocated to each gradient, or to the sole group if there's only one.
+    """
+    num_groups = len(shares)
+    if num_groups == 1:
+        return [total_alloc]
+
+    # The subsets with one group removed take their allocations from the first
+    # total_alloc quotients of the other groups, all of which are in the first
+    # 2 * total_alloc of the full ordering.
+    top_groups = _jefferson_order(shares=shares, total_alloc=total_alloc)[
+        : 2 * total_alloc
+    ]
+    group_indexes = np.arange(num_groups)
+    in_subsets = top_groups[None, :] != group_indexes[:, None]
+    in_subsets &= np.cumsum(in_subsets, axis=1) <= total_alloc
+
+    subset_allocations = in_subsets.astype(float) @ (
+        top_groups[:, None] == group_indexes[None, :]
+    ).astype(float)
+
+    # Position i of the subset with group j removed is group i if i < j and i + 1 otherwise.
+    positions = np.arange(num_groups - 1)[None, :]
+    positions = positions + (positions >= group_indexes[:, None])
+    averaged_allocations = (
+        subset_allocations[group_indexes[:, None], positions].sum(axis=0) / num_groups
+    )
+
+    allocations = np.rint(averaged_allocations).astype(int)
+
+    # Correct in case of rounding errors.
+    allocations[0] += total_alloc - allocations.sum()
+    while allocations[0] < 0:
+        allocations[np.argmax(allocations)] -= 1
+        allocations[0] += 1
+
+    return allocations.tolist()
+
+
+def gradient_shares(shares):
+    """
+    Divides a whole between the gradients between consecutive groups as allocate_gradient_sections does for many sections.
+
+    Parameters
+    ----------
+        shares : list or np.ndarray (contains ints or floats)
+            The shares of the groups.
+
+    Returns
+    -------
+        gradient_shares : np.ndarray (shape=(max(len(shares) - 1, 1),))
+            The proportion of the whole given to each gradient, or 1 for the sole group if there's only one.
+    """
+    shares = np.asarray(shares, dtype=np.float64)
+    num_groups = len(shares)
+    if num_groups == 1:
+        return np.ones(1)
+
+    # Position i of the subset with group j removed is group i if i < j and i + 1 otherwise.
+    group_indexes = np.arange(num_groups)
+    positions = np.arange(num_groups - 1)[None, :]
+    positions = positions + (positions >= group_indexes[:, None])
+
+    subset_totals = (shares.sum() - shares)[:, None]
+    subset_shares = np.divide(
+        shares[positions],
+        subset_totals,
+        out=np.zeros((num_groups, num_groups - 1)),
+        where=subset_totals > 0,
+    )
+    averaged_shares = subset_shares.mean(axis=0)
+
+    if averaged_shares.sum() > 0:
+        return averaged_shares / averaged_shares.sum()
+
+    return np.full(num_groups - 1, 1 / (num_groups - 1))
+
+
 def add_num_commas(num):
     """
     Adds commas to a numeric string for readability.
@@ -94,24 +402,82 @@ def add_num_commas(num):
         str_with_commas : str
             The original number with commas to make it more readable.
     """
-    num_str = str(num)
-    num_str_no_decimal = num_str.split(".")[0]
+    return format(num, ",")
 
-    decimal = num_str.split(".")[1] if "." in num_str else None
 
-    str_list = [i for i in num_str_no_decimal]
-    str_list = str_list[::-1]
+def format_numbers(values, decimals=None, commas=False, percent=False):
+    """
+    Formats an array of numbers as label text in one pass.
 
-    str_list_with_commas = [
-        s + "," if i % 3 == 0 and i != 0 else s for i, s in enumerate(str_list)
-    ]
-    str_list_with_commas = str_list_with_commas[::-1]
+    Parameters
+    ----------
+        values : list, np.ndarray or pd.Series (contains ints or floats)
+            The numbers to be formatted.
+
+        decimals : int : optional (default=None)
+            The number of decimals to display, with None rounding off integer floats (see round_if_int).
+
+        commas : bool : optional (default=False)
+            Whether to add commas to the numbers for readability.
+
+        percent : bool : optional (default=False)
+            Whether the values are shares that should be displayed as percentages.
+
+            Note: passing decimals is suggested, as shares times 100 are often not exact.
+
+    Returns
+    -------
+        num_strs : list (contains strs)
+            The formatted numbers.
+    """
+    values = np.asarray(values)
+    if percent:
+        values = values * 100
+
+    separator = "," if commas else ""
+    suffix = "%" if percent else ""
+
+    if decimals is not None:
+        num_format = f"{{:{separator}.{decimals}f}}{suffix}".format
+        return list(map(num_format, values.tolist()))
+
+    int_format = f"{{:{separator}d}}{suffix}".format
+    if np.issubdtype(values.dtype, np.integer):
+        return list(map(int_format, values.tolist()))
+
+    float_values = values.astype(np.float64)
+    is_int = np.isfinite(float_values) & (float_values == np.trunc(float_values))
+    if is_int.all():
+        return list(map(int_format, map(int, float_values.tolist())))
+
+    if values.dtype == np.float64 or values.dtype == object:
+        float_strs = list(
+            map(f"{{:{separator}}}{suffix}".format, float_values[~is_int].tolist())
+        )
 
-    str_with_commas = "".join(str_list_with_commas)
-    if decimal != None:
-        return str_with_commas + "." + decimal
     else:
-        return str_with_commas
+        # Other float types are shown at their own precision, as str of their items is.
+        float_strs = [_float_str(v, commas=commas) + suffix for v in values[~is_int]]
+
+    num_strs = np.empty(len(values), dtype=object)
+    num_strs[is_int] = list(map(int_format, map(int, float_values[is_int].tolist())))
+    num_strs[~is_int] = float_strs
+
+    return num_strs.tolist()
+
+
+def _float_str(value, commas=False):
+    """
+    Converts a NumPy float to the shortest str that identifies it at its precision, optionally with commas.
+    """
+    num_str = str(value)
+    if not commas or "e" in num_str or not np.isfinite(value):
+        return num_str
+
+    sign = "-" if num_str.startswith("-") else ""
+    int_part, point, decimal_part = num_str.lstrip("-").partition(".")
+
+    return f"{sign}{int(int_part):,}{point}{decimal_part}"
 
 
 def hex_to_rgb(hex_rep):
@@ -128,6 +494,8 @@ def hex_to_rgb(hex_rep):
         rgb_trip : tuple
             An RGB tuple color representation.
     """
+    from colormath.color_objects import sRGBColor
+
     return sRGBColor(
         *[int(hex_rep[i + 1 : i + 3], 16) for i in (0, 2, 4)], is_upscaled=True
     )
@@ -173,6 +541,8 @@ def scale_saturation(rgb_trip, sat):
         saturated_rgb : tuple
             colorsys.hls_to_rgb saturation of the given color.
     """
+    from colormath.color_objects import sRGBColor
+
     if (isinstance(rgb_trip, str)) and (len(rgb_trip) == 9) and (rgb_trip[-2:] == "00"):
         # An RGBA has been provided and its alpha is 00, so return it for
         # a transparent marker.
@@ -189,16 +559,321 @@ def scale_saturation(rgb_trip, sat):
     return colorsys.hls_to_rgb(h, min(1, l * sat), s=s)
 
 
+def hex_to_rgb_array(hexes):
+    """
+    Converts hexadecimal representations to an array of their RGB ratios.
+
+    Parameters
+    ----------
+        hexes : list or np.ndarray (contains strs)
+            The hex representations of the colors.
+
+            Note: only the #RRGGBB part of #RRGGBBAA representations is used.
+
+    Returns
+    -------
+        rgb_array : np.ndarray (shape=(len(hexes), 3))
+            RGB ratios of the colors.
+    """
+    if isinstance(hexes, str):
+        hexes = [hexes]
+
+    channels = np.frombuffer(
+        bytes.fromhex("".join([h[1:7] for h in hexes])), dtype=np.uint8
+    )
+
+    return channels.reshape(-1, 3) / 255
+
+
+def rgb_array_to_hex(rgb_array):
+    """
+    Converts an array of RGB ratios to their hexadecimal representations.
+
+    Parameters
+    ----------
+        rgb_array : np.ndarray or list (shape=(n, 3))
+            RGB color representations, either as ratios or 0-255 integers.
+
+    Returns
+    -------
+        hexes : list (contains strs)
+            The hex representations of the colors.
+    """
+    rgb_array = np.asarray(rgb_array)
+    if np.issubdtype(rgb_array.dtype, np.floating):
+        rgb_array = rgb_array * 255
+
+    # Truncation via astype mirrors int() in rgb_to_hex.
+    hex_str = (
+        np.clip(rgb_array.astype(np.int64), 0, 255).astype(np.uint8).tobytes().hex()
+    )
+
+    return ["#" + hex_str[i : i + 6] for i in range(0, len(hex_str), 6)]
+
+
+def rgb_to_hls_array(rgb_array):
+    """
+    Converts an array of RGB ratios to HLS coordinates.
+
+    Note: this is a vectorized version of colorsys.rgb_to_hls.
+
+    Parameters
+    ----------
+        rgb_array : np.ndarray (shape=(n, 3))
+            RGB ratios of the colors.
+
+    Returns
+    -------
+        hls_array : np.ndarray (shape=(n, 3))
+            Hue, lightness and saturation of the colors.
+    """
+    rgb_array = np.asarray(rgb_array, dtype=float)
+
+    maxc = rgb_array.max(axis=1)
+    minc = rgb_array.min(axis=1)
+    sumc = maxc + minc
+    rangec = maxc - minc
+
+    hls_array = np.zeros_like(rgb_array)
+    hls_array[:, 1] = sumc / 2.0
+
+    # Grays keep a hue and saturation of zero as in colorsys.
+    chromatic = minc != maxc
+    np.divide(
+        rangec,
+        np.where(hls_array[:, 1] <= 0.5, sumc, 2.0 - maxc - minc),
+        out=hls_array[:, 2],
+        where=chromatic,
+    )
+
+    rgb_c = np.divide(
+        maxc[:, None] - rgb_array,
+        rangec[:, None],
+        out=np.zeros_like(rgb_array),
+        where=chromatic[:, None],
+    )
+    rc, gc, bc = rgb_c[:, 0], rgb_c[:, 1], rgb_c[:, 2]
+
+    h = np.where(
+        rgb_array[:, 0] == maxc,
+        bc - gc,
+        np.where(rgb_array[:, 1] == maxc, 2.0 + rc - bc, 4.0 + gc - rc),
+    )
+    hls_array[:, 0] = np.where(chromatic, (h / 6.0) % 1.0, 0.0)
+
+    return hls_array
+
+
+def hls_to_rgb_array(hls_array):
+    """
+    Converts an array of HLS coordinates to RGB ratios.
+
+    Note: this is a vectorized version of colorsys.hls_to_rgb.
+
+    Parameters
+    ----------
+        hls_array : np.ndarray (shape=(n, 3))
+            Hue, lightness and saturation of the colors.
+
+    Returns
+    -------
+        rgb_array : np.ndarray (shape=(n, 3))
+            RGB ratios of the colors.
+    """
+    hls_array = np.asarray(hls_array, dtype=float)
+    h, l, s = hls_array[:, 0], hls_array[:, 1], hls_array[:, 2]
+
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))[:, None]
+    m1 = 2.0 * l[:, None] - m2
+
+    # Hues for the R, G and B channels respectively.
+    hues = (h[:, None] + np.array([1.0 / 3.0, 0.0, -1.0 / 3.0])) % 1.0
+
+    rgb_array = np.where(
+        hues < 1.0 / 6.0,
+        m1 + (m2 - m1) * hues * 6.0,
+        np.where(
+            hues < 0.5,
+            m2,
+            np.where(hues < 2.0 / 3.0, m1 + (m2 - m1) * (2.0 / 3.0 - hues) * 6.0, m1),
+        ),
+    )
+
+    # Colors without saturation are grays of the given lightness.
+    return np.where((s == 0.0)[:, None], l[:, None], rgb_array)
+
+
+def scale_saturation_array(rgb_array, sat):
+    """
+    Changes the saturation of an array of rgb colors.
+
+    Note: this is a vectorized version of scale_saturation.
+
+    Parameters
+    ----------
+        rgb_array : np.ndarray (shape=(n, 3))
+            RGB ratios of the colors.
+
+        sat : float
+            The saturation the colors should be modified by.
+
+    Returns
+    -------
+        saturated_rgb_array : np.ndarray (shape=(n, 3))
+            The RGB ratios of the colors with their saturation scaled.
+    """
+    hls_array = rgb_to_hls_array(rgb_array)
+    hls_array[:, 1] = np.minimum(1, hls_array[:, 1] * sat)
+
+    return hls_to_rgb_array(hls_array)
+
+
+def _rgb_array_to_colorspace(rgb_array, colorspace):
+    """
+    Converts an array of sRGB ratios to coordinates of a colorspace.
+
+    Note: mirrors colormath.color_conversions.convert_color for sRGBColor, LabColor and HSVColor.
+    """
+    from colormath import color_constants
+    from colormath.color_objects import HSVColor, LabColor, sRGBColor
+
+    if colorspace is sRGBColor:
+        return rgb_array
+
+    if colorspace is HSVColor:
+        maxc = rgb_array.max(axis=1)
+        minc = rgb_array.min(axis=1)
+        r, g, b = rgb_array[:, 0], rgb_array[:, 1], rgb_array[:, 2]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rangec = maxc - minc
+            hsv_h = np.where(
+                maxc == minc,
+                0.0,
+                np.where(
+                    maxc == r,
+                    (60.0 * ((g - b) / rangec) + 360) % 360.0,
+                    np.where(
+                        maxc == g,
+                        60.0 * ((b - r) / rangec) + 120,
+                        60.0 * ((r - g) / rangec) + 240.0,
+                    ),
+                ),
+            )
+            hsv_s = np.where(maxc == 0, 0.0, 1.0 - (minc / maxc))
+
+        return np.stack([hsv_h, hsv_s, maxc], axis=1)
+
+    if colorspace is LabColor:
+        # sRGB to XYZ under the sRGB native illuminant.
+        linear_rgb = np.where(
+            rgb_array <= 0.04045,
+            rgb_array / 12.92,
+            np.power((rgb_array + 0.055) / 1.055, 2.4),
+        )
+        xyz = np.maximum(
+            linear_rgb @ sRGBColor.conversion_matrices["rgb_to_xyz"].T, 0.0
+        )
+
+        # XYZ to Lab relative to the same illuminant.
+        xyz = xyz / color_constants.ILLUMINANTS["2"][sRGBColor.native_illuminant]
+        xyz = np.where(
+            xyz > color_constants.CIE_E,
+            np.power(xyz, 1.0 / 3.0),
+            (7.787 * xyz) + (16.0 / 116.0),
+        )
+
+        return np.stack(
+            [
+                (116.0 * xyz[:, 1]) - 16.0,
+                500.0 * (xyz[:, 0] - xyz[:, 1]),
+                200.0 * (xyz[:, 1] - xyz[:, 2]),
+            ],
+            axis=1,
+        )
+
+
+def _colorspace_array_to_rgb(cs_array, colorspace):
+    """
+    Converts an array of colorspace coordinates to sRGB ratios.
+
+    Note: mirrors colormath.color_conversions.convert_color for sRGBColor, LabColor and HSVColor.
+    """
+    from colormath import color_constants
+    from colormath.chromatic_adaptation import apply_chromatic_adaptation
+    from colormath.color_objects import HSVColor, LabColor, sRGBColor
+
+    if colorspace is sRGBColor:
+        return cs_array
+
+    if colorspace is HSVColor:
+        hsv_h, hsv_s, hsv_v = cs_array[:, 0], cs_array[:, 1], cs_array[:, 2]
+
+        h_floored = np.floor(hsv_h)
+        h_sub_i = np.trunc(h_floored / 60) % 6
+        var_f = (hsv_h / 60.0) - (h_floored // 60)
+        var_p = hsv_v * (1.0 - hsv_s)
+        var_q = hsv_v * (1.0 - var_f * hsv_s)
+        var_t = hsv_v * (1.0 - (1.0 - var_f) * hsv_s)
+
+        # Channel values for each of the six hue sectors.
+        sectors = [h_sub_i == i for i in range(6)]
+        return np.stack(
+            [
+                np.select(sectors, [hsv_v, var_q, var_p, var_p, var_t, hsv_v]),
+                np.select(sectors, [var_t, hsv_v, hsv_v, var_q, var_p, var_p]),
+                np.select(sectors, [var_p, var_p, var_t, hsv_v, hsv_v, var_q]),
+            ],
+            axis=1,
+        )
+
+    if colorspace is LabColor:
+        # Lab to XYZ relative to the default LabColor illuminant.
+        lab_illuminant = "d50"
+        xyz_y = (cs_array[:, 0] + 16.0) / 116.0
+        xyz = np.stack(
+            [cs_array[:, 1] / 500.0 + xyz_y, xyz_y, xyz_y - cs_array[:, 2] / 200.0],
+            axis=1,
+        )
+        xyz = np.where(
+            np.power(xyz, 3) > color_constants.CIE_E,
+            np.power(xyz, 3),
+            (xyz - 16.0 / 116.0) / 7.787,
+        )
+        xyz = xyz * color_constants.ILLUMINANTS["2"][lab_illuminant]
+
+        # Adapt to the sRGB native illuminant and then convert to sRGB.
+        xyz = np.stack(
+            apply_chromatic_adaptation(
+                xyz[:, 0],
+                xyz[:, 1],
+                xyz[:, 2],
+                orig_illum=lab_illuminant,
+                targ_illum=sRGBColor.native_illuminant,
+            ),
+            axis=1,
+        )
+        linear_rgb = np.maximum(
+            xyz @ sRGBColor.conversion_matrices["xyz_to_rgb"].T, 0.0
+        )
+
+        return np.where(
+            linear_rgb <= 0.0031308,
+            linear_rgb * 12.92,
+            1.055 * np.power(linear_rgb, 1 / 2.4) - 0.055,
+        )
+
+
 def create_color_palette(start_rgb, end_rgb, num_colors, colorspace):
     """
     Generates a color palette between two colors.
 
     Parameters
     ----------
-        start_rgb : colormath.color_objects.sRGBColor
+        start_rgb : colormath.color_objects.sRGBColor, str or tuple
             The first color in the palette.
 
-        end_rgb : colormath.color_objects.sRGBColor
+        end_rgb : colormath.color_objects.sRGBColor, str or tuple
             The last color in the palette.
 
         num_colors : int
@@ -207,29 +882,183 @@ def create_color_palette(start_rgb, end_rgb, num_colors, colorspace):
         colorspace : colormath.color_object
             The color scheme for the palette.
 
+            Note: sRGBColor, LabColor and HSVColor are interpolated as arrays, with others converted via colormath.
+
     Returns
     -------
         palette : list (contains sts)
             A list of length num_colors with color hexes for the palette elements.
     """
-    # Define the start and end within a geometric space and find those points between.
-    start_tuple = convert_color(start_rgb, colorspace).get_value_tuple()
-    end_tuple = convert_color(end_rgb, colorspace).get_value_tuple()
+    from colormath.color_objects import HSVColor, LabColor, sRGBColor
+
+    end_points = [
+        hex_to_rgb(c) if isinstance(c, str) else c for c in [start_rgb, end_rgb]
+    ]
+    end_points = [c if isinstance(c, sRGBColor) else sRGBColor(*c) for c in end_points]
+
+    if colorspace not in [sRGBColor, LabColor, HSVColor]:
+        from colormath.color_conversions import convert_color
+
+        # Define the start and end within a geometric space and find those points between.
+        start_tuple = convert_color(end_points[0], colorspace).get_value_tuple()
+        end_tuple = convert_color(end_points[1], colorspace).get_value_tuple()
 
-    points_between = list(
-        zip(
-            *[
-                np.linspace(start=start_tuple[i], stop=end_tuple[i], num=num_colors)
-                for i in range(3)
-            ]
+        points_between = list(
+            zip(
+                *[
+                    np.linspace(start=start_tuple[i], stop=end_tuple[i], num=num_colors)
+                    for i in range(3)
+                ]
+            )
         )
+
+        # Convert points to RGB and then to hexes for the output.
+        rgb_colors = [
+            convert_color(colorspace(*point), sRGBColor) for point in points_between
+        ]
+        return [color.get_rgb_hex() for color in rgb_colors]
+
+    start_end = _rgb_array_to_colorspace(
+        np.array([c.get_value_tuple() for c in end_points]), colorspace
+    )
+    points_between = np.stack(
+        [
+            np.linspace(start=start_end[0, i], stop=start_end[1, i], num=num_colors)
+            for i in range(3)
+        ],
+        axis=1,
     )
 
-    # Convert points to RGB and then to hexes for the output.
-    rgb_colors = [
-        convert_color(colorspace(*point), sRGBColor) for point in points_between
-    ]
-    return [color.get_rgb_hex() for color in rgb_colors]
+    # Scale up as in sRGBColor.get_rgb_hex, where values are rounded but not clamped.
+    rgb_array = np.floor(
+        0.5 + _colorspace_array_to_rgb(points_between, colorspace) * 255
+    ).astype(np.int64)
+    if ((rgb_array >= 0) & (rgb_array <= 255)).all():
+        return rgb_array_to_hex(rgb_array)
+
+    return ["#%02x%02x%02x" % tuple(c) for c in rgb_array.tolist()]
+
+
+def default_colors(num_colors=len(default_palette), palette=None):
+    """
+    Generates default colors by cycling through the default palette.
+
+    Parameters
+    ----------
+        num_colors : int : optional (default=len(default_palette))
+            The number of colors to generate.
+
+        palette : list : optional (default=None; contains strs)
+            The hexes to cycle through, with None being default_palette.
+
+    Returns
+    -------
+        colors : list (contains strs)
+            Hexes of the palette, repeated if more colors are needed.
+    """
+    if palette is None:
+        palette = default_palette
+
+    return [palette[i % len(palette)] for i in range(num_colors)]
+
+
+def _desaturate_colors(palette, colors, num_colors, dsat, as_hex):
+    """
+    Desaturates a palette or colors once per key, with arrays being read-only as they're shared.
+    """
+    if colors is None:
+        colors = default_colors(num_colors=num_colors)  # palette is "deep"
+
+    rgb_array = scale_saturation_array(rgb_array=hex_to_rgb_array(colors), sat=dsat)
+    if as_hex:
+        return tuple(rgb_array_to_hex(rgb_array))
+
+    rgb_array.setflags(write=False)
+
+    return rgb_array
+
+
+_cached_desaturated_colors = functools.lru_cache(maxsize=palette_cache_size)(
+    _desaturate_colors
+)
+
+
+def desaturated_colors(colors=None, num_colors=None, dsat=1, as_hex=False):
+    """
+    Desaturates colors or the default palette, memoizing the results for repeated plots.
+
+    Parameters
+    ----------
+        colors : list or tuple : optional (default=None; contains strs)
+            Hex based colors, with None being the default palette.
+
+        num_colors : int : optional (default=None)
+            The number of colors of the default palette, with None being the length of the palette.
+
+        dsat : float : optional (default=1)
+            The saturation the colors should be modified by.
+
+        as_hex : bool : optional (default=False)
+            Whether to return hexes rather than RGB ratios.
+
+    Returns
+    -------
+        colors : np.ndarray (shape=(n, 3)) or list (contains strs)
+            The desaturated colors as a read-only array of RGB ratios or as hexes.
+    """
+    if colors is None:
+        palette = "deep"
+        num_colors = len(default_palette) if num_colors is None else num_colors
+
+    else:
+        palette = None
+        colors = tuple(colors)
+        num_colors = len(colors)
+
+    desaturated = _cached_desaturated_colors(
+        palette=palette,
+        colors=colors,
+        num_colors=num_colors,
+        dsat=dsat,
+        as_hex=as_hex,
+    )
+
+    return list(desaturated) if as_hex else desaturated
+
+
+def palette_cache_info():
+    """
+    Reports the use of the cache of desaturated_colors.
+
+    Returns
+    -------
+        cache_info : functools._CacheInfo
+            The hits, misses, maxsize and currsize of the cache.
+    """
+    return _cached_desaturated_colors.cache_info()
+
+
+def clear_palette_cache():
+    """
+    Clears the cache of desaturated_colors and resets its statistics.
+    """
+    _cached_desaturated_colors.cache_clear()
+
+
+def set_palette_cache_size(size):
+    """
+    Replaces the cache of desaturated_colors with an empty one of a given size.
+
+    Parameters
+    ----------
+        size : int or None
+            The most desaturated palettes that are memoized, with None being no limit and 0 disabling the cache.
+    """
+    global _cached_desaturated_colors, palette_cache_size
+    assert size is None or size >= 0, "The 'size' argument must be None or at least 0."
+
+    palette_cache_size = size
+    _cached_desaturated_colors = functools.lru_cache(maxsize=size)(_desaturate_colors)
 
 
 def gen_random_colors(num_groups, colors=None):
@@ -253,16 +1082,47 @@ def gen_random_colors(num_groups, colors=None):
         colors = []
 
     if len(colors) < num_groups:
-        while len(colors) < num_groups:
-            cryptogen = SystemRandom()
-            random_rgba = [cryptogen.random() for i in range(4)]
+        cryptogen = SystemRandom()
+        random_rgb = [
+            [cryptogen.random() for i in range(3)]
+            for _ in range(num_groups - len(colors))
+        ]
+        colors = list(colors) + [c.upper() for c in rgb_array_to_hex(random_rgb)]
 
-            colors.append(random_rgba)
+    return colors
 
-        sns.set_palette(colors)
 
-        if isinstance(colors[0][0], float):
-            # Convert over for non-sns use.
-            colors = [mpl.colors.to_hex([c[0], c[1], c[2]]).upper() for c in colors]
+def count_artists(ax):
+    """
+    Counts the patches, collections and lines of an axis, for example to find those that a plot adds.
 
-    return colors
+    Parameters
+    ----------
+        ax : matplotlib.axes.Axes
+            The axis to count the artists of.
+
+    Returns
+    -------
+        artist_counts : tuple (contains ints)
+            The numbers of patches, collections and lines of the axis.
+    """
+    return len(ax.patches), len(ax.collections), len(ax.lines)
+
+
+def rasterize_artists(ax, start_counts=(0, 0, 0)):
+    """
+    Rasterizes the patches, collections and lines that were added to an axis after it had the given counts.
+
+    Note: text, ticks and spines are kept as vectors, and rasterized artists are drawn at the dpi of savefig.
+
+    Parameters
+    ----------
+        ax : matplotlib.axes.Axes
+            The axis with artists to be rasterized.
+
+        start_counts : tuple (contains ints) : optional (default=(0, 0, 0))
+            The counts of the axis' artists before the ones to be rasterized were added (see count_artists).
+    """
+    for artists, start in zip([ax.patches, ax.collections, ax.lines], start_counts):
+        for artist in artists[start:]:
+            artist.set_rasterized(True)
@@ -0,0 +1,66 @@
+"""
+Animation Tests
+---------------
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pltviz
+import pytest
+from pltviz import utils
+from pltviz.animate import (
+    animate_pie,
+    animate_semipie,
+    save_animation,
+    transition_counts,
+)
+
+
+def test_transition_counts(allocations):
+    counts_sequence = [allocations, allocations[::-1], allocations]
+    frame_counts = transition_counts(counts_sequence, frames_per_transition=4)
+    assert frame_counts.shape == (9, len(allocations))
+    assert (frame_counts[[0, 4, 8]] == counts_sequence).all()
+    assert (frame_counts[2] == (np.array(allocations) + allocations[::-1]) / 2).all()
+
+    with pytest.raises(AssertionError):
+        transition_counts([[1, 2], [1, 2, 3]])
+
+
+def test_animate_pie(allocations, parties):
+    counts_sequence = np.array([allocations, allocations[::-1]])
+    animation = animate_pie(
+        counts_sequence,
+        labels=parties,
+        display_labels=True,
+        display_counts=True,
+        frames_per_transition=2,
+        axis=plt.subplots()[1],
+    )
+
+    # The middle frame is halfway between the counts, with labels rounded.
+    artists = animation._func(1)
+    wedges, texts = artists[: len(allocations)], artists[len(allocations) :]
+    thetas = utils.section_thetas(counts_sequence.mean(axis=0))
+    assert [w.theta2 for w in wedges] == pytest.approx(thetas[1:])
+    assert texts[-1].get_text() == f"{parties[-1]}: 16"
+
+
+def test_animate_semipie(tmp_path, allocations):
+    counts_sequence = [allocations, allocations[::-1]]
+    animation = animate_semipie(
+        counts_sequence, frames_per_transition=3, axis=plt.subplots()[1]
+    )
+    collection = animation._func(3)[0]
+
+    fresh_ax = pltviz.semipie(counts=allocations[::-1], axis=plt.subplots()[1])
+    for path, fresh_path in zip(
+        collection.get_paths(), fresh_ax.collections[0].get_paths()
+    ):
+        assert np.allclose(path.vertices, fresh_path.vertices)
+
+    save_animation(animation, path=tmp_path / "semipie.gif", writer="pillow", dpi=20)
+    assert (tmp_path / "semipie.gif").stat().st_size > 0
+
+    with pytest.raises(AssertionError):
+        save_animation(animation, path=str(tmp_path / "semipie.avi"))
@@ -4,8 +4,12 @@
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import pltviz
 import pytest
+from pltviz import utils
+from pltviz.bar import aggregate_groups, other_color, stacked_segment_verts
 
 
 def test_bar(
@@ -127,3 +131,147 @@ def test_bar(
         label_bars=False,
         axis=None,
     )
+
+
+def test_bar_array_inputs(
+    monkeypatch, allocations, factioned_allocations, parties, faction_labels
+):
+    monkeypatch.setattr(plt, "show", lambda: None)
+    for flat_counts in [allocations, np.array(allocations), pd.Series(allocations)]:
+        ax = pltviz.bar(counts=flat_counts, labels=parties, axis=plt.subplots()[1])
+        assert [p.get_height() for p in ax.patches] == allocations
+
+    values = np.array([c for f in factioned_allocations for c in f])
+    offsets = np.cumsum([0] + [len(f) for f in factioned_allocations])
+    for factioned_counts in [
+        factioned_allocations,
+        tuple(factioned_allocations),
+        utils.GroupedCounts(values, offsets),
+    ]:
+        ax = pltviz.bar(
+            counts=factioned_counts,
+            labels=parties,
+            faction_labels=faction_labels,
+            axis=plt.subplots()[1],
+        )
+        assert [p.get_height() for p in ax.patches] == values.tolist()
+
+
+def test_bar_lean(
+    monkeypatch, allocations, factioned_allocations, parties, faction_labels
+):
+    monkeypatch.setattr(plt, "show", lambda: None)
+    for horizontal in [False, True]:
+        ax = pltviz.bar(
+            counts=allocations,
+            labels=parties,
+            horizontal=horizontal,
+            backend="lean",
+            axis=plt.subplots()[1],
+        )
+        lengths = [p.get_width() if horizontal else p.get_height() for p in ax.patches]
+        assert lengths == allocations
+
+        ticklabels = ax.get_yticklabels() if horizontal else ax.get_xticklabels()
+        assert [t.get_text() for t in ticklabels] == parties
+
+        ax = pltviz.bar(
+            counts=factioned_allocations,
+            labels=parties,
+            faction_labels=faction_labels,
+            horizontal=horizontal,
+            stacked=True,
+            label_bars=True,
+            backend="lean",
+            axis=plt.subplots()[1],
+        )
+        # A segment for each group in each faction.
+        assert len(ax.patches) == len(parties) * len(faction_labels)
+
+    with pytest.raises(AssertionError):
+        pltviz.bar(counts=allocations, backend="matplotlib")
+
+
+def test_aggregate_groups(allocations, parties, party_colors):
+    values, labels, colors = aggregate_groups(
+        values=np.array(allocations), labels=parties, colors=party_colors, max_groups=4
+    )
+    # The three largest groups in order, followed by the others merged.
+    assert values.tolist() == [26, 37, 23, 9 + 12 + 5]
+    assert labels == ["CDU/CSU", "Greens", "SPD", "other"]
+    assert colors == ["#000000", "#64a12d", "#eb001f", other_color]
+
+    values, labels, colors = aggregate_groups(
+        values=np.array(allocations), max_groups=len(allocations)
+    )
+    assert values.tolist() == allocations and labels is None and colors is None
+
+    with pytest.raises(AssertionError):
+        aggregate_groups(values=np.array(allocations), max_groups=1)
+
+
+def test_bar_level_of_detail():
+    num_groups = 20000
+    counts = np.arange(num_groups) % 100 + 1
+    labels = [f"group_{i}" for i in range(num_groups)]
+    for backend in ["seaborn", "lean"]:
+        for horizontal in [False, True]:
+            ax = pltviz.bar(
+                counts=counts,
+                labels=labels,
+                horizontal=horizontal,
+                label_bars=True,
+                max_groups=100,
+                backend=backend,
+                axis=plt.subplots()[1],
+            )
+            lengths = [
+                p.get_width() if horizontal else p.get_height() for p in ax.patches
+            ]
+            assert len(lengths) == 100 and sum(lengths) == counts.sum()
+
+            # Neither the bar labels nor the group labels fit, so every n-th is shown.
+            ticklabels = ax.get_yticklabels() if horizontal else ax.get_xticklabels()
+            assert 1 < len(ax.texts) < 100
+            label_step = int(np.ceil(100 / len(ax.texts)))
+            assert [t.get_text() for t in ax.texts] == utils.format_numbers(lengths)[
+                ::label_step
+            ]
+            assert 1 < len(ticklabels) < 100
+            assert ticklabels[-1].get_text() in labels + ["other"]
+            plt.close("all")
+
+    # Groups are only merged if max_groups is passed.
+    for stacked in [False, True]:
+        ax = pltviz.bar(
+            counts=counts[:600],
+            stacked=stacked,
+            backend="lean",
+            axis=plt.subplots()[1],
+        )
+        artists = ax.collections[0].get_paths() if stacked else ax.patches
+        assert len(artists) == 600
+        plt.close("all")
+
+
+def test_bar_stacked_segments(allocations):
+    for horizontal in [False, True]:
+        ax = pltviz.bar(
+            counts=allocations,
+            horizontal=horizontal,
+            stacked=True,
+            label_bars=True,
+            axis=plt.subplots()[1],
+        )
+        # The segments are one collection of rectangles rather than a patch each.
+        assert not ax.patches and len(ax.collections) == 1
+        verts = stacked_segment_verts(np.array(allocations), horizontal=horizontal)
+        assert np.allclose(
+            [p.vertices[:4] for p in ax.collections[0].get_paths()], verts
+        )
+
+        value_axis = 0 if horizontal else 1
+        assert np.allclose(verts[1:, 0, value_axis], np.cumsum(allocations)[:-1])
+        assert ax.texts[0].get_text() == str(sum(allocations))
+        assert ax.texts[0].get_position()[value_axis] == sum(allocations) + 1
+        plt.close("all")
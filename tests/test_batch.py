@@ -0,0 +1,66 @@
+"""
+Batch Rendering Tests
+---------------------
+"""
+
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from pltviz import batch
+
+
+def test_render_chart(tmp_path, allocations):
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    shares = [a / sum(allocations) for a in allocations]
+
+    gini_result = batch.render_chart(
+        {"kind": "gini", "kwargs": {"shares": shares}, "path": tmp_path / "gini.png"},
+        figure=figure,
+    )
+    assert gini_result["error"] is None and gini_result["seconds"] > 0
+    assert not figure.axes
+
+    # Layouts of prior charts don't carry over to later ones.
+    pie_spec = {"kind": "pie", "kwargs": {"counts": allocations}}
+    batch.render_chart({**pie_spec, "path": tmp_path / "pie_1.png"}, figure=figure)
+    batch.render_chart({**pie_spec, "path": tmp_path / "pie_2.png"}, figure=Figure())
+    assert (tmp_path / "pie_1.png").read_bytes() == (
+        tmp_path / "pie_2.png"
+    ).read_bytes()
+
+    error_result = batch.render_chart(
+        {"kind": "bar", "kwargs": {"counts": [1, 2], "colors": ["#ffffff"]}, "path": ""}
+    )
+    assert error_result["error"].startswith("AssertionError")
+
+    with pytest.raises(AssertionError):
+        batch.render_chart({"kind": "scatter", "path": tmp_path / "scatter.png"})
+
+
+def test_render_batch(tmp_path, allocations, factioned_allocations, faction_labels):
+    specs = [
+        {
+            "kind": "semipie",
+            "kwargs": {"counts": allocations},
+            "path": tmp_path / f"semipie_{i}.svg",
+            "format": "svg",
+        }
+        for i in range(4)
+    ]
+    specs.append(
+        {
+            "kind": "bar",
+            "kwargs": {
+                "counts": factioned_allocations,
+                "faction_labels": faction_labels,
+                "stacked": True,
+            },
+            "path": tmp_path / "bar.png",
+        }
+    )
+
+    results = list(batch.render_batch(iter(specs), max_workers=2, max_pending=2))
+    assert sorted(r["path"] for r in results) == sorted(s["path"] for s in specs)
+    assert all(r["error"] is None for r in results)
+    assert all(s["path"].stat().st_size > 0 for s in specs)
@@ -4,8 +4,11 @@
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pltviz
+from pltviz import utils
+from pltviz.comp_line import pivot_dependent_col
 
 
 def test_comp_line(monkeypatch, parties, party_colors):
@@ -73,3 +76,106 @@ def test_comp_line(monkeypatch, parties, party_colors):
         stacked=False,
         percent=False,
     )
+
+
+def test_comp_line_stacked(capsys, parties, party_colors):
+    df = pd.DataFrame(
+        np.arange(18).reshape(6, 3), columns=["seats_1", "seats_2", "seats_3"]
+    )
+    ax = pltviz.comp_line(
+        df=df,
+        dependent_cols=["seats_1", "seats_2", "seats_3"],
+        indep_stats=[1, 2, 3],
+        colors=party_colors,
+        stacked=True,
+        axis=plt.subplots()[1],
+    )
+    assert len(ax.collections) == len(df)
+    assert capsys.readouterr().out == ""
+
+
+def test_comp_line_lean(parties, party_colors):
+    df = pd.DataFrame(
+        np.arange(18).reshape(6, 3), columns=["seats_1", "seats_2", "seats_3"]
+    )
+    for stacked in [False, True]:
+        ax = pltviz.comp_line(
+            df=df,
+            dependent_cols=["seats_1", "seats_2", "seats_3"],
+            indep_stats=[3, 1, 2],
+            colors=party_colors,
+            stacked=stacked,
+            backend="lean",
+            axis=plt.subplots()[1],
+        )
+        assert len(ax.collections if stacked else ax.lines) == len(df)
+
+
+def test_comp_line_line_collection(parties, party_colors):
+    df = pd.DataFrame(
+        np.arange(60).reshape(6, 10), columns=[f"seats_{i}" for i in range(10)]
+    )
+    ax = pltviz.comp_line(
+        df=df,
+        dependent_cols=list(df.columns),
+        indep_stats=list(range(10)),
+        colors=party_colors,
+        line_collection=True,
+        alpha=0.5,
+        decimate=4,
+        axis=plt.subplots()[1],
+    )
+    assert len(ax.collections) == 1 and not ax.lines
+
+    lines = ax.collections[0].get_segments()
+    assert len(lines) == len(df)
+    assert lines[0][:, 0].tolist() == [0, 4, 8, 9]
+    assert lines[1][:, 1].tolist() == [10, 14, 18, 19]
+    assert ax.collections[0].get_alpha() == 0.5
+
+
+def loop_pivot_dependent_col(df, dependent_col, indep_stats, group_col):
+    # The per location assignment that pivot_dependent_col replaces.
+    new_indep_stats = [utils.round_if_int(float(s)) for s in df[indep_stats].unique()]
+    sorted_nbs = sorted(new_indep_stats)
+    was_sorted = -1 if sorted_nbs == new_indep_stats else 1
+    new_dep_cols = [str(s) + "_" + dependent_col for s in sorted_nbs]
+
+    df_new = pd.DataFrame(columns=["locations"] + new_dep_cols)
+    df_new["locations"] = df[group_col].unique()
+    for lctn in df_new["locations"]:
+        df_new.loc[df_new[df_new["locations"] == lctn].index, new_dep_cols] = df.loc[
+            df[df[group_col] == lctn].index, dependent_col
+        ].values[::was_sorted]
+
+    return df_new, new_dep_cols, new_indep_stats
+
+
+def test_pivot_dependent_col(parties):
+    rng = np.random.default_rng(42)
+    years = [2000, 2001, 2002, 2003]
+    for year_order, shuffle in [
+        (years, False),
+        ([2002, 2000, 2003, 2001], False),
+        (years, True),
+    ]:
+        df = pd.DataFrame()
+        df["parties"] = np.repeat(parties, len(year_order))
+        df["years"] = year_order * len(parties)
+        df["seats"] = rng.integers(0, 100, size=len(df))
+        if shuffle:
+            df = df.iloc[rng.permutation(len(df))].reset_index(drop=True)
+
+        df_new, new_dep_cols, new_indep_stats = pivot_dependent_col(
+            df=df, dependent_col="seats", indep_stats="years", group_col="parties"
+        )
+        df_loop, loop_dep_cols, loop_indep_stats = loop_pivot_dependent_col(
+            df=df, dependent_col="seats", indep_stats="years", group_col="parties"
+        )
+
+        assert new_dep_cols == loop_dep_cols
+        assert new_indep_stats == loop_indep_stats
+        assert df_new["locations"].tolist() == df_loop["locations"].tolist()
+        assert (
+            df_new[new_dep_cols].to_numpy() == df_loop[loop_dep_cols].to_numpy()
+        ).all()
@@ -0,0 +1,102 @@
+"""
+Concurrency Tests
+-----------------
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pltviz
+from matplotlib.figure import Figure
+from pltviz import utils
+
+num_threads = 8
+
+
+def thread_colors(i, num_colors):
+    rng = np.random.default_rng(i)
+    return utils.rgb_array_to_hex(rng.integers(0, 256, size=(num_colors, 3)))
+
+
+def expected_rgb(colors):
+    # Plots are desaturated by their default_sat of 0.95.
+    return utils.scale_saturation_array(
+        rgb_array=utils.hex_to_rgb_array(colors), sat=0.95
+    )
+
+
+def render_bar(i, allocations):
+    colors = thread_colors(i, len(allocations))
+    ax = pltviz.bar(counts=allocations, colors=colors, axis=Figure().add_subplot())
+    rgb = np.array([p.get_facecolor()[:3] for p in ax.patches])
+
+    return np.allclose(rgb, expected_rgb(colors))
+
+
+def render_comp_line(i, allocations):
+    colors = thread_colors(i, len(allocations))
+    df = pd.DataFrame({"seats_1": allocations, "seats_2": allocations[::-1]})
+    ax = pltviz.comp_line(
+        df=df,
+        dependent_cols=["seats_1", "seats_2"],
+        indep_stats=[1, 2],
+        colors=colors,
+        axis=Figure().add_subplot(),
+    )
+    rgb = np.array([line.get_color() for line in ax.lines])
+
+    return np.allclose(rgb, expected_rgb(colors))
+
+
+def test_threaded_colors(allocations):
+    for render in [render_bar, render_comp_line]:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            results = executor.map(
+                render, range(2 * num_threads), [allocations] * 2 * num_threads
+            )
+
+            assert all(results)
+
+
+def render_all(i, allocations, factioned_allocations, faction_labels):
+    shares = np.array(allocations) / sum(allocations)
+    axes = [Figure().add_subplot() for _ in range(6)]
+    pltviz.bar(counts=allocations, axis=axes[0])
+    pltviz.bar(
+        counts=factioned_allocations,
+        faction_labels=faction_labels,
+        stacked=bool(i % 2),
+        axis=axes[1],
+    )
+    pltviz.pie(
+        counts=factioned_allocations, faction_labels=faction_labels, axis=axes[2]
+    )
+    pltviz.semipie(counts=allocations, axis=axes[3])
+    pltviz.gini(shares=shares, axis=axes[4])
+    pltviz.comp_line(
+        df=pd.DataFrame({"seats_1": allocations, "seats_2": allocations}),
+        dependent_cols=["seats_1", "seats_2"],
+        indep_stats=[1, 2],
+        stacked=True,
+        axis=axes[5],
+    )
+
+    # Each plot is drawn on its own axis, including gini's fill.
+    return [len(ax.get_children()) for ax in axes], len(axes[4].collections)
+
+
+def test_threaded_figures(allocations, factioned_allocations, faction_labels):
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        results = list(
+            executor.map(
+                render_all,
+                range(num_threads),
+                [allocations] * num_threads,
+                [factioned_allocations] * num_threads,
+                [faction_labels] * num_threads,
+            )
+        )
+
+    assert all(r == results[i % 2] for i, r in enumerate(results))
+    assert all(r[1] == 1 for r in results)
@@ -4,10 +4,40 @@
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pltviz
+import pytest
 
 
 def test_gini(monkeypatch):
     monkeypatch.setattr(plt, "show", lambda: None)
     shares = [0.49, 0.59, 0.69, 0.79, 1.89, 2.55, 5.0, 10.0, 18.0, 60.0]
-    pltviz.gini(shares=shares)
+    ax, gini = pltviz.gini(shares=shares)
+
+    assert len(shares) == 10
+    assert pltviz.gini(shares=shares)[1] == gini
+    assert gini == pytest.approx(0.7173)
+
+    with pytest.raises(AssertionError):
+        pltviz.gini(shares=np.full((2, 10), 10))
+
+    ax, lean_gini = pltviz.gini(shares=shares, backend="lean", axis=plt.subplots()[1])
+    assert lean_gini == gini
+    assert len(ax.lines) == 2
+
+
+def test_gini_coefficient():
+    assert pltviz.gini_coefficient([25, 25, 25, 25]) == pytest.approx(0)
+    assert pltviz.gini_coefficient([0, 0, 0, 1]) == pytest.approx(0.75)
+
+    rng = np.random.default_rng(42)
+    shares = rng.random(size=(5, 100))
+    shares /= shares.sum(axis=1, keepdims=True)
+
+    ginis = pltviz.gini_coefficient(shares)
+    assert ginis.shape == (5,)
+    assert ginis[0] == pltviz.gini_coefficient(np.sort(shares[0]))
+    assert ginis[0] == pytest.approx(pltviz.gini_coefficient(list(shares[0] * 100)))
+
+    with pytest.raises(AssertionError):
+        pltviz.gini_coefficient([1, 2, 3])
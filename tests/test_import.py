@@ -0,0 +1,54 @@
+"""
+Import Tests
+------------
+"""
+
+import os
+import subprocess
+import sys
+
+heavy_modules = ["colormath", "matplotlib", "pandas", "poli_sci_kit", "seaborn"]
+
+
+def imported_modules(statement):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, env=env, check=True
+    ).stdout
+
+    return set(output.decode().split())
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import pltviz; pltviz.gini_coefficient([1])")
+    assert "pltviz" in modules and "pltviz.legend" not in modules
+    assert not any(m.split(".")[0] in heavy_modules for m in modules)
+
+    modules = imported_modules("import pltviz; pltviz.utils.rgb_to_hex((1, 1, 1))")
+    assert not any(m.split(".")[0] in ["pandas", "seaborn"] for m in modules)
+
+    modules = imported_modules("import pltviz; pltviz.legend")
+    assert "pltviz.legend" in modules
+
+
+def test_lean_backend_imports():
+    modules = imported_modules(
+        "import matplotlib; matplotlib.use('Agg'); import pltviz; "
+        "pltviz.bar(counts=[1, 2], backend='lean'); "
+        "pltviz.bar(counts=[[1, 2], [3]], faction_labels=['a', 'b'], stacked=True, backend='lean'); "
+        "pltviz.gini(shares=[40, 60], backend='lean'); "
+        "pltviz.pie(counts=[1, 2]); pltviz.semipie(counts=[1, 2])"
+    )
+    assert not any(m.split(".")[0] in ["pandas", "seaborn"] for m in modules)
+
+
+def test_render_import_is_lazy():
+    modules = imported_modules("import pltviz")
+    assert "pltviz.rendering" not in modules
+
+    modules = imported_modules("import pltviz; pltviz.render")
+    assert "pltviz.rendering" in modules
+
+    modules = imported_modules("import pltviz; pltviz.arender")
+    assert "pltviz.service" in modules
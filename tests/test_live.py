@@ -0,0 +1,98 @@
+"""
+Live Plot Tests
+---------------
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pltviz
+import pytest
+from pltviz.live import LiveBar, LivePie, LiveSemipie
+
+
+def test_live_pie(allocations, parties):
+    new_allocations = allocations[::-1]
+    live = LivePie(
+        counts=allocations,
+        labels=parties,
+        display_labels=True,
+        display_counts=True,
+        axis=plt.subplots()[1],
+    )
+    assert live.update(new_allocations) == live.artists
+
+    fresh_ax = pltviz.pie(
+        counts=new_allocations,
+        labels=parties,
+        display_labels=True,
+        display_counts=True,
+        axis=plt.subplots()[1],
+    )
+    for wedge, fresh_wedge in zip(live.wedges, fresh_ax.patches):
+        assert wedge.theta1 == pytest.approx(fresh_wedge.theta1)
+        assert wedge.theta2 == pytest.approx(fresh_wedge.theta2)
+
+    for text, fresh_text in zip(live.texts, fresh_ax.texts):
+        assert text.get_text() == fresh_text.get_text()
+        assert text.get_position() == pytest.approx(fresh_text.get_position())
+        assert text.get_ha() == fresh_text.get_ha()
+
+    with pytest.raises(AssertionError):
+        live.update(allocations[:-1])
+
+    with pytest.raises(AssertionError):
+        LivePie(counts=[[1, 2], [3]])
+
+
+def test_live_semipie(allocations):
+    new_allocations = allocations[::-1]
+    live = LiveSemipie(counts=allocations, axis=plt.subplots()[1])
+    live.update(new_allocations)
+
+    fresh_ax = pltviz.semipie(counts=new_allocations, axis=plt.subplots()[1])
+    for path, fresh_path in zip(
+        live.collection.get_paths(), fresh_ax.collections[0].get_paths()
+    ):
+        assert np.allclose(path.vertices, fresh_path.vertices)
+
+
+def test_live_bar(allocations, parties):
+    new_allocations = allocations[::-1]
+    for horizontal in [False, True]:
+        for stacked in [False, True]:
+            live = LiveBar(
+                counts=allocations,
+                labels=parties,
+                horizontal=horizontal,
+                stacked=stacked,
+                label_bars=True,
+                axis=plt.subplots()[1],
+            )
+            live.update(new_allocations)
+
+            fresh_ax = pltviz.bar(
+                counts=new_allocations,
+                labels=parties,
+                horizontal=horizontal,
+                stacked=stacked,
+                label_bars=True,
+                backend="lean",
+                axis=plt.subplots()[1],
+            )
+            if stacked:
+                # The segments are a single collection.
+                assert len(live.bars) == 1
+                assert np.allclose(
+                    [p.vertices[:4] for p in live.bars[0].get_paths()],
+                    [p.vertices[:4] for p in fresh_ax.collections[0].get_paths()],
+                )
+            else:
+                assert [b.get_bbox().bounds for b in live.bars] == [
+                    p.get_bbox().bounds for p in fresh_ax.patches
+                ]
+            assert [t.get_text() for t in live.texts] == [
+                t.get_text() for t in fresh_ax.texts
+            ]
+            assert [t.get_position() for t in live.texts] == [
+                t.get_position() for t in fresh_ax.texts
+            ]
@@ -4,8 +4,11 @@
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pltviz
 import pytest
+from pltviz import utils
+from pltviz.pie import gradient_ring_mesh
 
 
 def test_pie(
@@ -101,3 +104,118 @@ def test_pie(
         label_font_size=20,
         axis=None,
     )
+
+    pltviz.pie(
+        counts=factioned_allocations,
+        labels=parties,
+        faction_labels=faction_labels,
+        colors=party_colors,
+        radius=1,
+        outer_ring_density=1000,
+        donut_ratio=1,
+        display_labels=True,
+        display_counts=True,
+        label_font_size=20,
+        mesh_outer_ring=True,
+        axis=None,
+    )
+
+    values = np.array([c for f in factioned_allocations for c in f])
+    offsets = np.cumsum([0] + [len(f) for f in factioned_allocations])
+    texts = None
+    for factioned_counts in [
+        factioned_allocations,
+        tuple(factioned_allocations),
+        utils.GroupedCounts(values, offsets),
+    ]:
+        ax = pltviz.pie(
+            counts=factioned_counts,
+            labels=parties,
+            faction_labels=faction_labels,
+            display_labels=True,
+            display_counts=True,
+            axis=plt.subplots()[1],
+        )
+        # Tuples of lists are factions, as lists of lists are.
+        ax_texts = [t.get_text() for t in ax.texts]
+        assert texts is None or ax_texts == texts
+        texts = ax_texts
+        plt.close("all")
+
+
+def test_gradient_ring_mesh():
+    values = np.array([10, 30, 60, 5])
+    offsets = np.array([0, 3, 4])
+    rgb_array = np.array(
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0.5, 0.5, 0.5]]
+    )
+    coordinates, vertex_colors = gradient_ring_mesh(
+        values=values,
+        offsets=offsets,
+        rgb_array=rgb_array,
+        outer_radius=1.2,
+        inner_radius=0.9,
+    )
+    num_points = coordinates.shape[1]
+    assert coordinates.shape == (2, num_points, 2)
+    assert vertex_colors.shape == (2 * num_points, 3)
+
+    # The outer chords cover the ring and inner and outer vertices share colors.
+    radii = np.linalg.norm(coordinates, axis=2)
+    assert np.allclose(radii[0], 0.9) and np.all(radii[1] > 1.2)
+    assert np.allclose(vertex_colors[:num_points], vertex_colors[num_points:])
+
+    # Factions start with their first group's color and end with their last's.
+    assert np.allclose(vertex_colors[0], rgb_array[0])
+    assert np.allclose(vertex_colors[-1], rgb_array[3])
+    assert np.any(np.all(np.isclose(vertex_colors, rgb_array[2]), axis=1))
+
+
+def test_pie_mesh_outer_ring(factioned_allocations, parties, faction_labels):
+    from matplotlib.collections import QuadMesh
+
+    meshes, num_texts = [], []
+    for outer_ring_density in [100, 10000]:
+        ax = pltviz.pie(
+            counts=factioned_allocations,
+            labels=parties,
+            faction_labels=faction_labels,
+            outer_ring_density=outer_ring_density,
+            mesh_outer_ring=True,
+            axis=plt.subplots()[1],
+        )
+        meshes.append([c for c in ax.collections if isinstance(c, QuadMesh)])
+        assert len(meshes[-1]) == 1
+        num_texts.append(len(ax.texts))
+        plt.close("all")
+
+    # The mesh and labels don't depend on outer_ring_density.
+    assert num_texts[0] == num_texts[1]
+    assert np.array_equal(
+        meshes[0][0].get_coordinates(), meshes[1][0].get_coordinates()
+    )
+
+
+def test_pie_rasterized(factioned_allocations, parties, faction_labels):
+    import io
+
+    ax = pltviz.pie(
+        counts=factioned_allocations,
+        labels=parties,
+        faction_labels=faction_labels,
+        display_labels=True,
+        rasterized=True,
+        axis=plt.subplots()[1],
+    )
+    assert all(p.get_rasterized() for p in ax.patches)
+    assert not any(t.get_rasterized() for t in ax.texts)
+
+    # The wedges are written as images, with the labels as vectors.
+    buffer = io.BytesIO()
+    with plt.rc_context({"svg.fonttype": "none"}):
+        ax.figure.savefig(buffer, format="svg", dpi=50)
+
+    svg = buffer.getvalue().decode()
+    assert "<image" in svg and svg.count("<image") < len(ax.patches)
+    assert faction_labels[0] in svg
+    plt.close("all")
@@ -0,0 +1,113 @@
+"""
+Profiling Tests
+---------------
+"""
+
+import threading
+
+import matplotlib.pyplot as plt
+import pltviz
+import pytest
+from pltviz import profiling
+
+
+def test_profile(allocations, factioned_allocations, parties, faction_labels):
+    received = []
+    with profiling.profile(callback=received.append) as records:
+        pltviz.pie(
+            counts=factioned_allocations,
+            labels=parties,
+            faction_labels=faction_labels,
+            axis=plt.subplots()[1],
+        )
+        pltviz.bar(counts=allocations, backend="lean", axis=plt.subplots()[1])
+        pltviz.semipie(counts=allocations, axis=plt.subplots()[1])
+        pltviz.gini(shares=[0.2, 0.3, 0.5], backend="lean", axis=plt.subplots()[1])
+
+    assert received == records
+    assert [r["function"] for r in records] == ["pie", "bar", "semipie", "gini"]
+    for record in records:
+        assert sum(record["phases"].values()) == pytest.approx(record["seconds"])
+
+    assert {"palette", "allocation", "artists"} <= set(records[0]["phases"])
+    assert "layout" in records[2]["phases"]
+    # Labels are timed in one phase after the artists.
+    bar_phases = list(records[1]["phases"])
+    assert bar_phases[bar_phases.index("figure") :] == [
+        "figure",
+        "artists",
+        "labels",
+        "other",
+    ]
+
+    summary = profiling.summarize(records + records[:1])
+    assert summary["pie"]["calls"] == 2
+    assert "pltviz.bar" in profiling.format_record(records[1])
+
+    # Calls outside of the context aren't recorded.
+    pltviz.semipie(counts=allocations, axis=plt.subplots()[1])
+    assert len(records) == 4
+    plt.close("all")
+
+
+def test_profile_nested_calls(allocations):
+    # The recursive call of comp_line for a group column adds to the same record.
+    import pandas as pd
+
+    df = pd.DataFrame(
+        {"group": ["a", "a", "b", "b"], "year": [1, 2, 1, 2], "value": [3, 4, 5, 6]}
+    )
+    with profiling.profile() as records:
+        pltviz.comp_line(
+            df=df,
+            dependent_cols="value",
+            indep_stats="year",
+            group_col="group",
+            backend="lean",
+            axis=plt.subplots()[1],
+        )
+
+    assert len(records) == 1 and "pivot" in records[0]["phases"]
+    plt.close("all")
+
+
+def test_add_callback(allocations):
+    received = []
+    profiling.add_callback(received.append)
+    try:
+        with profiling.profile() as records:
+            # Threads don't run in the context, so their calls aren't recorded.
+            thread = threading.Thread(
+                target=pltviz.semipie,
+                kwargs={"counts": allocations, "axis": plt.subplots()[1]},
+            )
+            thread.start()
+            thread.join()
+            pltviz.semipie(counts=allocations, axis=plt.subplots()[1])
+
+    finally:
+        profiling.remove_callback(received.append)
+
+    assert len(records) == 1 and received == records
+    plt.close("all")
+
+
+def test_failing_callback(allocations):
+    def fail(record):
+        raise ValueError("metrics system unavailable")
+
+    profiling.add_callback(fail)
+    try:
+        with profiling.profile(callback=fail) as records:
+            with pytest.warns(RuntimeWarning, match="metrics system unavailable"):
+                ax = pltviz.semipie(counts=allocations, axis=plt.subplots()[1])
+
+            # The plot's own errors aren't masked by those of callbacks.
+            with pytest.warns(RuntimeWarning), pytest.raises(AssertionError):
+                pltviz.semipie(counts=allocations, colors=["#ffffff"])
+
+    finally:
+        profiling.remove_callback(fail)
+
+    assert ax.collections and len(records) == 2
+    plt.close("all")
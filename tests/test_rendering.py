@@ -0,0 +1,60 @@
+"""
+Rendering Tests
+---------------
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pltviz
+import pytest
+from pltviz import rendering
+
+
+def test_render(allocations, parties):
+    num_figures = len(plt.get_fignums())
+
+    png = pltviz.render("semipie", counts=allocations)
+    assert isinstance(png, bytes) and png.startswith(b"\x89PNG")
+
+    svg = pltviz.render("pie", format="svg", counts=allocations, labels=parties)
+    assert svg.lstrip().startswith(b"<?xml")
+
+    rgba = pltviz.render(
+        "bar", format="rgba", figsize=(4, 3), dpi=50, counts=allocations
+    )
+    assert rgba.shape == (150, 200, 4) and rgba.dtype == np.uint8
+    assert (rgba[..., 3] == 255).all()
+
+    # Nothing is added to pyplot's figure registry.
+    assert len(plt.get_fignums()) == num_figures
+
+    with pytest.raises(AssertionError):
+        pltviz.render("pie", counts=allocations, axis=plt.gca())
+
+
+def test_render_memoryview(allocations):
+    png = pltviz.render("pie", counts=allocations)
+    with pltviz.render("pie", output="memoryview", counts=allocations) as view:
+        assert view.tobytes() == png
+
+        # A held view of the buffer leads to a new buffer for the next chart.
+        assert pltviz.render("semipie", counts=allocations) != png
+        assert view.tobytes() == png
+
+    buffer = rendering._local.buffer
+    pltviz.render("pie", counts=allocations)
+    assert rendering._local.buffer is buffer
+
+
+def test_render_threads(allocations):
+    expected = pltviz.render("semipie", counts=allocations)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda _: pltviz.render("semipie", counts=allocations), range(8)
+            )
+        )
+
+    assert all(r == expected for r in results)
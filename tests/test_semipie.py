@@ -4,6 +4,7 @@
 """
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pltviz
 
 
@@ -14,3 +15,5 @@ def test_semipie(
     pltviz.semipie(counts=allocations, colors=None)
 
     pltviz.semipie(counts=allocations, colors=party_colors)
+
+    pltviz.semipie(counts=np.array(allocations), colors=party_colors)
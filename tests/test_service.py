@@ -0,0 +1,134 @@
+"""
+Rendering Service Tests
+-----------------------
+"""
+
+import asyncio
+import os
+import signal
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pltviz
+import pytest
+from pltviz import service as service_module
+from pltviz.service import RenderService, arender
+
+
+def test_render_service(allocations):
+    async def main():
+        async with RenderService(max_workers=2, max_pending=2) as service:
+            max_pending = 0
+
+            async def watch():
+                nonlocal max_pending
+                while True:
+                    max_pending = max(max_pending, service.pending)
+                    await asyncio.sleep(0)
+
+            watcher = asyncio.ensure_future(watch())
+            charts = await asyncio.gather(
+                *[service.render("semipie", counts=allocations) for _ in range(6)]
+            )
+            watcher.cancel()
+
+            rgba = await service.render("pie", format="rgba", counts=allocations)
+
+            with pytest.raises(AssertionError):
+                await service.render("scatter", counts=allocations)
+
+        return charts, rgba, max_pending
+
+    charts, rgba, max_pending = asyncio.run(main())
+    assert all(c == pltviz.render("semipie", counts=allocations) for c in charts)
+    assert isinstance(rgba, np.ndarray) and rgba.shape[2] == 4
+    assert 1 <= max_pending <= 2
+
+
+def test_render_service_timeout_and_cancel(allocations):
+    counts = list(range(1, 5001))
+
+    async def main():
+        async with RenderService(max_workers=1, max_pending=1) as service:
+            with pytest.raises(asyncio.TimeoutError):
+                await service.render("pie", timeout=0.01, counts=counts)
+
+            # The slot is held until the worker is done with the timed out chart.
+            assert service.pending == 1
+
+            task = asyncio.ensure_future(service.render("pie", counts=counts))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            chart = await service.render("semipie", timeout=60, counts=allocations)
+            assert service.pending <= 1
+
+        return chart
+
+    assert asyncio.run(main()).startswith(b"\x89PNG")
+
+
+def test_arender(allocations):
+    chart = asyncio.run(arender("semipie", format="svg", counts=allocations))
+    assert chart.lstrip().startswith(b"<?xml")
+
+
+def test_render_service_cancel_submitted(allocations):
+    counts = list(range(1, 2001))
+
+    async def main():
+        async with RenderService(max_workers=1, max_pending=4) as service:
+            futures = []
+            submit = service._executor.submit
+
+            def record_submit(*args, **kwargs):
+                futures.append(submit(*args, **kwargs))
+                return futures[-1]
+
+            service._executor.submit = record_submit
+
+            # The worker is busy with one chart and its call queue holds two, so the fourth waits in the pool.
+            busy = [
+                asyncio.ensure_future(service.render("pie", counts=counts))
+                for _ in range(3)
+            ]
+            task = asyncio.ensure_future(service.render("pie", counts=counts))
+            while len(futures) < 4:
+                await asyncio.sleep(0.01)
+
+            assert service.pending == 4
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            await asyncio.sleep(0.01)
+            assert futures[3].cancelled()
+            assert service.pending == 3
+
+            await asyncio.gather(*busy)
+            assert service.pending == 0
+
+    asyncio.run(main())
+
+
+def test_render_service_restarts_broken_pool(allocations):
+    async def main():
+        async with RenderService(max_workers=1) as service:
+            loop = asyncio.get_running_loop()
+            pid = await loop.run_in_executor(service._executor, service_module._ping)
+            os.kill(pid, signal.SIGKILL)
+            await asyncio.sleep(0.5)
+
+            # Charts that were in the broken pool fail, and later ones go to a new pool.
+            try:
+                chart = await service.render("semipie", counts=allocations)
+
+            except BrokenProcessPool:
+                chart = await service.render("semipie", counts=allocations)
+
+            assert chart.startswith(b"\x89PNG")
+            assert service.restarts == 1 and service.pending == 0
+
+    asyncio.run(main())
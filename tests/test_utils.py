@@ -3,8 +3,13 @@
 -----------
 """
 
-from colormath.color_objects import sRGBColor
+import numpy as np
+import pandas as pd
+import pytest
+from colormath.color_conversions import convert_color
+from colormath.color_objects import HSLColor, HSVColor, LabColor, sRGBColor
 from pltviz import utils
+from poli_sci_kit.appointment.methods import highest_averages
 
 
 def test_round_if_int():
@@ -14,6 +19,29 @@ def test_round_if_int():
 def test_add_num_commas():
     assert utils.add_num_commas(1234) == "1,234"
     assert utils.add_num_commas(1234.5) == "1,234.5"
+    assert utils.add_num_commas(-123456) == "-123,456"
+
+
+def test_format_numbers():
+    assert utils.format_numbers([1234, -5]) == ["1234", "-5"]
+    assert utils.format_numbers([1234567.0, 2.5, -1000.0], commas=True) == [
+        "1,234,567",
+        "2.5",
+        "-1,000",
+    ]
+    assert utils.format_numbers(np.array([1 / 3, 2.0]), decimals=2) == ["0.33", "2.00"]
+    assert utils.format_numbers([0.25, 0.125], percent=True) == ["25%", "12.5%"]
+    assert utils.format_numbers([0.1234], decimals=1, percent=True) == ["12.3%"]
+    assert utils.format_numbers([np.nan, 3.0]) == ["nan", "3"]
+    assert utils.format_numbers([]) == []
+
+    # Float32 values aren't upcast into noisier labels.
+    float32_values = np.array([1.1, 2.0, -1234.5], dtype=np.float32)
+    assert utils.format_numbers(float32_values) == ["1.1", "2", "-1234.5"]
+    assert utils.format_numbers(float32_values, commas=True) == ["1.1", "2", "-1,234.5"]
+
+    values = [0, 1.5, 2.0, 123456.0, -7.25]
+    assert utils.format_numbers(values) == [str(utils.round_if_int(v)) for v in values]
 
 
 def test_gen_list_of_lists():
@@ -58,3 +86,244 @@ def test_gen_random_colors(white_black_hexes):
         len(utils.gen_random_colors(num_groups=num_groups, colors=white_black_hexes))
         == num_groups
     )
+
+
+def test_hex_to_rgb_array(party_colors):
+    rgb_array = utils.hex_to_rgb_array(party_colors)
+    assert rgb_array.shape == (len(party_colors), 3)
+    assert [tuple(c) for c in rgb_array] == [
+        utils.hex_to_rgb(c).get_value_tuple() for c in party_colors
+    ]
+
+
+def test_rgb_array_to_hex(party_colors):
+    assert utils.rgb_array_to_hex([(1.0, 1.0, 1.0)]) == ["#ffffff"]
+    assert utils.rgb_array_to_hex([(255, 255, 255)]) == ["#ffffff"]
+    assert utils.rgb_array_to_hex(utils.hex_to_rgb_array(party_colors)) == party_colors
+
+
+def test_scale_saturation_array():
+    rgb_array = np.random.default_rng(42).random((1000, 3))
+    rgb_array[:3] = [(1, 1, 1), (0, 0, 0), (0.5, 0.5, 0.5)]  # grays
+    assert np.array_equal(
+        utils.scale_saturation_array(rgb_array=rgb_array, sat=0.95),
+        [utils.scale_saturation(tuple(c), 0.95) for c in rgb_array],
+    )
+
+
+def test_create_color_palette_parity(party_colors):
+    for colorspace in [sRGBColor, LabColor, HSVColor, HSLColor]:
+        for start_hex, end_hex in zip(party_colors[:-1], party_colors[1:]):
+            start_rgb = utils.hex_to_rgb(start_hex)
+            end_rgb = utils.hex_to_rgb(end_hex)
+            start_tuple = convert_color(start_rgb, colorspace).get_value_tuple()
+            end_tuple = convert_color(end_rgb, colorspace).get_value_tuple()
+            colormath_palette = [
+                convert_color(colorspace(*point), sRGBColor).get_rgb_hex()
+                for point in zip(
+                    *[
+                        np.linspace(start_tuple[i], end_tuple[i], num=7)
+                        for i in range(3)
+                    ]
+                )
+            ]
+
+            assert (
+                utils.create_color_palette(
+                    start_rgb=start_hex,
+                    end_rgb=end_hex,
+                    num_colors=7,
+                    colorspace=colorspace,
+                )
+                == colormath_palette
+            )
+
+
+def test_normalize_counts(allocations, factioned_allocations):
+    values, offsets = utils.normalize_counts(allocations)
+    assert values.dtype == np.float64
+    assert values.tolist() == allocations
+    assert offsets is None
+
+    for flat_counts in [np.array(allocations), pd.Series(allocations)]:
+        values, offsets = utils.normalize_counts(flat_counts)
+        assert values.tolist() == allocations
+        assert offsets is None
+
+    values, offsets = utils.normalize_counts(factioned_allocations)
+    assert values.tolist() == [c for f in factioned_allocations for c in f]
+    assert offsets.tolist() == [0, 4, 6]
+
+    ragged_values, ragged_offsets = utils.normalize_counts(
+        utils.GroupedCounts(values, offsets)
+    )
+    assert ragged_values.tolist() == values.tolist()
+    assert ragged_offsets.tolist() == [0, 4, 6]
+
+    values, offsets = utils.normalize_counts(np.arange(6).reshape(2, 3))
+    assert values.tolist() == list(range(6))
+    assert offsets.tolist() == [0, 3, 6]
+
+    # Plain tuples of sequences are factions, even if they could be read as offsets.
+    values, offsets = utils.normalize_counts(([1, 2, 3], [0, 3]))
+    assert values.tolist() == [1, 2, 3, 0, 3]
+    assert offsets.tolist() == [0, 3, 5]
+
+    with pytest.raises(AssertionError):
+        utils.normalize_counts(utils.GroupedCounts(values, [0, 2]))
+
+
+def test_sum_groups():
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+    assert utils.sum_groups(values=values, offsets=np.array([0, 1, 4])).tolist() == [
+        1,
+        9,
+    ]
+    assert utils.sum_groups(
+        values=values, offsets=np.array([0, 0, 2, 4, 4])
+    ).tolist() == [0, 3, 7, 0]
+    assert utils.sum_groups(values=values[:0], offsets=np.array([0, 0])).tolist() == [0]
+
+
+def test_allocate_sections():
+    rng = np.random.default_rng(42)
+    for _ in range(50):
+        shares = rng.choice(np.arange(1, 1000), size=rng.integers(1, 10), replace=False)
+        total_alloc = int(rng.integers(1, 200))
+        assert utils.allocate_sections(
+            shares=shares, total_alloc=total_alloc
+        ) == highest_averages(shares=shares.tolist(), total_alloc=total_alloc)
+
+
+def test_allocate_gradient_sections():
+    assert utils.allocate_gradient_sections(shares=[5], total_alloc=10) == [10]
+
+    rng = np.random.default_rng(42)
+    for _ in range(50):
+        shares = rng.choice(
+            np.arange(1, 1000), size=rng.integers(2, 10), replace=False
+        ).tolist()
+        total_alloc = int(rng.integers(1, 200))
+
+        # Average the allocations with each group removed by position.
+        one_removed_allocations = [
+            highest_averages(
+                shares=shares[:i] + shares[i + 1 :], total_alloc=total_alloc
+            )
+            for i in range(len(shares))
+        ]
+        averaged_allocations = [
+            round(sum(a[i] for a in one_removed_allocations) / len(shares))
+            for i in range(len(shares) - 1)
+        ]
+
+        allocations = utils.allocate_gradient_sections(
+            shares=shares, total_alloc=total_alloc
+        )
+        assert sum(allocations) == total_alloc
+        assert min(allocations) >= 0
+        averaged_allocations[0] += total_alloc - sum(averaged_allocations)
+        if averaged_allocations[0] >= 0:
+            assert allocations == averaged_allocations
+
+
+def test_gradient_shares():
+    assert np.allclose(utils.gradient_shares(shares=[5]), [1])
+
+    shares = [3, 10, 1, 7, 20]
+    gradient_shares = utils.gradient_shares(shares=shares)
+    assert np.isclose(gradient_shares.sum(), 1)
+
+    # Gradient shares are the limit of gradient section allocations.
+    allocations = utils.allocate_gradient_sections(shares=shares, total_alloc=100000)
+    assert np.allclose(100000 * gradient_shares, allocations, atol=1)
+
+
+def test_default_colors():
+    import seaborn as sns
+
+    # Plots have the colors that seaborn's "deep" palette gave with desat=1.
+    assert utils.default_colors() == [
+        "#4c71b0",
+        "#dc8452",
+        "#55a868",
+        "#c44e51",
+        "#8171b3",
+        "#937860",
+        "#da8ac3",
+        "#8c8c8c",
+        "#ccb873",
+        "#63b4cd",
+    ]
+    assert utils.default_colors() == [
+        utils.rgb_to_hex(c) for c in sns.color_palette("deep", desat=1)
+    ]
+    assert utils.default_colors(palette=utils.deep_palette) == [
+        utils.rgb_to_hex(c) for c in sns.color_palette("deep")
+    ]
+
+    assert utils.default_colors(num_colors=12)[10:] == utils.default_palette[:2]
+
+
+def test_desaturated_colors(party_colors):
+    utils.clear_palette_cache()
+    expected = utils.scale_saturation_array(
+        rgb_array=utils.hex_to_rgb_array(party_colors), sat=0.95
+    )
+
+    rgb_array = utils.desaturated_colors(colors=party_colors, dsat=0.95)
+    assert (rgb_array == expected).all()
+    assert utils.desaturated_colors(colors=party_colors, dsat=0.95) is rgb_array
+    assert not rgb_array.flags.writeable
+
+    hexes = utils.desaturated_colors(colors=party_colors, dsat=0.95, as_hex=True)
+    assert hexes == utils.rgb_array_to_hex(expected)
+
+    default_hexes = utils.desaturated_colors(num_colors=12, as_hex=True)
+    assert len(default_hexes) == 12 and default_hexes[10] == default_hexes[0]
+
+    cache_info = utils.palette_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 3)
+
+    utils.clear_palette_cache()
+    assert utils.palette_cache_info().currsize == 0
+
+    utils.set_palette_cache_size(1)
+    try:
+        utils.desaturated_colors(colors=party_colors, dsat=0.95)
+        utils.desaturated_colors(colors=party_colors, dsat=0.9)
+        cache_info = utils.palette_cache_info()
+        assert (cache_info.maxsize, cache_info.currsize) == (1, 1)
+
+    finally:
+        utils.set_palette_cache_size(1024)
+
+
+def test_rasterize_artists(allocations):
+    import matplotlib.pyplot as plt
+    import pltviz
+
+    ax = plt.subplots()[1]
+    ax.plot([0, 1], [0, 1])
+    assert utils.count_artists(ax) == (0, 0, 1)
+
+    pltviz.bar(
+        counts=allocations,
+        label_bars=True,
+        backend="lean",
+        rasterized=True,
+        axis=ax,
+    )
+    # Only the bars that were added are rasterized.
+    assert not ax.lines[0].get_rasterized()
+    assert all(p.get_rasterized() for p in ax.patches)
+    assert not any(t.get_rasterized() for t in ax.texts)
+
+    ax = pltviz.semipie(counts=allocations, rasterized=True, axis=plt.subplots()[1])
+    assert ax.collections[0].get_rasterized()
+
+    ax = pltviz.gini(
+        shares=[0.2, 0.3, 0.5], backend="lean", rasterized=True, axis=plt.subplots()[1]
+    )[0]
+    assert all(a.get_rasterized() for a in ax.lines + ax.collections)
+    plt.close("all")